@@ -4,6 +4,8 @@ Logger& logger = Logger::getInstance();
 
 FilterFactory::FilterFactory(string logsFileName) :logger(Logger::getInstance()) {
 	isFinish = false;
+	cancelled = false;
+	filteredCount = 0;
 	chain = logReader = make_shared<LogReader>(logsFileName);
 }
 
@@ -90,23 +92,40 @@ void FilterFactory::reset() {
  * @brief Start processing logs by applying the filters asynchronously.
  */
 void FilterFactory::startLogs() {
-	reset();
-	isFinish = false;
 	if (filterThread.joinable()) {
 		filterThread.join();
 	}
+	reset();
+	filteredCount = 0;
+	if (cancelled) {
+		// A cancel made before the start stops this process too
+		{
+			std::lock_guard<std::mutex> lock(logMutex);
+			isFinish = true;
+		}
+		logCondition.notify_all();
+		return;
+	}
+	isFinish = false;
 	try {
 		filterThread = std::thread([this]() {
 			for (auto log : chain->getNext()) {
+				if (cancelled)
+					break;
 				if (log.timeStamp > 0 && log.timeStamp < 3025236764272) {
 					{
 						std::lock_guard<std::mutex> lock(logMutex);
 						filteredLogs.push(log);
+						filteredCount++;
 					}
 					logCondition.notify_one();
 				}
 			}
-			isFinish = true;
+			{
+				std::lock_guard<std::mutex> lock(logMutex);
+				isFinish = true;
+			}
+			logCondition.notify_all();
 			});
 	}
 	catch (...) {
@@ -128,6 +147,34 @@ void FilterFactory::joinThread() {
 	logger.logMessageToFile("FilterFactory::joinThread - Function execution finished.");
 }
 
+void FilterFactory::cancel() {
+	logger.logMessageToFile("FilterFactory::cancel - Entering.");
+	{
+		std::lock_guard<std::mutex> lock(logMutex);
+		cancelled = true;
+		logReader->stop();
+		std::queue<Log> emptyQueue;
+		std::swap(filteredLogs, emptyQueue);
+	}
+	logCondition.notify_all();
+}
+
+bool FilterFactory::isCancelled() {
+	return cancelled;
+}
+
+size_t FilterFactory::getBytesRead() {
+	return logReader->getBytesRead();
+}
+
+size_t FilterFactory::getFileSize() {
+	return logReader->getFileSize();
+}
+
+size_t FilterFactory::getFilteredCount() {
+	return filteredCount;
+}
+
 Log FilterFactory::getLog() {
 	std::lock_guard<std::mutex> lock(logMutex);
 	if (!filteredLogs.empty()) {
@@ -138,6 +185,42 @@ Log FilterFactory::getLog() {
 	throw runtime_error("FilterFactory::getLog - No logs available.");
 }
 
+/**
+ * @brief Get up to maxCount filtered logs under a single lock.
+ * @param maxCount The maximum number of logs to take from the queue.
+ * @return The drained logs in the order they were filtered, empty if none are available.
+ */
+vector<Log> FilterFactory::getLogs(size_t maxCount) {
+	vector<Log> logs;
+	std::lock_guard<std::mutex> lock(logMutex);
+	logs.reserve(min(maxCount, filteredLogs.size()));
+	while (!filteredLogs.empty() && logs.size() < maxCount) {
+		logs.push_back(std::move(filteredLogs.front()));
+		filteredLogs.pop();
+	}
+	return logs;
+}
+
+/**
+ * @brief Block until filtered logs are available and take up to maxCount of them.
+ * @param maxCount The maximum number of logs to take from the queue.
+ * @return The drained logs, empty only once the process has finished and the queue is drained,
+ *         or once the process was cancelled.
+ */
+vector<Log> FilterFactory::waitForLogs(size_t maxCount) {
+	vector<Log> logs;
+	std::unique_lock<std::mutex> lock(logMutex);
+	logCondition.wait(lock, [this] { return !filteredLogs.empty() || isFinish || cancelled; });
+	if (cancelled)
+		return logs;
+	logs.reserve(min(maxCount, filteredLogs.size()));
+	while (!filteredLogs.empty() && logs.size() < maxCount) {
+		logs.push_back(std::move(filteredLogs.front()));
+		filteredLogs.pop();
+	}
+	return logs;
+}
+
 bool FilterFactory::hasLog() {
 	std::lock_guard<std::mutex> lock(logMutex);
 	return !filteredLogs.empty();
@@ -262,8 +345,54 @@ PYBIND11_MODULE(filter_factory_module, m) {
 		.value("Unit", FilterType::Unit, "Filter based on unit identifier.")
 		.value("Area", FilterType::Area, "Filter based on area identifier.");
 
+	py::class_<LogBatchStream>(m, "LogBatchStream")
+		.def("__iter__", [](LogBatchStream& self) -> LogBatchStream& {
+		return self;
+			})
+		.def("__next__", [](LogBatchStream& self) {
+		vector<Log> batch;
+		{
+			py::gil_scoped_release release;
+			batch = self.next();
+		}
+		if (batch.empty())
+			throw py::stop_iteration();
+		return batch;
+			}, "Sleep until the next batch of filtered logs is ready and return it.");
+
+	PYBIND11_NUMPY_DTYPE_EX(LogRecord, timeStamp, "timestamp", chip, "chip", die, "die", quad, "quad", row, "row", col, "col",
+		area, "area", unit, "unit", io, "io", tid, "tid", packetOffset, "packet_offset", packetLength, "packet_length");
+
+	py::class_<LogColumns>(m, "LogColumns")
+		.def("__len__", &LogColumns::size)
+		.def_property_readonly("rows", [](py::object self) {
+		LogColumns& columns = self.cast<LogColumns&>();
+		// The array shares the records and keeps the batch alive
+		return py::array_t<LogRecord>(columns.records.size(), columns.records.data(), self);
+			}, "The records of the batch as a NumPy structured array, without copying them.")
+		.def_property_readonly("packets", [](py::object self) {
+		LogColumns& columns = self.cast<LogColumns&>();
+		return py::array_t<uint8_t>(columns.packets.size(), reinterpret_cast<const uint8_t*>(columns.packets.data()), self);
+			}, "The packets of the batch back to back as a NumPy byte array, without copying them.")
+		.def_readonly("dictionaries", &LogColumns::dictionaries, "The strings of each encoded column, indexed by their codes in the records.");
+
+	py::class_<LogColumnsStream>(m, "LogColumnsStream")
+		.def("__iter__", [](LogColumnsStream& self) -> LogColumnsStream& {
+		return self;
+			})
+		.def("__next__", [](LogColumnsStream& self) {
+		LogColumns columns;
+		{
+			py::gil_scoped_release release;
+			columns = self.next();
+		}
+		if (columns.size() == 0)
+			throw py::stop_iteration();
+		return columns;
+			}, "Sleep until the next batch of filtered logs is ready and return it as LogColumns.");
+
 	py::class_<FilterFactory>(m, "FilterFactory")
-		.def(py::init<std::string>(), py::arg("logsFileName"), "Initialize FilterFactory with the given log file name.")
+		.def(py::init<std::string>(), py::arg("logsFileName"), py::call_guard<py::gil_scoped_release>(), "Initialize FilterFactory with the given log file name.")
 		.def("add_filter_to_chain", [](FilterFactory& self, std::pair<FilterType, Variant> filter) {
 		self.addFilterToChain(filter);
 			}, py::arg("filter"), "Add a new filter to the chain. The filter is a pair of FilterType and Variant.")
@@ -293,11 +422,30 @@ PYBIND11_MODULE(filter_factory_module, m) {
 		self.removeFilter(filterType);
 			}, py::arg("filterToRemove"), "Remove a specific filter from the chain using a string.")
 		.def("clear_filters", &FilterFactory::clearFilters, "Clear all filters and reset the filter chain to the initial state.")
-		.def("start_logs", &FilterFactory::startLogs, "Apply filters and generate the filtered logs asynchronously.")
-		.def("get_log", &FilterFactory::getLog, "Get the next filtered log.")
-		.def("has_log", &FilterFactory::hasLog, "Check if there are more filtered logs.")
-		.def("is_finished_process", &FilterFactory::isFinishProcess, "Check if the process has finished")
-		.def("join_thread", &FilterFactory::joinThread, "Join the logs thread after filtering has completed.");
+		.def("start_logs", &FilterFactory::startLogs, py::call_guard<py::gil_scoped_release>(), "Apply filters and generate the filtered logs asynchronously.")
+		.def("get_log", &FilterFactory::getLog, py::call_guard<py::gil_scoped_release>(), "Get the next filtered log.")
+		.def("get_logs", &FilterFactory::getLogs, py::arg("max_n"), py::call_guard<py::gil_scoped_release>(), "Get up to max_n filtered logs in a single call.")
+		.def("wait_for_logs", &FilterFactory::waitForLogs, py::arg("max_n"), py::call_guard<py::gil_scoped_release>(),
+			"Block without holding the GIL until filtered logs are ready and get up to max_n of them. Empty once the process has finished.")
+		.def("stream", [](FilterFactory& self, size_t batchSize) {
+		return LogBatchStream(self, batchSize);
+			}, py::arg("batch_size") = 10000, py::keep_alive<0, 1>(),
+			"Iterate over the filtered logs of the running process in batches, sleeping between batches. Call start_logs first.")
+		.def("stream_columns", [](FilterFactory& self, size_t batchSize) {
+		return LogColumnsStream(self, batchSize);
+			}, py::arg("batch_size") = 10000, py::keep_alive<0, 1>(),
+			"Like stream, with each batch as LogColumns: NumPy arrays over C++ storage instead of a Log object per log.")
+		.def("has_log", &FilterFactory::hasLog, py::call_guard<py::gil_scoped_release>(), "Check if there are more filtered logs.")
+		.def("is_finished_process", &FilterFactory::isFinishProcess, py::call_guard<py::gil_scoped_release>(), "Check if the process has finished")
+		.def("join_thread", &FilterFactory::joinThread, py::call_guard<py::gil_scoped_release>(), "Join the logs thread after filtering has completed.")
+		.def("cancel", &FilterFactory::cancel, py::call_guard<py::gil_scoped_release>(),
+			"Stop the running process. Its thread stops at the next log and a waiting stream ends. Safe to call from any thread.")
+		.def("is_cancelled", &FilterFactory::isCancelled, "Check if the running process was cancelled.")
+		.def("get_bytes_read", &FilterFactory::getBytesRead,
+			"Get the offset in the logs file up to which the running process has read. Safe to call while it runs.")
+		.def("get_file_size", &FilterFactory::getFileSize, "Get the size of the logs file in bytes.")
+		.def("get_filtered_count", &FilterFactory::getFilteredCount,
+			"Get the number of logs the running process has queued so far. Safe to call while it runs.");
 }
 
 #endif
@@ -2,6 +2,7 @@
 #ifdef USE_PYBIND
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <pybind11/numpy.h>
 #endif
 #include <queue>
 #include <thread>
@@ -9,12 +10,14 @@
 #include <chrono>
 #include <iostream>
 #include <memory>
+#include <atomic>
 #include <stdexcept>
 #include <condition_variable>
 #include "../Utilities/Config.hpp"
 #include "../Filters/Filters.hpp"
 #include "../Utilities/Logger.hpp"
 #include "../Utilities/CustomExceptions.hpp"
+#include "../Models/LogColumns.hpp"
 
 using namespace std;
 using namespace Config;
@@ -46,6 +49,7 @@ public:
 
 	/**
 	 * @brief Start processing logs by applying the filters asynchronously.
+	 * A cancelled factory does not start again: the process finishes at once without logs.
 	 */
 	void startLogs();
 
@@ -54,6 +58,26 @@ public:
 	 */
 	void joinThread();
 
+	/**
+	 * @brief Stop the running process and every later one. The producer thread stops at the next line it reads,
+	 * and waiting readers wake up with no logs. A new process needs a new factory.
+	 */
+	void cancel();
+
+	bool isCancelled();
+
+	/**
+	 * @brief Offset in the logs file up to which the running process has read, for progress reporting.
+	 */
+	size_t getBytesRead();
+
+	size_t getFileSize();
+
+	/**
+	 * @brief Number of logs the running process has queued so far, taken or not.
+	 */
+	size_t getFilteredCount();
+
 	/**
 	 * @brief Get the next filtered log.
 	 * @return A generator yielding filtered logs.
@@ -62,6 +86,21 @@ public:
 
 	Log getLog();
 
+	/**
+	 * @brief Get up to maxCount filtered logs under a single lock.
+	 * @param maxCount The maximum number of logs to take from the queue.
+	 * @return The drained logs in the order they were filtered, empty if none are available.
+	 */
+	vector<Log> getLogs(size_t maxCount);
+
+	/**
+	 * @brief Block until filtered logs are available and take up to maxCount of them.
+	 * @param maxCount The maximum number of logs to take from the queue.
+	 * @return The drained logs, empty only once the process has finished and the queue is drained,
+	 *         or once the process was cancelled.
+	 */
+	vector<Log> waitForLogs(size_t maxCount);
+
 	bool hasLog();
 
 	/**
@@ -82,7 +121,9 @@ private:
 	IViewPtr chain;									
 	shared_ptr<LogReader> logReader;			
 	LogsFactory logsFactory;					
-	bool isFinish;								
+	std::atomic<bool> isFinish;					
+	std::atomic<bool> cancelled;
+	std::atomic<size_t> filteredCount;
 
 	std::queue<Log> filteredLogs;				
 	std::thread filterThread;					
@@ -96,3 +137,45 @@ private:
 
 	void reset();
 };
+
+/**
+ * @class LogBatchStream
+ * @brief Iterates over the logs of a running FilterFactory in batches, sleeping until each batch is ready.
+ */
+class LogBatchStream {
+public:
+	LogBatchStream(FilterFactory& factory, size_t batchSize) : factory(factory), batchSize(batchSize) {}
+
+	/**
+	 * @brief Get the next batch of filtered logs.
+	 * @return Up to batchSize logs, empty once the process has finished and every log was taken or was cancelled.
+	 */
+	vector<Log> next() {
+		return factory.waitForLogs(batchSize);
+	}
+
+private:
+	FilterFactory& factory;
+	size_t batchSize;
+};
+
+/**
+ * @class LogColumnsStream
+ * @brief Iterates over the logs of a running FilterFactory in batches of LogColumns, sleeping until each batch is ready.
+ */
+class LogColumnsStream {
+public:
+	LogColumnsStream(FilterFactory& factory, size_t batchSize) : factory(factory), batchSize(batchSize) {}
+
+	/**
+	 * @brief Get the next batch of filtered logs in contiguous storage.
+	 * @return Up to batchSize logs, empty once the process has finished and every log was taken or was cancelled.
+	 */
+	LogColumns next() {
+		return LogColumns(factory.waitForLogs(batchSize));
+	}
+
+private:
+	FilterFactory& factory;
+	size_t batchSize;
+};
@@ -0,0 +1,191 @@
+#include "LogIndex.hpp"
+#include <algorithm>
+#include <charconv>
+
+namespace {
+	constexpr char INDEX_MAGIC[8] = { 'L', 'O', 'G', 'I', 'D', 'X', '1', '\0' };
+
+	/**
+	 * @brief Fixed-size header of the sidecar file, followed by entriesCount LogIndexEntry records.
+	 */
+	struct LogIndexHeader {
+		char magic[8];
+		uint64_t fileSize;
+		int64_t modifiedTime;
+		uint64_t stride;
+		uint64_t recordsCount;
+		int64_t firstTime;
+		int64_t lastTime;
+		uint64_t entriesCount;
+	};
+}
+
+LogIndex::LogIndex(const string& logsPath, size_t stride)
+	: logsPath(logsPath), stride(max<size_t>(stride, 1)), logger(Logger::getInstance()) {
+	clear();
+}
+
+void LogIndex::setPath(const string& path) {
+	logsPath = path;
+	clear();
+}
+
+string LogIndex::sidecarPath(const string& logsPath) {
+	return logsPath + ".idx";
+}
+
+bool LogIndex::refresh() {
+	error_code error;
+	uint64_t currentSize = filesystem::file_size(logsPath, error);
+	if (error) {
+		clear();
+		return false;
+	}
+	int64_t currentModifiedTime = filesystem::last_write_time(logsPath, error).time_since_epoch().count();
+	if (error) {
+		clear();
+		return false;
+	}
+
+	if (isBuilt && currentSize == fileSize && currentModifiedTime == modifiedTime)
+		return true;
+
+	fileSize = currentSize;
+	modifiedTime = currentModifiedTime;
+	if (!loadSidecar()) {
+		build();
+		saveSidecar();
+	}
+	isBuilt = true;
+	return true;
+}
+
+streampos LogIndex::seek(time_t targetTimestamp) const {
+	// The first sample at or after the target; the record we look for may sit anywhere up to it
+	auto it = lower_bound(entries.begin(), entries.end(), targetTimestamp,
+		[](const LogIndexEntry& entry, time_t timeStamp) { return entry.timeStamp < timeStamp; });
+	if (it == entries.begin())
+		return 0;
+	return (it - 1)->offset;
+}
+
+time_t LogIndex::getFirstTime() const {
+	return firstTime;
+}
+
+time_t LogIndex::getLastTime() const {
+	return lastTime;
+}
+
+uint64_t LogIndex::getRecordsCount() const {
+	return recordsCount;
+}
+
+const vector<LogIndexEntry>& LogIndex::getEntries() const {
+	return entries;
+}
+
+bool LogIndex::loadSidecar() {
+	ifstream file(sidecarPath(logsPath), ios::binary);
+	if (!file.is_open())
+		return false;
+
+	LogIndexHeader header;
+	if (!file.read(reinterpret_cast<char*>(&header), sizeof(header)))
+		return false;
+	if (!equal(begin(INDEX_MAGIC), end(INDEX_MAGIC), header.magic) || header.fileSize != fileSize
+		|| header.modifiedTime != modifiedTime || header.stride != stride)
+		return false;
+
+	vector<LogIndexEntry> loadedEntries(header.entriesCount);
+	if (!file.read(reinterpret_cast<char*>(loadedEntries.data()), loadedEntries.size() * sizeof(LogIndexEntry)))
+		return false;
+
+	entries = move(loadedEntries);
+	recordsCount = header.recordsCount;
+	firstTime = header.firstTime;
+	lastTime = header.lastTime;
+	return true;
+}
+
+void LogIndex::build() {
+	logger.logMessageToFile("LogIndex::build - Entering.");
+	entries.clear();
+	recordsCount = 0;
+	firstTime = lastTime = -1;
+
+	ifstream file(logsPath, ios::binary);
+	string line;
+	int64_t offset = 0;
+	time_t timeStamp;
+
+	while (getline(file, line)) {
+		int64_t lineOffset = offset;
+		offset += line.size() + 1;
+		if (!parseTime(line, timeStamp))
+			continue;
+
+		if (recordsCount % stride == 0)
+			entries.push_back({ timeStamp, lineOffset, static_cast<int64_t>(recordsCount) });
+		if (recordsCount == 0)
+			firstTime = timeStamp;
+		lastTime = timeStamp;
+		recordsCount++;
+	}
+
+	logger.logMessageToFile("LogIndex::build - Function execution finished.");
+}
+
+void LogIndex::saveSidecar() {
+	LogIndexHeader header;
+	copy(begin(INDEX_MAGIC), end(INDEX_MAGIC), header.magic);
+	header.fileSize = fileSize;
+	header.modifiedTime = modifiedTime;
+	header.stride = stride;
+	header.recordsCount = recordsCount;
+	header.firstTime = firstTime;
+	header.lastTime = lastTime;
+	header.entriesCount = entries.size();
+
+	// Write next to the final name and rename, so a concurrent reader never sees a partial index
+	string path = sidecarPath(logsPath);
+	string tempPath = path + ".tmp";
+	{
+		ofstream file(tempPath, ios::binary | ios::trunc);
+		file.write(reinterpret_cast<const char*>(&header), sizeof(header));
+		file.write(reinterpret_cast<const char*>(entries.data()), entries.size() * sizeof(LogIndexEntry));
+		if (!file) {
+			logger.logWarningToFile("LogIndex::saveSidecar - Could not write " + tempPath + ", the index is kept in memory only.");
+			return;
+		}
+	}
+
+	error_code error;
+	filesystem::rename(tempPath, path, error);
+	if (error) {
+		logger.logWarningToFile("LogIndex::saveSidecar - Could not replace " + path + ": " + error.message());
+		filesystem::remove(tempPath, error);
+	}
+}
+
+void LogIndex::clear() {
+	isBuilt = false;
+	fileSize = 0;
+	modifiedTime = 0;
+	firstTime = lastTime = -1;
+	recordsCount = 0;
+	entries.clear();
+}
+
+bool LogIndex::parseTime(string_view line, time_t& timeStamp) {
+	size_t pos = line.find("timestamp:");
+	if (pos == string_view::npos)
+		return false;
+	const char* first = line.data() + pos + 10;
+	int64_t seconds;
+	auto [ptr, ec] = from_chars(first, line.data() + line.size(), seconds);
+	if (ec != errc() || ptr == line.data() + line.size() || *ptr != '.')
+		return false;
+	timeStamp = static_cast<time_t>(seconds);
+	return true;
+}
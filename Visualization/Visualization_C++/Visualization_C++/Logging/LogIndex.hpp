@@ -0,0 +1,84 @@
+#pragma once
+#include <fstream>
+#include <string>
+#include <string_view>
+#include <vector>
+#include <cstdint>
+#include <ctime>
+#include <filesystem>
+#include "../Utilities/Logger.hpp"
+
+using namespace std;
+
+/**
+ * @struct LogIndexEntry
+ * @brief A single sample of the sparse index: the record's timestamp, its byte offset and its ordinal in the file.
+ */
+struct LogIndexEntry {
+	int64_t timeStamp;
+	int64_t offset;
+	int64_t ordinal;
+};
+
+/**
+ * @class LogIndex
+ * @brief A sparse timestamp to byte-offset index of a logs file, persisted next to it.
+ *
+ * Every stride-th record is sampled, so a seek lands at most stride records before the
+ * requested time. The index is saved as "<logs file>.idx" and reused as long as the logs
+ * file keeps the same size and modification time; otherwise it is rebuilt with one pass
+ * over the file.
+ */
+class LogIndex {
+public:
+	static constexpr size_t DEFAULT_STRIDE = 1024;
+
+	LogIndex(const string& logsPath = "", size_t stride = DEFAULT_STRIDE);
+
+	void setPath(const string&);
+
+	/**
+	 * @brief Makes sure the index matches the current logs file, loading or rebuilding it if needed.
+	 * @return True if the logs file exists and the index is usable, false otherwise.
+	 */
+	bool refresh();
+
+	/**
+	 * @brief Finds where to start reading in order to reach the first record at or after the given time.
+	 * @param targetTimestamp The timestamp to seek to.
+	 * @return The byte offset of the last sampled record before the target time, or 0.
+	 */
+	streampos seek(time_t targetTimestamp) const;
+
+	time_t getFirstTime() const;
+
+	time_t getLastTime() const;
+
+	uint64_t getRecordsCount() const;
+
+	const vector<LogIndexEntry>& getEntries() const;
+
+	static string sidecarPath(const string& logsPath);
+
+private:
+	string logsPath;
+	size_t stride;
+	bool isBuilt;
+	uint64_t fileSize;
+	int64_t modifiedTime;
+	time_t firstTime;
+	time_t lastTime;
+	uint64_t recordsCount;
+	vector<LogIndexEntry> entries;
+	Logger& logger;
+
+	bool loadSidecar();
+
+	void build();
+
+	void saveSidecar();
+
+	void clear();
+
+	static bool parseTime(string_view line, time_t& timeStamp);
+};
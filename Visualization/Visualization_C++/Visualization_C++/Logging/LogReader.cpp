@@ -7,6 +7,42 @@ LogReader::LogReader(const string& path) : filePath(path) {
 	endTime = logsFactory.getLastLogTime();
 }
 
+namespace {
+	/**
+	 * @brief Consumes the given literal at pos and advances pos past it.
+	 * @return True if the line continues with the literal, false otherwise.
+	 */
+	bool consume(string_view line, size_t& pos, string_view literal) {
+		if (line.compare(pos, literal.size(), literal) != 0)
+			return false;
+		pos += literal.size();
+		return true;
+	}
+
+	/**
+	 * @brief Parses a decimal integer at pos and advances pos past it.
+	 * @return True if at least one digit was read and the value fits, false otherwise.
+	 */
+	template <typename T>
+	bool consumeInt(string_view line, size_t& pos, T& value) {
+		const char* first = line.data() + pos;
+		auto [ptr, ec] = from_chars(first, line.data() + line.size(), value);
+		if (ec != errc())
+			return false;
+		pos += ptr - first;
+		return true;
+	}
+
+	void skipSpaces(string_view line, size_t& pos) {
+		while (pos < line.size() && isspace(static_cast<unsigned char>(line[pos])))
+			pos++;
+	}
+
+	bool isDigitAt(string_view line, size_t pos) {
+		return pos < line.size() && isdigit(static_cast<unsigned char>(line[pos]));
+	}
+}
+
 /**
  * @brief Retrieves the next log entry from the log file.
  * @return A generator yielding Log objects.
@@ -15,62 +51,97 @@ Generator<Log> LogReader::getNext() {
 	openFile();
 	string line;
 	Log log;
-	time_t start;
 	streampos position = logsFactory.binarySearchTimestamp(startTime);
 	fileStream.seekg(position, ios::beg);
+	bytesRead = static_cast<size_t>(position);
 
-	getline(fileStream, line);
-	start = logsFactory.getTimeFromLine(line);
-	if (start != startTime && startTime == endTime)
-		co_return;
+	if (getline(fileStream, line))
+		bytesRead += line.size() + 1;
 
-	while (!line.empty() && start <= endTime) {
+	// The index seeks up to one stride before startTime, and the timestamp parsed with
+	// each line decides whether it is still before the range, inside it or past it
+	// Checked on every line, so a filter chain that passes few logs still stops reading at once
+	while (!line.empty() && !stopped) {
 		if (parseCSVLine(line, log)) {
-			co_yield log;
+			if (log.timeStamp > endTime)
+				break;
+			if (log.timeStamp >= startTime)
+				co_yield log;
 		}
 
 		getline(fileStream, line);
 
 		if (!fileStream)
 			break;
-
-		start = logsFactory.getTimeFromLine(line);
-
+		bytesRead += line.size() + 1;
 	}
 	closeFile();
 }
 
 /**
  * @brief Parses a line from the CSV file and fills a Log object.
+ *
+ * The line is tokenized in a single pass over the fixed field order
+ * "timestamp:<s>.<us>,cluster_id:chip:<n>;die:<n>;quad:<n>;row:<n>;col:<n>,area:..,unit:..,in/out:<in|out>,tid:<n>,packet/data:..".
+ * String fields are assigned into the existing members of log, so a Log reused across lines
+ * does not allocate once its strings have grown to the typical field length.
  * @param line The line from the file.
  * @param log The Log object to populate.
  * @return True if the line was successfully parsed, false otherwise.
  */
 bool LogReader::parseCSVLine(const string& line, Log& log) {
-	regex pattern(R"(timestamp:(\d+\.\d+)\s*,cluster_id:chip:(-?\d+);die:(-?\d+);quad:(-?\d+);row:(-?\d+);col:(-?\d+)\s*,area:(.*?),unit:(.*?),in/out:(in|out),tid:(\d+),packet/data:(.*))");
-	smatch match;
-	if (regex_match(line, match, pattern)) {
-		try {
-			double timestampDouble = stod(match[1]);
-			log.timeStamp = static_cast<time_t>(timestampDouble);
-		}
-		catch (runtime_error e) {
-			throw InvalidFormatException("Error parsing timestamp: " + string(e.what()));
-			return false;
-		}
-		log.clusterId.chip = stoi(match[2]);
-		log.clusterId.die = stoi(match[3]);
-		log.clusterId.quad = stoi(match[4]);
-		log.clusterId.row = stoi(match[5]);
-		log.clusterId.col = stoi(match[6]);
-		log.area = match[7];
-		log.unit = match[8];
-		log.io = match[9] == "in" ? "in" : "out";
-		log.tid = stoi(match[10]);
-		log.packet = match[11];
-		return true;
-	}
-	return false;
+	string_view view(line);
+	if (!view.empty() && view.back() == '\r')
+		view.remove_suffix(1);
+	size_t pos = 0;
+
+	long long seconds;
+	if (!consume(view, pos, "timestamp:") || !isDigitAt(view, pos) || !consumeInt(view, pos, seconds))
+		return false;
+	if (!consume(view, pos, ".") || !isDigitAt(view, pos))
+		return false;
+	while (isDigitAt(view, pos))
+		pos++;
+	skipSpaces(view, pos);
+
+	Cluster& cluster = log.clusterId;
+	if (!consume(view, pos, ",cluster_id:chip:") || !consumeInt(view, pos, cluster.chip)
+		|| !consume(view, pos, ";die:") || !consumeInt(view, pos, cluster.die)
+		|| !consume(view, pos, ";quad:") || !consumeInt(view, pos, cluster.quad)
+		|| !consume(view, pos, ";row:") || !consumeInt(view, pos, cluster.row)
+		|| !consume(view, pos, ";col:") || !consumeInt(view, pos, cluster.col))
+		return false;
+	skipSpaces(view, pos);
+
+	if (!consume(view, pos, ",area:"))
+		return false;
+	size_t areaStart = pos;
+	size_t areaEnd = view.find(",unit:", areaStart);
+	if (areaEnd == string_view::npos)
+		return false;
+	size_t unitStart = areaEnd + 6;
+	size_t unitEnd = view.find(",in/out:", unitStart);
+	if (unitEnd == string_view::npos)
+		return false;
+
+	size_t ioStart = unitEnd + 8;
+	pos = ioStart;
+	if (!consume(view, pos, "in") && !consume(view, pos, "out"))
+		return false;
+	size_t ioEnd = pos;
+
+	int tid;
+	if (!consume(view, pos, ",tid:") || !isDigitAt(view, pos) || !consumeInt(view, pos, tid)
+		|| !consume(view, pos, ",packet/data:"))
+		return false;
+
+	log.timeStamp = static_cast<time_t>(seconds);
+	log.area.assign(view.substr(areaStart, areaEnd - areaStart));
+	log.unit.assign(view.substr(unitStart, unitEnd - unitStart));
+	log.io.assign(view.substr(ioStart, ioEnd - ioStart));
+	log.tid = tid;
+	log.packet.assign(view.substr(pos));
+	return true;
 }
 
 void LogReader::setPath(const string& path) {
@@ -98,11 +169,18 @@ time_t LogReader::getEndTime() {
 }
 
 size_t LogReader::getFileSize() {
-	openFile();
-	fileStream.seekg(0, ios::end);
-	size_t fileSize = fileStream.tellg();
-	closeFile();
-	return fileSize;
+	ifstream file(filePath, ios::binary | ios::ate);
+	if (!file)
+		return 0;
+	return static_cast<size_t>(file.tellg());
+}
+
+size_t LogReader::getBytesRead() {
+	return bytesRead;
+}
+
+void LogReader::stop() {
+	stopped = true;
 }
 
 bool LogReader::isOpen() {
@@ -4,6 +4,10 @@
 #include <iomanip>
 #include <unordered_map>
 #include <queue>
+#include <charconv>
+#include <string_view>
+#include <cctype>
+#include <atomic>
 #include "../Interfaces/IView.hpp"
 #include "../Utilities/CustomExceptions.hpp"
 #include "LogsFactory.hpp"
@@ -42,8 +46,21 @@ public:
 
 	time_t getEndTime();
 
+	/**
+	* @brief Size of the file, read without moving the stream getNext reads from.
+	*/
 	size_t getFileSize();
 
+	/**
+	* @brief Offset in the file up to which getNext has read, safe to call from another thread.
+	*/
+	size_t getBytesRead();
+
+	/**
+	* @brief Makes getNext stop at the next line it reads, safe to call from another thread.
+	*/
+	void stop();
+
 	bool isOpen() override;
 
 	void openFile();
@@ -56,6 +73,8 @@ protected:
 	LogsFactory logsFactory;
 	time_t startTime;       
 	time_t endTime;         
+	std::atomic<size_t> bytesRead{ 0 };
+	std::atomic<bool> stopped{ false };
 
 	/**
 	* @brief Parses a line from the CSV file and fills a Log object.
@@ -2,33 +2,20 @@
 
 void LogsFactory::setPath(const string& path) {
 	this->filePath = path;
+	lock_guard<mutex> lock(indexMutex);
+	index.setPath(path);
 }
 
 time_t LogsFactory::getFirstLogTime() {
-	openFile();
-	string line;
-	fileStream.seekg(ios::beg);
-	getline(fileStream, line);
-	return getTimeFromLine(line);
+	lock_guard<mutex> lock(indexMutex);
+	index.refresh();
+	return index.getFirstTime();
 }
 
 time_t LogsFactory::getLastLogTime() {
-	openFile();
-
-	fileStream.seekg(-3, ios::end);
-	char ch;
-	string line;
-
-	while (fileStream.tellg() > 1) {
-		fileStream.get(ch);
-		if (ch == '\n') {
-			break;
-		}
-		fileStream.seekg(-2, std::ios::cur);
-	}
-
-	getline(fileStream, line);
-	return getTimeFromLine(line);
+	lock_guard<mutex> lock(indexMutex);
+	index.refresh();
+	return index.getLastTime();
 }
 
 time_t LogsFactory::getTimeFromLine(const string& line) {
@@ -73,57 +60,14 @@ time_t LogsFactory::stringToTime_t(const string& timestampStr) {
 }
 
 /**
- * @brief Performs a binary search for a specific timestamp in the log file.
+ * @brief Performs a binary search for a specific timestamp in the sparse index of the log file.
  * @param targetTimestamp The timestamp to search for.
- * @return The position of the closest timestamp in the file.
+ * @return A position at or before the first log with a timestamp not earlier than the target.
  */
 streampos LogsFactory::binarySearchTimestamp(const time_t& targetTimestamp) {
-	openFile();
-	streampos left = 0;
-	fileStream.seekg(0, std::ios::end);
-	streampos right = fileStream.tellg();
-	streampos result = -1;
-	streampos closestGreater = -1;
-
-	while (left <= right) {
-		streamoff mid = left + (streamoff)((right - left) / 2);
-		fileStream.seekg(mid);
-
-		if (mid > 0) {
-			std::string dummy;
-			getline(fileStream, dummy);
-		}
-
-		streampos currentPos = fileStream.tellg();
-		std::string line;
-		getline(fileStream, line);
-
-		if (line.empty()) {
-			break;
-		}
-
-		time_t midTimestamp = getTimeFromLine(line);
-
-		if (compareTimestamps(midTimestamp, targetTimestamp) == 0) {
-			result = currentPos;
-			closeFile();
-			return result;
-		}
-		else if (compareTimestamps(midTimestamp, targetTimestamp) > 0) {
-			closestGreater = currentPos;
-			right = mid - 1;
-		}
-		else {
-			result = currentPos;
-			left = mid + 1;
-		}
-	}
-	closeFile();
-	return (closestGreater != -1) ? closestGreater : result;
-}
-
-int LogsFactory::compareTimestamps(time_t ts1, time_t ts2) {
-	return (ts1 > ts2) - (ts1 < ts2);
+	lock_guard<mutex> lock(indexMutex);
+	index.refresh();
+	return index.seek(targetTimestamp);
 }
 
 void LogsFactory::openFile() {
@@ -149,8 +93,8 @@ PYBIND11_MODULE(logs_factory, m) {
  m.doc() = "LogsFactory module: Provides functionality to read log timestamps from a file.";
 
  py::class_<LogsFactory>(m, "LogsFactory")
- .def(py::init<const std::string&>(), py::arg("path"), "Initialize LogsFactory with the given file path.")
- .def("get_first_log_time", &LogsFactory::getFirstLogTime, "Get the timestamp of the first log entry in the file.")
- .def("get_last_log_time", &LogsFactory::getLastLogTime, "Get the timestamp of the last log entry in the file.");
+ .def(py::init<const std::string&>(), py::arg("path"), py::call_guard<py::gil_scoped_release>(), "Initialize LogsFactory with the given file path.")
+ .def("get_first_log_time", &LogsFactory::getFirstLogTime, py::call_guard<py::gil_scoped_release>(), "Get the timestamp of the first log entry in the file.")
+ .def("get_last_log_time", &LogsFactory::getLastLogTime, py::call_guard<py::gil_scoped_release>(), "Get the timestamp of the last log entry in the file.");
 }
 #endif
\ No newline at end of file
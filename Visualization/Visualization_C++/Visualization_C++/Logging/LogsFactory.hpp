@@ -10,6 +10,8 @@
 #include <cmath>
 #include <regex>
 #include <iomanip>
+#include <mutex>
+#include "LogIndex.hpp"
 #include "../Utilities/Logger.hpp"
 #include "../Utilities/CustomExceptions.hpp"
 
@@ -25,7 +27,7 @@ namespace py = pybind11;
  */
 class LogsFactory {
 public:
-	LogsFactory(const string& path) : filePath(path),logger(Logger::getInstance()) {}
+	LogsFactory(const string& path) : filePath(path), index(path), logger(Logger::getInstance()) {}
 
 	LogsFactory() : logger(Logger::getInstance()) {}
 	 
@@ -42,9 +44,9 @@ public:
 	time_t stringToTime_t(const string&);
 
 	/**
-	 * @brief Performs a binary search for a specific timestamp in the log file.
+	 * @brief Performs a binary search for a specific timestamp in the sparse index of the log file.
 	 * @param targetTimestamp The timestamp to search for.
-	 * @return The position of the closest timestamp in the file.
+	 * @return A position at or before the first log with a timestamp not earlier than the target.
 	 */
 	streampos binarySearchTimestamp(const time_t& targetTimestamp);
 
@@ -53,10 +55,10 @@ public:
 private:
 	ifstream fileStream; 
 	string filePath;     
+	LogIndex index;
+	mutex indexMutex;
 	Logger& logger;      
 
-	int compareTimestamps(time_t, time_t);
-
 	void openFile();
 
 	void closeFile();
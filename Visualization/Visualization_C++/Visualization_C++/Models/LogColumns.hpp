@@ -0,0 +1,95 @@
+#pragma once
+#include <cstdint>
+#include <map>
+#include <string>
+#include <unordered_map>
+#include <vector>
+#include "Log.hpp"
+
+using namespace std;
+
+constexpr auto AREA_COLUMN = "area";
+constexpr auto UNIT_COLUMN = "unit";
+constexpr auto IO_COLUMN = "io";
+
+/**
+ * @struct LogRecord
+ * @brief One log as a fixed-size row, laid out like LOG_DTYPE of the Python LogStore.
+ *
+ * Strings are codes into the dictionaries of their batch, and the packet is a range of the batch's arena.
+ */
+#pragma pack(push, 1)
+struct LogRecord {
+	int64_t timeStamp;
+	int8_t chip;
+	int8_t die;
+	int8_t quad;
+	int8_t row;
+	int8_t col;
+	uint8_t area;
+	uint16_t unit;
+	uint8_t io;
+	int32_t tid;
+	int64_t packetOffset;
+	int32_t packetLength;
+};
+#pragma pack(pop)
+
+/**
+ * @class LogColumns
+ * @brief A batch of logs in contiguous storage: one record per log, the packets back to back in one arena,
+ * and the distinct strings of each encoded column in order of first appearance.
+ *
+ * Python reads the records and the arena as NumPy arrays over this storage, without an object per log.
+ */
+class LogColumns {
+public:
+	vector<LogRecord> records;
+	string packets;
+	map<string, vector<string>> dictionaries = { { AREA_COLUMN, {} }, { UNIT_COLUMN, {} }, { IO_COLUMN, {} } };
+
+	LogColumns() {}
+
+	explicit LogColumns(const vector<Log>& logs) {
+		records.reserve(logs.size());
+		for (const auto& log : logs)
+			add(log);
+	}
+
+	void add(const Log& log) {
+		LogRecord record;
+		record.timeStamp = log.timeStamp;
+		record.chip = static_cast<int8_t>(log.clusterId.chip);
+		record.die = static_cast<int8_t>(log.clusterId.die);
+		record.quad = static_cast<int8_t>(log.clusterId.quad);
+		record.row = static_cast<int8_t>(log.clusterId.row);
+		record.col = static_cast<int8_t>(log.clusterId.col);
+		record.area = static_cast<uint8_t>(encode(AREA_COLUMN, areaCodes, log.area));
+		record.unit = static_cast<uint16_t>(encode(UNIT_COLUMN, unitCodes, log.unit));
+		record.io = static_cast<uint8_t>(encode(IO_COLUMN, ioCodes, log.io));
+		record.tid = log.tid;
+		record.packetOffset = static_cast<int64_t>(packets.size());
+		record.packetLength = static_cast<int32_t>(log.packet.size());
+		packets += log.packet;
+		records.push_back(record);
+	}
+
+	size_t size() const {
+		return records.size();
+	}
+
+private:
+	unordered_map<string, size_t> areaCodes;
+	unordered_map<string, size_t> unitCodes;
+	unordered_map<string, size_t> ioCodes;
+
+	size_t encode(const string& column, unordered_map<string, size_t>& codes, const string& value) {
+		auto it = codes.find(value);
+		if (it != codes.end())
+			return it->second;
+		vector<string>& values = dictionaries[column];
+		codes.emplace(value, values.size());
+		values.push_back(value);
+		return values.size() - 1;
+	}
+};
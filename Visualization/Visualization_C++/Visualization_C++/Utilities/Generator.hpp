@@ -158,9 +158,15 @@ public:
     /**
      * @brief Returns an iterator to the beginning of the generated values.
      *
+     * The coroutine starts suspended, so it is resumed once here to produce
+     * the first value before it can be dereferenced.
+     *
      * @return An iterator pointing to the first value.
      */
     iterator begin() {
+        if (coro && !coro.done()) {
+            coro.resume();
+        }
         return iterator{ coro };
     }
 
@@ -33,6 +33,7 @@ Logger& Logger::getInstance() {
 }
 
 void Logger::logToFile(const std::string& message, const std::string& level, const std::vector<std::string>& params) {
+    std::lock_guard<std::mutex> lock(fileMutex);
     std::ofstream file(logFilePath, std::ios_base::app);
     if (file.is_open()) {
         std::stringstream ss;
@@ -164,9 +165,12 @@ void Logger::rotateLogFile() {
     }
 
     std::error_code ec;
-    std::filesystem::rename(logFilePrefix + currentDateTime + logFileExtension, logFilePath, ec);
-    if (ec) {
-        throw LogFileRotationException("Error rotating log file: " + ec.message());
+    std::string rotatedFile = logFilePrefix + currentDateTime + logFileExtension;
+    if (std::filesystem::exists(rotatedFile)) {
+        std::filesystem::rename(rotatedFile, logFilePath, ec);
+        if (ec) {
+            throw LogFileRotationException("Error rotating log file: " + ec.message());
+        }
     }
 }
 
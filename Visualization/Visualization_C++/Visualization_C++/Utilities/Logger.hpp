@@ -8,6 +8,7 @@
 #include <iostream>
 #include <chrono>
 #include <ctime>
+#include <mutex>
 #include "../Utilities/CustomExceptions.hpp"
 
 /**
@@ -78,6 +79,7 @@ private:
     int currentLogFileSize;         ///< Current size of the log file in bytes.
     int maxLogFileSize;             ///< Maximum size of the log file in bytes before rotation.
     int maxLogFiles;                ///< Maximum number of log files to retain.
+    std::mutex fileMutex;           ///< Serializes file writes from the Python bindings and the filter thread.
 };
 
 #endif
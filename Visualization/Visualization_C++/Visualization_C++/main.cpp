@@ -41,6 +41,7 @@ int main(int argc, char** argv)
 #include "Filters/FilterFactory.hpp"
 #include "Logging/LogsFactory.hpp"
 #include <iostream>
+#include <map>
 
 using namespace std;
 
@@ -259,6 +260,292 @@ TEST_CASE("FilterFactory ThreadId Filter Test") {
         CHECK(log.tid == 117);
 }
 
+TEST_CASE("FilterFactory getLogs Batch Test") {
+    vector<Log> logs;
+    GenerateLogsFile();
+    FilterFactory filterFactory(FILE_NAME);
+    filterFactory.setStartTime(1726671833.525302);
+    filterFactory.setEndTime(1726671915.525302);
+
+    filterFactory.startLogs();
+    while (!filterFactory.isFinishProcess() || filterFactory.hasLog()) {
+        vector<Log> batch = filterFactory.getLogs(4);
+        CHECK(batch.size() <= 4);
+        logs.insert(logs.end(), batch.begin(), batch.end());
+    }
+    filterFactory.joinThread();
+
+    CHECK(logs.size() == 9);
+    for (size_t i = 1; i < logs.size(); i++)
+        CHECK(logs[i - 1].timeStamp <= logs[i].timeStamp);
+    CHECK(filterFactory.getLogs(4).empty());
+}
+
+TEST_CASE("FilterFactory waitForLogs Stream Test") {
+    vector<Log> logs;
+    GenerateLogsFile();
+    FilterFactory filterFactory(FILE_NAME);
+    filterFactory.setStartTime(1726671833.525302);
+    filterFactory.setEndTime(1726671915.525302);
+
+    vector<int> threadIds = { 7 };
+    filterFactory.addFilterToChain({ FilterType::ThreadId, threadIds });
+
+    filterFactory.startLogs();
+    LogBatchStream stream(filterFactory, 2);
+    for (vector<Log> batch = stream.next(); !batch.empty(); batch = stream.next()) {
+        CHECK(batch.size() <= 2);
+        logs.insert(logs.end(), batch.begin(), batch.end());
+    }
+    filterFactory.joinThread();
+
+    CHECK(filterFactory.isFinishProcess());
+    CHECK(logs.size() == 4);
+    for (const auto& log : logs)
+        CHECK(log.tid == 7);
+}
+
+TEST_CASE("FilterFactory LogColumns Stream Test") {
+    vector<Log> logs;
+    GenerateLogsFile();
+    FilterFactory filterFactory(FILE_NAME);
+    filterFactory.startLogs();
+    for (vector<Log> batch = filterFactory.waitForLogs(3); !batch.empty(); batch = filterFactory.waitForLogs(3))
+        logs.insert(logs.end(), batch.begin(), batch.end());
+    filterFactory.joinThread();
+    REQUIRE(!logs.empty());
+
+    // The same logs as contiguous records, with their strings encoded and their packets in one arena
+    vector<LogColumns> batches;
+    filterFactory.startLogs();
+    LogColumnsStream stream(filterFactory, 3);
+    for (LogColumns batch = stream.next(); batch.size() > 0; batch = stream.next()) {
+        CHECK(batch.size() <= 3);
+        batches.push_back(std::move(batch));
+    }
+    filterFactory.joinThread();
+
+    CHECK(sizeof(LogRecord) == 33);
+    size_t index = 0;
+    for (const auto& batch : batches) {
+        for (const auto& record : batch.records) {
+            REQUIRE(index < logs.size());
+            const Log& log = logs[index++];
+            CHECK(record.timeStamp == log.timeStamp);
+            CHECK(record.die == log.clusterId.die);
+            CHECK(record.col == log.clusterId.col);
+            CHECK(batch.dictionaries.at(AREA_COLUMN)[record.area] == log.area);
+            CHECK(batch.dictionaries.at(UNIT_COLUMN)[record.unit] == log.unit);
+            CHECK(batch.dictionaries.at(IO_COLUMN)[record.io] == log.io);
+            CHECK(record.tid == log.tid);
+            CHECK(batch.packets.substr(record.packetOffset, record.packetLength) == log.packet);
+        }
+    }
+    CHECK(index == logs.size());
+}
+
+TEST_CASE("FilterFactory cancel Test") {
+    GenerateLogsFile();
+    FilterFactory filterFactory(FILE_NAME);
+    vector<int> threadIds = { 7 };
+    filterFactory.addFilterToChain({ FilterType::ThreadId, threadIds });
+
+    // A cancelled process ends the stream without logs and its thread can be joined
+    filterFactory.startLogs();
+    filterFactory.cancel();
+    LogBatchStream stream(filterFactory, 2);
+    CHECK(stream.next().empty());
+    filterFactory.joinThread();
+    CHECK(filterFactory.isCancelled());
+
+    // A cancelled factory stays cancelled, a new process needs a new factory
+    filterFactory.startLogs();
+    CHECK(stream.next().empty());
+    filterFactory.joinThread();
+    CHECK(filterFactory.isCancelled());
+
+    vector<Log> logs;
+    FilterFactory nextFilterFactory(FILE_NAME);
+    nextFilterFactory.addFilterToChain({ FilterType::ThreadId, threadIds });
+    nextFilterFactory.startLogs();
+    LogBatchStream nextStream(nextFilterFactory, 2);
+    for (vector<Log> batch = nextStream.next(); !batch.empty(); batch = nextStream.next())
+        logs.insert(logs.end(), batch.begin(), batch.end());
+    nextFilterFactory.joinThread();
+    CHECK(logs.size() == 4);
+}
+
+TEST_CASE("FilterFactory cancel before start Test") {
+    GenerateLogsFile();
+    FilterFactory filterFactory(FILE_NAME);
+
+    // A cancel made before the start is kept, so the process ends without logs
+    filterFactory.cancel();
+    filterFactory.startLogs();
+    LogBatchStream stream(filterFactory, 2);
+    CHECK(stream.next().empty());
+    filterFactory.joinThread();
+    CHECK(filterFactory.isCancelled());
+}
+
+TEST_CASE("FilterFactory bytes read Test") {
+    GenerateLogsFile();
+    FilterFactory filterFactory(FILE_NAME);
+    size_t fileSize = filterFactory.getFileSize();
+    CHECK(fileSize > 0);
+
+    // The whole file is read once the process has finished
+    filterFactory.startLogs();
+    LogBatchStream stream(filterFactory, 2);
+    while (!stream.next().empty())
+        CHECK(filterFactory.getBytesRead() <= fileSize + 1);
+    filterFactory.joinThread();
+    CHECK(filterFactory.getBytesRead() >= fileSize);
+    CHECK(filterFactory.getFilteredCount() == 10);
+}
+
+class LogReaderProbe : public LogReader {
+public:
+    using LogReader::LogReader;
+    using LogReader::parseCSVLine;
+};
+
+bool parseCSVLineWithRegex(const string& line, Log& log) {
+    regex pattern(R"(timestamp:(\d+\.\d+)\s*,cluster_id:chip:(-?\d+);die:(-?\d+);quad:(-?\d+);row:(-?\d+);col:(-?\d+)\s*,area:(.*?),unit:(.*?),in/out:(in|out),tid:(\d+),packet/data:(.*))");
+    smatch match;
+    if (!regex_match(line, match, pattern))
+        return false;
+    log.timeStamp = static_cast<time_t>(stod(match[1]));
+    log.clusterId = Cluster(stoi(match[2]), stoi(match[3]), stoi(match[4]), stoi(match[5]), stoi(match[6]));
+    log.area = match[7];
+    log.unit = match[8];
+    log.io = match[9];
+    log.tid = stoi(match[10]);
+    log.packet = match[11];
+    return true;
+}
+
+bool sameLog(const Log& lhs, const Log& rhs) {
+    return lhs.timeStamp == rhs.timeStamp && lhs.clusterId == rhs.clusterId && lhs.area == rhs.area
+        && lhs.unit == rhs.unit && lhs.io == rhs.io && lhs.tid == rhs.tid && lhs.packet == rhs.packet;
+}
+
+TEST_CASE("LogReader parseCSVLine Test") {
+    GenerateLogsFile();
+    LogReaderProbe reader(FILE_NAME);
+    vector<string> lines = {
+        "timestamp:1726671833.525302,cluster_id:chip:0;die:0;quad:0;row:1;col:1,area:mcu gate 1,unit:BMT,in/out:in,tid:117,packet/data:sample data 0",
+        "timestamp:1726671845.5 ,cluster_id:chip:0;die:1;quad:2;row:-1;col:2 ,area:host if,unit:eq;3,in/out:out,tid:7,packet/data:a,b:c",
+        "timestamp:1726671845.525302,cluster_id:chip:0;die:1;quad:2;row:2;col:2,area:hbm,unit:lnb,in/out:out,tid:7,packet/data:",
+        "timestamp:1726671845,cluster_id:chip:0;die:1;quad:2;row:2;col:2,area:hbm,unit:lnb,in/out:out,tid:7,packet/data:x",
+        "timestamp:1726671845.525302,cluster_id:chip:0;die:1;quad:2;row:2;col:2,area:hbm,unit:lnb,in/out:both,tid:7,packet/data:x",
+        "timestamp:1726671845.525302,cluster_id:chip:0;die:1;quad:2;row:2;col:2,area:hbm,unit:lnb,in/out:in,tid:-7,packet/data:x",
+        "timestamp:1726671845.525302,cluster_id:chip:0;die:1;quad:2;row:2,area:hbm,unit:lnb,in/out:in,tid:7,packet/data:x",
+        "not a log line",
+        ""
+    };
+
+    for (const auto& line : lines) {
+        Log expected, actual;
+        bool expectedParsed = parseCSVLineWithRegex(line, expected);
+        CHECK(reader.parseCSVLine(line, actual) == expectedParsed);
+        if (expectedParsed)
+            CHECK(sameLog(actual, expected));
+    }
+}
+
+TEST_CASE("LogReader parseCSVLine Benchmark") {
+    GenerateLogsFile();
+    LogReaderProbe reader(FILE_NAME);
+    vector<string> lines;
+    for (int i = 0; i < 20000; i++)
+        lines.push_back("timestamp:" + to_string(1726671833 + i / 100) + ".525302,cluster_id:chip:0;die:" + to_string(i % 2)
+            + ";quad:" + to_string(i % 4) + ";row:" + to_string(i % 8) + ";col:" + to_string(i % 8)
+            + ",area:mcu gate 1,unit:eq;" + to_string(i % 6) + ",in/out:" + (i % 2 ? "in" : "out")
+            + ",tid:" + to_string(i % 40) + ",packet/data:sample data " + to_string(i));
+
+    Log log, expected;
+    auto regexStart = chrono::steady_clock::now();
+    size_t regexParsed = 0;
+    for (const auto& line : lines)
+        regexParsed += parseCSVLineWithRegex(line, expected);
+    auto regexTime = chrono::steady_clock::now() - regexStart;
+
+    auto parserStart = chrono::steady_clock::now();
+    size_t parsed = 0;
+    for (const auto& line : lines)
+        parsed += reader.parseCSVLine(line, log);
+    auto parserTime = chrono::steady_clock::now() - parserStart;
+
+    MESSAGE("regex: " << chrono::duration_cast<chrono::microseconds>(regexTime).count() << "us, parseCSVLine: "
+        << chrono::duration_cast<chrono::microseconds>(parserTime).count() << "us for " << lines.size() << " lines");
+    CHECK(parsed == lines.size());
+    CHECK(regexParsed == lines.size());
+    CHECK(sameLog(log, expected));
+    CHECK(parserTime * 10 <= regexTime);
+}
+
+TEST_CASE("LogIndex Seek Test") {
+    constexpr auto INDEX_FILE_NAME = "index_logs.csv";
+    constexpr time_t FIRST_SECOND = 1726671833;
+    map<time_t, int64_t> firstOffsetOfSecond;
+    {
+        ofstream file(INDEX_FILE_NAME, ios::binary);
+        for (int i = 0; i < 100; i++) {
+            time_t second = FIRST_SECOND + i / 10;
+            firstOffsetOfSecond.emplace(second, static_cast<int64_t>(file.tellp()));
+            file << "timestamp:" << second << "." << 100000 + i << ",cluster_id:chip:0;die:0;quad:0;row:1;col:1,area:hbm,unit:hbm,in/out:in,tid:"
+                << i << ",packet/data:sample data " << i << "\n";
+        }
+    }
+    filesystem::remove(LogIndex::sidecarPath(INDEX_FILE_NAME));
+
+    LogIndex index(INDEX_FILE_NAME, 8);
+    CHECK(index.refresh());
+    CHECK(filesystem::exists(LogIndex::sidecarPath(INDEX_FILE_NAME)));
+    CHECK(index.getRecordsCount() == 100);
+    CHECK(index.getFirstTime() == FIRST_SECOND);
+    CHECK(index.getLastTime() == FIRST_SECOND + 9);
+    CHECK(index.getEntries().size() == 13);
+
+    // A seek lands on a line start at most one stride of records before the first log of that second
+    ifstream logsFile(INDEX_FILE_NAME, ios::binary);
+    for (const auto& [second, offset] : firstOffsetOfSecond) {
+        logsFile.clear();
+        logsFile.seekg(index.seek(second));
+        int skipped = 0;
+        string line;
+        while (logsFile.tellg() < offset && getline(logsFile, line))
+            skipped++;
+        CHECK(logsFile.tellg() == offset);
+        CHECK(skipped <= 8);
+    }
+    CHECK(index.seek(FIRST_SECOND - 1) == 0);
+
+    LogIndex loaded(INDEX_FILE_NAME, 8);
+    CHECK(loaded.refresh());
+    CHECK(loaded.getEntries().size() == index.getEntries().size());
+    CHECK(loaded.getEntries().back().offset == index.getEntries().back().offset);
+
+    {
+        ofstream file(INDEX_FILE_NAME, ios::app);
+        file << "timestamp:" << FIRST_SECOND + 20 << ".5,cluster_id:chip:0;die:0;quad:0;row:1;col:1,area:hbm,unit:hbm,in/out:in,tid:1,packet/data:x\n";
+    }
+    CHECK(index.refresh());
+    CHECK(index.getRecordsCount() == 101);
+    CHECK(index.getLastTime() == FIRST_SECOND + 20);
+
+    FilterFactory filterFactory(INDEX_FILE_NAME);
+    filterFactory.setStartTime(FIRST_SECOND + 4);
+    filterFactory.setEndTime(FIRST_SECOND + 4);
+    filterFactory.startLogs();
+    filterFactory.joinThread();
+    vector<Log> logs = filterFactory.getLogs(100);
+    CHECK(logs.size() == 10);
+    for (const auto& log : logs)
+        CHECK(log.timeStamp == FIRST_SECOND + 4);
+}
+
 TEST_CASE("LogsFactory tests") {
     LogsFactory logsFactory(FILE_NAME);
 
@@ -24,9 +24,5 @@ class Cluster(Component):
     def get_all_inner_details(self) -> List[Component]:
         return [self.lnb, self.mcu, *self.mcu.get_details()]
 
-    def get_attribute_from_active_logs(self, attribute: Any) -> List[Any]:
-        attributes = []
-        for inner_obj in self.get_details():
-            attributes.extend(inner_obj.get_attribute_from_active_logs(attribute))
-        attributes.extend(super().get_attribute_from_active_logs(attribute))
-        return attributes
+    def get_inner_components(self) -> List[Component]:
+        return self.get_details()
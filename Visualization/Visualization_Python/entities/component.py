@@ -1,6 +1,12 @@
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Union, Dict
+
+import numpy as np
+
+from entities.linked_logs import LinkedLogs
+from entities.log_rollup import LogRollup, EMPTY_ROLLUP
 
 from utils.error_messages import ErrorMessages
+from utils.log_store import LogStore, LogView
 
 
 class Component:
@@ -13,7 +19,52 @@ class Component:
         else:
             self.id = id
         self.type_name = type_name
-        self.active_logs: List[Any] = []  # List to hold active logs
+        self.linked_logs: Optional[LinkedLogs] = None  # The linking pass this component reads its logs from
+        self._active_logs: Union[List[Any], LogView] = []
+
+    @property
+    def active_logs(self) -> Union[List[Any], LogView]:
+        """
+        The logs linked directly to this component, a view into the DataManager's LogStore.
+        """
+        if self.linked_logs is not None:
+            return self.linked_logs.get_logs(self)
+        return self._active_logs
+
+    @active_logs.setter
+    def active_logs(self, logs: Union[List[Any], LogView]) -> None:
+        self._active_logs = logs
+        self.linked_logs = None
+
+    @property
+    def rollup(self) -> LogRollup:
+        """
+        Summary of the logs of this component and its inner components.
+        """
+        if self.linked_logs is not None:
+            return self.linked_logs.get_rollup(self)
+        return EMPTY_ROLLUP
+
+    def get_inner_components(self) -> List['Component']:
+        """
+        The components whose logs are included in the logs of this component.
+        """
+        return []
+
+    def collect_rollups(self, own_rollups: Dict['Component', LogRollup],
+                        rollups: Dict['Component', LogRollup]) -> LogRollup:
+        """
+        Computes the rollups of this component and its inner components, bottom-up, without changing them.
+
+        :param own_rollups: Rollups of the logs linked directly to each component. Components missing
+                            from it have no logs of their own.
+        :param rollups: Receives the non-empty rollup of every visited component.
+        """
+        inner_rollups = [inner.collect_rollups(own_rollups, rollups) for inner in self.get_inner_components()]
+        rollup = LogRollup.combine([*inner_rollups, own_rollups.get(self, EMPTY_ROLLUP)])
+        if rollup.count:
+            rollups[self] = rollup
+        return rollup
 
     def get_attribute_from_active_logs(self, attribute: str) -> List[Any]:
         """
@@ -24,7 +75,36 @@ class Component:
         :param attribute: The attribute to retrieve from the active logs.
         :return: A list of values for the specified attribute from all inner components.
         """
+        attributes = []
+        for inner in self.get_inner_components():
+            attributes.extend(inner.get_attribute_from_active_logs(attribute))
+        attributes.extend(self.get_attribute_from_own_logs(attribute))
+        return attributes
+
+    def get_active_log_views(self) -> List[LogView]:
+        """
+        The logs of this component and its inner components as views into their stores, in the order of
+        get_attribute_from_active_logs. Logs assigned as a list are put in a store of their own.
+        """
+        views = []
+        for inner in self.get_inner_components():
+            views.extend(inner.get_active_log_views())
+        logs = self.active_logs
+        if isinstance(logs, LogView):
+            if logs:
+                views.append(logs)
+        elif logs:
+            store = LogStore.from_log_batches([logs])
+            views.append(store.view(np.arange(len(store))))
+        return views
+
+    def get_attribute_from_own_logs(self, attribute: str) -> List[Any]:
+        """
+        Retrieve the specified attribute from the logs linked directly to this component.
+        """
         try:
+            if isinstance(self.active_logs, LogView):
+                return self.active_logs.get_attribute(attribute)
             attributes = [getattr(log, attribute) for log in self.active_logs] if self.active_logs else []
         except AttributeError as e:
             print(ErrorMessages.FAILED_TO_RETIEVE_ATTRIBUTE.value.format(attribute=attribute, error=str(e)))
@@ -28,10 +28,5 @@ class Die(Component):
             new_quad = Quad(quad_data.get(ID), quad_data.get(NAME), quad_data)
             self.quads[row][col] = new_quad
 
-    def get_attribute_from_active_logs(self, attribute: str) -> List[Any]:
-        attributes = []
-        for row in self.quads:
-            for quad in row:
-                attributes.extend(quad.get_attribute_from_active_logs(attribute))
-        attributes.extend(super().get_attribute_from_active_logs(attribute))
-        return attributes
+    def get_inner_components(self) -> List[Component]:
+        return [quad for row in self.quads for quad in row if quad is not None]
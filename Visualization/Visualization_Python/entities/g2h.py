@@ -23,9 +23,5 @@ class G2h(Component):
     def get_details(self) -> List[Component]:
         return [self.g2h_irqa, *self.eqs]
 
-    def get_attribute_from_active_logs(self, attribute: str) -> List[Any]:
-        attributes = []
-        for inner_obj in self.get_details():
-            attributes.extend(inner_obj.get_attribute_from_active_logs(attribute))
-        attributes.extend(super().get_attribute_from_active_logs(attribute))
-        return attributes
+    def get_inner_components(self) -> List[Component]:
+        return self.get_details()
@@ -1,4 +1,4 @@
-from typing import List, Any
+from typing import List
 
 from entities.component import Component
 
@@ -17,9 +17,5 @@ class H2g(Component):
     def get_details(self) -> List[Component]:
         return [self.cbus_inj, self.cbus_clt, self.nfi_inj, self.nfi_clt, self.h2g_irqa]
 
-    def get_attribute_from_active_logs(self, attribute: str) -> List[Any]:
-        attributes = []
-        for inner_obj in self.get_details():
-            attributes.extend(inner_obj.get_attribute_from_active_logs(attribute))
-        attributes.extend(super().get_attribute_from_active_logs(attribute))
-        return attributes
\ No newline at end of file
+    def get_inner_components(self) -> List[Component]:
+        return self.get_details()
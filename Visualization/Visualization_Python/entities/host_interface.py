@@ -21,9 +21,5 @@ class HostInterface(Component):
     def get_all_inner_details(self) -> List[Component]:
         return [self.bmt, self.pcie, *self.h2g.get_details(), *self.g2h.get_details()]
 
-    def get_attribute_from_active_logs(self, attribute: str) -> List[Any]:
-        attributes = []
-        for inner_obj in self.get_details():
-            attributes.extend(inner_obj.get_attribute_from_active_logs(attribute))
-        attributes.extend(super().get_attribute_from_active_logs(attribute))
-        return attributes
+    def get_inner_components(self) -> List[Component]:
+        return self.get_details()
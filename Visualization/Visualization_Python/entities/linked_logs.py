@@ -0,0 +1,64 @@
+from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
+
+from entities.log_rollup import LogRollup, EMPTY_ROLLUP
+from utils.log_store import LogView
+
+if TYPE_CHECKING:
+    from entities.component import Component
+
+
+class LinkedLogs:
+    """
+    The logs of the leaf components and the rollups of all the components, as linked by one pass.
+
+    Components keep a reference to the pass that linked them and read their logs through it.
+    Retiring a pass clears every component still referring to it at once.
+    """
+
+    def __init__(self, epoch: int, logs: Dict['Component', LogView], rollups: Dict['Component', LogRollup]) -> None:
+        self.epoch = epoch
+        self.logs = logs
+        self.rollups = rollups
+        self.is_retired = False
+
+    def get_logs(self, component: 'Component') -> Union[List[Any], LogView]:
+        if self.is_retired:
+            return []
+        return self.logs.get(component, [])
+
+    def get_rollup(self, component: 'Component') -> LogRollup:
+        if self.is_retired:
+            return EMPTY_ROLLUP
+        return self.rollups.get(component, EMPTY_ROLLUP)
+
+    def attach(self) -> None:
+        """
+        Points the components that have logs in this pass to it.
+        """
+        for component in self.rollups:
+            component.linked_logs = self
+
+    def retire(self) -> None:
+        """
+        Clears the logs and rollups of this pass, which components not linked by a newer pass may still refer to.
+        """
+        self.is_retired = True
+        self.logs = {}
+        self.rollups = {}
+
+
+class LinkingProgress:
+    """
+    How far the logs file was read, with a linking of the logs read so far.
+    """
+
+    def __init__(self, bytes_read: int, file_size: int, linked_logs: Optional[LinkedLogs] = None) -> None:
+        self.bytes_read = bytes_read
+        self.file_size = file_size
+        self.linked_logs = linked_logs
+
+    @property
+    def fraction(self) -> float:
+        if not self.file_size:
+            return 0.0
+        return min(1.0, self.bytes_read / self.file_size)
@@ -0,0 +1,96 @@
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from utils.log_store import LogStore, TIMESTAMP_COLUMN, TID_COLUMN
+
+
+class LogRollup:
+    """
+    Summary of the logs of a component and of all its inner components.
+
+    TIDs keep the order in which get_attribute_from_active_logs would first return them,
+    so tids[0] is the TID of the first log of the component.
+    """
+
+    def __init__(self, count: int = 0, tid_counts: Optional[Dict[int, int]] = None,
+                 first_time: Optional[int] = None, last_time: Optional[int] = None) -> None:
+        self.count = count
+        self.tid_counts = tid_counts if tid_counts is not None else {}
+        self.first_time = first_time
+        self.last_time = last_time
+
+    @classmethod
+    def from_groups(cls, store: LogStore, groups: List[np.ndarray]) -> List['LogRollup']:
+        """
+        Summarizes several groups of row indices of a store in one vectorized pass.
+        Each group must be in file order.
+        """
+        if not groups:
+            return []
+        sizes = np.array([len(group) for group in groups])
+        indices = np.concatenate(groups)
+        tids = store.rows[TID_COLUMN][indices]
+        timestamps = store.rows[TIMESTAMP_COLUMN][indices]
+        group_of_row = np.repeat(np.arange(len(groups), dtype=np.int64), sizes)
+
+        # One key per (group, TID); the first row of each key orders the TIDs of a group by first appearance
+        keys = (group_of_row << 32) | tids.astype(np.uint32).astype(np.int64)
+        _, first_rows, counts = np.unique(keys, return_index=True, return_counts=True)
+        order = np.argsort(first_rows, kind='stable')
+        first_rows, counts = first_rows[order], counts[order]
+        tid_counts = [{} for _ in groups]
+        for group, tid, count in zip(group_of_row[first_rows].tolist(), tids[first_rows].tolist(), counts.tolist()):
+            tid_counts[group][tid] = count
+
+        starts = np.cumsum(sizes) - sizes
+        non_empty = sizes > 0
+        first_times = np.zeros(len(groups), dtype=np.int64)
+        last_times = np.zeros(len(groups), dtype=np.int64)
+        if non_empty.any():
+            first_times[non_empty] = np.minimum.reduceat(timestamps, starts[non_empty])
+            last_times[non_empty] = np.maximum.reduceat(timestamps, starts[non_empty])
+        return [cls(size, group_tid_counts, first_time, last_time) if size else cls()
+                for size, group_tid_counts, first_time, last_time in zip(sizes.tolist(), tid_counts,
+                                                                         first_times.tolist(), last_times.tolist())]
+
+    @classmethod
+    def merge(cls, rollups: Iterable['LogRollup']) -> 'LogRollup':
+        """
+        Combines the rollups of components, in the order their logs are concatenated.
+        """
+        merged = cls()
+        for rollup in rollups:
+            if not rollup:
+                continue
+            merged.count += rollup.count
+            for tid, count in rollup.tid_counts.items():
+                merged.tid_counts[tid] = merged.tid_counts.get(tid, 0) + count
+            if merged.first_time is None:
+                merged.first_time, merged.last_time = rollup.first_time, rollup.last_time
+            else:
+                merged.first_time = min(merged.first_time, rollup.first_time)
+                merged.last_time = max(merged.last_time, rollup.last_time)
+        return merged
+
+    @classmethod
+    def combine(cls, parts: Iterable['LogRollup']) -> 'LogRollup':
+        """
+        Like merge, but rollups are never modified once built, so a single non-empty part is shared.
+        """
+        parts = [rollup for rollup in parts if rollup.count]
+        if not parts:
+            return EMPTY_ROLLUP
+        if len(parts) == 1:
+            return parts[0]
+        return cls.merge(parts)
+
+    @property
+    def tids(self) -> List[int]:
+        return list(self.tid_counts)
+
+    def __bool__(self) -> bool:
+        return self.count > 0
+
+
+EMPTY_ROLLUP = LogRollup()
@@ -26,9 +26,5 @@ class Mcu(Component):
     def get_details(self) -> List[Component]:
         return [self.mcu_irqa, self.iqr, self.iqd, self.bin, *self.eqs]
 
-    def get_attribute_from_active_logs(self, attribute: str) -> List[Any]:
-        attributes = []
-        for inner_obj in self.get_details():
-            attributes.extend(inner_obj.get_attribute_from_active_logs(attribute))
-        attributes.extend(super().get_attribute_from_active_logs(attribute))
-        return attributes
\ No newline at end of file
+    def get_inner_components(self) -> List[Component]:
+        return self.get_details()
@@ -62,12 +62,5 @@ class Quad(Component):
         ]
         return cluster
 
-    def get_attribute_from_active_logs(self, attribute: str) -> List[Any]:
-        attributes = []
-        for row in self.clusters:
-            for cluster in row:
-                if cluster is None:
-                    continue
-                attributes.extend(cluster.get_attribute_from_active_logs(attribute))
-        attributes.extend(super().get_attribute_from_active_logs(attribute))
-        return attributes
+    def get_inner_components(self) -> List[Component]:
+        return [cluster for row in self.clusters for cluster in row if cluster is not None]
@@ -15,7 +15,7 @@ from gui.mcu_widget import McuInfoWidget
 from gui.packets_colors import get_colors_by_tids
 
 
-from utils.constants import TID, OBJECT_COLORS, LIGHTGRAY, WHITE, X_BUTTON, COMPONENT_LOGS, FORBIDDEN_CURSOR, POINTING_CURSOR, RED
+from utils.constants import OBJECT_COLORS, LIGHTGRAY, WHITE, X_BUTTON, COMPONENT_LOGS, FORBIDDEN_CURSOR, POINTING_CURSOR, RED
 from utils.type_names import MCU, LNB
 from utils.error_messages import ErrorMessages, WarningMessages
 
@@ -68,7 +68,7 @@ class ClusterInfoWidget(QWidget):
             components = self.cluster.get_details()
             for index_component, component in enumerate(components):
                 component_widget = ComponentWidget(component, component.type_name)
-                component_tids = component.get_attribute_from_active_logs(TID)
+                component_tids = component.rollup.tids
                 colors = list(get_colors_by_tids(component_tids))
                 back_color = colors[0] if colors else LIGHTGRAY
                 color = OBJECT_COLORS.get(component_widget.type_name, WHITE)
@@ -122,7 +122,7 @@ class ClusterInfoWidget(QWidget):
         try:
             if event.button() == Qt.LeftButton and component.type_name == MCU:
                 # Check if the component has logs
-                if not component.get_attribute_from_active_logs(TID):
+                if not component.rollup:
                     return  # Do nothing if there are no logs
 
                 self.show_mcu_info(component)
@@ -3,13 +3,13 @@ from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QMessageBox
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor, QMouseEvent
 
-from utils.constants import TID, PACKET, LIGHTGRAY, POINTING_CURSOR, COMPONENT_LOGS
+from utils.constants import LIGHTGRAY, POINTING_CURSOR, COMPONENT_LOGS
 from utils.error_messages import ErrorMessages
 
 from entities.cluster import Cluster
 
 from gui.log_colors_dialog import LogColorDialog
-from gui.packets_colors import get_colors_by_tids
+from gui.packets_colors import get_first_color
 
 from utils.filter_types import CLUSTER
 
@@ -18,12 +18,9 @@ class ClusterWidget(QWidget):
     def __init__(self, cluster: Cluster, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.cluster = cluster
-        self.cluster_tids = self.cluster.get_attribute_from_active_logs(TID)
-        self.colors = list(get_colors_by_tids(self.cluster_tids))  # Convert set to list
-        self.packet_messages = self.cluster.get_attribute_from_active_logs(PACKET)  # Fetch packet messages
+        self.back_color = LIGHTGRAY
         self.is_enable = False
-        if self.cluster.is_enable and self.colors:
-            self.is_enable = True
+        self.visible_state = None  # The (enabled, background color) the widget is styled with
         self.initUI()
 
     def initUI(self) -> None:
@@ -32,25 +29,13 @@ class ClusterWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)  # No margins
         self.setLayout(layout)
 
-        color = QColor(self.cluster.color)
-        text_color = color.name()
         self.label = QLabel(f'{self.cluster.type_name}\n{CLUSTER} {self.cluster.id}', self)
         self.label.setAlignment(Qt.AlignCenter)
-        text_color = text_color if self.is_enable else LIGHTGRAY
-        self.label.setStyleSheet(f'color: {text_color}; font-size: 12px;')
-
         layout.addWidget(self.label)
 
-        back_color = LIGHTGRAY
-        if self.colors:
-            back_color = self.colors[0]
-
-        self.setStyleSheet(f'background-color: {back_color}; border: 2px dashed {text_color};')
-
         self.setCursor(POINTING_CURSOR)
-
-        self.setEnabled(self.is_enable)
         self.mousePressEvent = self.show_log_messages
+        self.update_display()
 
     def show_log_messages(self, event: QMouseEvent) -> None:
         if event.button() == Qt.RightButton:
@@ -73,16 +58,26 @@ class ClusterWidget(QWidget):
         except Exception as e:
             self.show_error_message(ErrorMessages.ERROR_OCCURRED.value.format(error=e))
 
-    def update_display(self) -> None:
-        # Update display with new colors and packet messages
-        try:
-            self.colors = list(get_colors_by_tids(self.cluster.get_attribute_from_active_logs(TID)))
-            self.packet_messages = self.get_messages_by_packet()
-            back_color = self.colors[0] if self.colors else LIGHTGRAY
-            self.setStyleSheet(f'background-color: {back_color}; border: 2px dashed {self.cluster.color};')
-            self.label.setText(f'{self.cluster.type_name}\nCluster {self.cluster.id}')
-        except Exception as e:
-            self.show_error_message(ErrorMessages.ERROR_OCCURRED.value.format(error=e))
+    def update_display(self) -> bool:
+        """
+        Restyles the widget by the current rollup of the cluster.
+        Returns False without touching the widget if its visible state did not change.
+        """
+        back_color = get_first_color(self.cluster.rollup.tid_counts, LIGHTGRAY)
+        visible_state = (self.cluster.is_enable and bool(self.cluster.rollup), back_color)
+        if visible_state == self.visible_state:
+            return False
+        is_enable_changed = self.visible_state is None or visible_state[0] != self.is_enable
+        self.visible_state = visible_state
+        self.is_enable, self.back_color = visible_state
+
+        # Restyling is the costly part of a refresh, so the label is only touched when it changes
+        text_color = QColor(self.cluster.color).name() if self.is_enable else LIGHTGRAY
+        if is_enable_changed:
+            self.label.setStyleSheet(f'color: {text_color}; font-size: 12px;')
+            self.setEnabled(self.is_enable)
+        self.setStyleSheet(f'background-color: {back_color}; border: 2px dashed {text_color};')
+        return True
 
     def show_error_message(self, message: str) -> None:
         """Display an error message to the user in a popup."""
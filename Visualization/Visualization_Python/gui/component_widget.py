@@ -7,7 +7,7 @@ from typing import Optional
 from entities.component import Component
 
 from utils.error_messages import ErrorMessages
-from utils.constants import OBJECT_COLORS, TID, BLACK, WHITE, LIGHTGRAY, COMPONENT_LOGS, FORBIDDEN_CURSOR, ARROW_CURSOR
+from utils.constants import OBJECT_COLORS, BLACK, WHITE, LIGHTGRAY, COMPONENT_LOGS, FORBIDDEN_CURSOR, ARROW_CURSOR
 
 from gui.log_colors_dialog import LogColorDialog
 from gui.packets_colors import get_colors_by_tids
@@ -21,7 +21,7 @@ class ComponentWidget(QWidget):
 
         try:
             self.component = component
-            self.comp_tids = self.component.get_attribute_from_active_logs(TID)
+            self.comp_tids = self.component.rollup.tids
             self.colors = get_colors_by_tids(self.comp_tids)  # Fetch colors based on TIDs
         except Exception as e:
             self.show_error_dialog(ErrorMessages.ERROR.value,
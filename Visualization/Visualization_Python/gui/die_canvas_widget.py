@@ -0,0 +1,316 @@
+from PyQt5.QtCore import Qt, QRect, QPoint
+from PyQt5.QtGui import QColor, QFont, QMouseEvent, QPainter, QPaintEvent, QPen, QPixmap, QResizeEvent
+from PyQt5.QtWidgets import QWidget, QMainWindow, QMessageBox
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from entities.cluster import Cluster
+from entities.component import Component
+from entities.die import Die
+from entities.quad import Quad
+
+from gui.cluster_info_widget import ClusterInfoWidget
+from gui.log_colors_dialog import LogColorDialog
+from gui.packets_colors import get_first_color
+
+from utils.data_manager import DataManager
+from utils.constants import NUM_QUADS_PER_SIDE, NUM_CLUSTERS_PER_SIDE, EMPTY, COMPONENT_LOGS, LIGHTGRAY, GREEN, \
+    RED, BLACK, POINTING_CURSOR, FORBIDDEN_CURSOR
+from utils.error_messages import ErrorMessages
+from utils.filter_types import CLUSTER
+from utils.type_names import DIE, HBM
+
+MARGIN = 10
+MIN_QUAD_SIZE = 300
+QUAD_TITLE_HEIGHT = 20
+HBM_WIDTH_RATIO = 0.15
+BORDER_WIDTH = 2
+MIN_LABEL_CELL_SIZE = 40  # Cells smaller than this are painted without their label
+FONT_RATIO = 0.16
+HBM_DISABLED_TEXT = "darkgray"
+HBM_NO_COLOR = "grey"
+
+# Bits of a packed state: the background color in the low 24 bits and whether the component is enabled
+RGB_MASK = 0xFFFFFF
+ENABLED_BIT = 1 << 24
+
+
+class DieCanvasWidget(QWidget):
+    """
+    Paints the quads of a die and all their clusters on one widget.
+
+    The visible state of each quad, HBM and cluster is packed into one integer of an array, in the order of
+    self.components, so a refresh compares two arrays and repaints only the cells that changed.
+    Clicks are mapped to components by the cell geometry instead of a widget per component.
+    """
+
+    def __init__(self, data_manager: DataManager, dies: Dict[int, Die], main_window: QMainWindow) -> None:
+        super().__init__()
+        self.data_manager = data_manager
+        self.main_window = main_window
+        self.dies = dies
+        self.die_index = None  # The die whose quads are shown
+        self.quads: List[Optional[Quad]] = []  # The quads of the shown die, row by row
+        self.components: List[Component] = []  # Each quad with its HBM, followed by the clusters of all quads
+        self.states = np.zeros(0, dtype=np.uint32)
+        self.component_indices: Dict[Component, int] = {}
+        self.first_cluster_index = 0
+        self.rects: List[QRect] = []  # The rect of each component
+        self.tiles: Dict[int, Tuple[int, QPixmap]] = {}  # The state each cluster was painted in, with its painting
+        self.cluster_info_widget = None
+        self.colors: Dict[str, QColor] = {}
+        self.setMinimumSize(2 * MIN_QUAD_SIZE + 2 * MARGIN, 2 * MIN_QUAD_SIZE + 2 * MARGIN)
+        self.setMouseTracking(True)
+
+    def show_quads(self, die_index: int) -> None:
+        try:
+            die = self.dies.get(die_index)
+            if die is None:
+                raise ValueError(ErrorMessages.ERROR.value + ErrorMessages.OBJECT_IS_NONE.value.format(object=DIE))
+
+            self.die_index = die_index
+            self.quads = [die.quads[row][column] for row in range(NUM_QUADS_PER_SIDE)
+                          for column in range(NUM_QUADS_PER_SIDE)]
+            quads = [quad for quad in self.quads if quad is not None]
+            self.components = [component for quad in quads for component in (quad, quad.hbm)]
+            self.components += [cluster for quad in quads for row in quad.clusters for cluster in row
+                                 if cluster is not None]
+            self.component_indices = {component: index for index, component in enumerate(self.components)}
+            self.first_cluster_index = 2 * len(quads)
+            self.states = self.get_states()
+            self.layout_cells()
+            self.update()
+        except Exception as e:
+            self.show_error_dialog(ErrorMessages.ERROR.value, str(e))
+
+    def refresh(self) -> int:
+        """
+        Repaints the cells whose visible state changed with the current logs.
+        Returns how many cells changed.
+        """
+        if self.die_index is None or not self.isVisible():
+            return 0
+        states = self.get_states()
+        changed = np.flatnonzero(states != self.states)
+        self.states = states
+        for index in changed.tolist():
+            self.update(self.get_rect(self.components[index]))
+        return len(changed)
+
+    def get_states(self) -> np.ndarray:
+        states = np.zeros(len(self.components), dtype=np.uint32)
+        for index, component in enumerate(self.components):
+            rollup = component.rollup
+            if component.type_name == HBM:
+                back_color = get_first_color(rollup.tid_counts, HBM_NO_COLOR)
+                is_enable = bool(rollup)
+            else:
+                back_color = get_first_color(rollup.tid_counts, LIGHTGRAY)
+                is_enable = component.is_enable and bool(rollup)
+            states[index] = (self.get_color(back_color).rgb() & RGB_MASK) | (ENABLED_BIT if is_enable else 0)
+        return states
+
+    def get_color(self, name: str) -> QColor:
+        color = self.colors.get(name)
+        if color is None:
+            color = self.colors[name] = QColor(name)
+        return color
+
+    def is_enabled(self, component: Component) -> bool:
+        return bool(self.states[self.component_indices[component]] & ENABLED_BIT)
+
+    def get_back_color(self, component: Component) -> QColor:
+        return QColor(int(self.states[self.component_indices[component]]) & RGB_MASK)
+
+    def get_quad_size(self) -> int:
+        return max(0, min(self.width(), self.height()) - 2 * MARGIN) // NUM_QUADS_PER_SIDE
+
+    def get_quad_rect(self, quad_index: int) -> QRect:
+        size = self.get_quad_size()
+        left = (self.width() - NUM_QUADS_PER_SIDE * size) // 2
+        row, column = divmod(quad_index, NUM_QUADS_PER_SIDE)
+        return QRect(left + column * size, MARGIN + row * size, size, size)
+
+    def get_hbm_rect(self, quad_index: int) -> QRect:
+        # The HBM is on the outer side of the quad, like in the widget of a quad
+        quad_rect = self.get_quad_rect(quad_index)
+        width = int(quad_rect.width() * HBM_WIDTH_RATIO)
+        left = quad_rect.right() + 1 - width if self.is_right_side(quad_index) else quad_rect.left()
+        return QRect(left, quad_rect.top(), width, quad_rect.height())
+
+    def get_clusters_rect(self, quad_index: int) -> QRect:
+        quad_rect = self.get_quad_rect(quad_index)
+        hbm_width = self.get_hbm_rect(quad_index).width()
+        left = quad_rect.left() if self.is_right_side(quad_index) else quad_rect.left() + hbm_width
+        return QRect(left, quad_rect.top() + QUAD_TITLE_HEIGHT,
+                     quad_rect.width() - hbm_width, quad_rect.height() - QUAD_TITLE_HEIGHT)
+
+    def get_cluster_rect(self, quad_index: int, row: int, col: int) -> QRect:
+        clusters_rect = self.get_clusters_rect(quad_index)
+        width = clusters_rect.width() / NUM_CLUSTERS_PER_SIDE
+        height = clusters_rect.height() / NUM_CLUSTERS_PER_SIDE
+        left, top = clusters_rect.left() + int(col * width), clusters_rect.top() + int(row * height)
+        return QRect(left, top, clusters_rect.left() + int((col + 1) * width) - left,
+                     clusters_rect.top() + int((row + 1) * height) - top)
+
+    @staticmethod
+    def is_right_side(quad_index: int) -> bool:
+        return quad_index % NUM_QUADS_PER_SIDE == 1
+
+    def get_rect(self, component: Component) -> QRect:
+        """The rect a component is painted in."""
+        index = self.component_indices.get(component)
+        return self.rects[index] if index is not None else QRect()
+
+    def layout_cells(self) -> None:
+        """
+        Computes the rect of every component for the current size, in the order of self.components.
+        Tiles painted for another size are dropped.
+        """
+        self.rects = []
+        for quad_index, quad in enumerate(self.quads):
+            if quad is not None:
+                self.rects += [self.get_quad_rect(quad_index), self.get_hbm_rect(quad_index)]
+        for quad_index, quad in enumerate(self.quads):
+            if quad is not None:
+                self.rects += [self.get_cluster_rect(quad_index, cluster.row, cluster.col)
+                               for row in quad.clusters for cluster in row if cluster is not None]
+        self.tiles = {}
+
+    def component_at(self, pos: QPoint) -> Optional[Component]:
+        """
+        Hit-tests a position: returns the cluster or HBM under it, the quad if it is over the title of a quad,
+        or None.
+        """
+        for quad_index, quad in enumerate(self.quads):
+            if quad is None or not self.get_quad_rect(quad_index).contains(pos):
+                continue
+            if self.get_hbm_rect(quad_index).contains(pos):
+                return quad.hbm
+            clusters_rect = self.get_clusters_rect(quad_index)
+            if not clusters_rect.contains(pos):
+                return quad
+            row = (pos.y() - clusters_rect.top()) * NUM_CLUSTERS_PER_SIDE // clusters_rect.height()
+            col = (pos.x() - clusters_rect.left()) * NUM_CLUSTERS_PER_SIDE // clusters_rect.width()
+            return quad.clusters[row][col]
+        return None
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        painter = QPainter(self)
+        try:
+            dirty_rect = event.rect()
+            quad_indices = [quad_index for quad_index in range(len(self.quads))
+                            if self.get_quad_rect(quad_index).intersects(dirty_rect)]
+            for quad_index in quad_indices:
+                quad = self.quads[quad_index]
+                if quad is None:
+                    self.paint_empty_quad(painter, self.get_quad_rect(quad_index))
+                else:
+                    self.paint_quad(painter, quad_index, quad, dirty_rect)
+
+            # The clusters are painted from their tiles, only the tiles of changed clusters are painted again
+            for index in range(self.first_cluster_index, len(self.components)):
+                rect = self.rects[index]
+                if rect.intersects(dirty_rect):
+                    painter.drawPixmap(rect.topLeft(), self.get_tile(index))
+
+            for quad_index in quad_indices:
+                quad = self.quads[quad_index]
+                if quad is not None:
+                    color = GREEN if self.is_enabled(quad) else LIGHTGRAY
+                    self.paint_border(painter, self.get_rect(quad), self.get_color(color))
+        finally:
+            painter.end()
+
+    def paint_empty_quad(self, painter: QPainter, rect: QRect) -> None:
+        painter.fillRect(rect, self.get_color(RED))
+        painter.setPen(QPen(self.get_color(BLACK), 1, Qt.DashLine))
+        painter.drawRect(rect.adjusted(0, 0, -1, -1))
+        painter.drawText(rect, Qt.AlignCenter, EMPTY)
+
+    def paint_quad(self, painter: QPainter, quad_index: int, quad: Quad, dirty_rect: QRect) -> None:
+        painter.fillRect(self.get_rect(quad), self.get_back_color(quad))
+        clusters_rect = self.get_clusters_rect(quad_index)
+        painter.setPen(self.get_color(BLACK))
+        painter.drawText(QRect(clusters_rect.left(), clusters_rect.top() - QUAD_TITLE_HEIGHT, clusters_rect.width(),
+                               QUAD_TITLE_HEIGHT), Qt.AlignCenter, quad.name)
+
+        hbm_rect = self.get_rect(quad.hbm)
+        if hbm_rect.intersects(dirty_rect):
+            is_hbm_enable = self.is_enabled(quad.hbm)
+            painter.fillRect(hbm_rect, self.get_back_color(quad.hbm) if is_hbm_enable else self.get_color(LIGHTGRAY))
+            painter.setPen(self.get_color(BLACK if is_hbm_enable else HBM_DISABLED_TEXT))
+            painter.drawText(hbm_rect, Qt.AlignCenter, f'{quad.hbm.type_name}\n{quad.name[:2]}')
+
+    @staticmethod
+    def paint_border(painter: QPainter, rect: QRect, color: QColor) -> None:
+        painter.setPen(QPen(color, BORDER_WIDTH, Qt.DashLine))
+        painter.drawRect(rect.adjusted(BORDER_WIDTH // 2, BORDER_WIDTH // 2, -BORDER_WIDTH, -BORDER_WIDTH))
+
+    def get_tile(self, index: int) -> QPixmap:
+        """The painting of a cluster in its current state, painted again only when the state changed."""
+        state = self.states[index]
+        tile = self.tiles.get(index)
+        if tile is not None and tile[0] == state:
+            return tile[1]
+
+        cluster, rect = self.components[index], self.rects[index]
+        pixel_ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(rect.size() * pixel_ratio)
+        pixmap.setDevicePixelRatio(pixel_ratio)
+        pixmap.fill(self.get_back_color(cluster))
+        painter = QPainter(pixmap)
+        try:
+            tile_rect = QRect(QPoint(0, 0), rect.size())
+            text_color = self.get_color(cluster.color if self.is_enabled(cluster) else LIGHTGRAY)
+            self.paint_border(painter, tile_rect, text_color)
+            if min(rect.width(), rect.height()) >= MIN_LABEL_CELL_SIZE:
+                font = QFont(painter.font())
+                font.setPixelSize(max(1, int(min(rect.width(), rect.height()) * FONT_RATIO)))
+                painter.setFont(font)
+                painter.drawText(tile_rect, Qt.AlignCenter, f'{cluster.type_name}\n{CLUSTER} {cluster.id}')
+        finally:
+            painter.end()
+        self.tiles[index] = (state, pixmap)
+        return pixmap
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        self.layout_cells()
+        super().resizeEvent(event)
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        component = self.component_at(event.pos())
+        self.setCursor(POINTING_CURSOR if component is not None and self.is_enabled(component) else FORBIDDEN_CURSOR)
+        super().mouseMoveEvent(event)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        # Components without logs are disabled, like their widgets in the widget renderer
+        component = self.component_at(event.pos())
+        if component is None or not self.is_enabled(component):
+            return
+        try:
+            if event.button() == Qt.RightButton:
+                self.show_log_messages(component)
+            elif isinstance(component, Cluster):
+                self.show_cluster_info(component)
+        except Exception as e:
+            self.show_error_dialog(ErrorMessages.ERROR.value, ErrorMessages.ERROR_OCCURRED.value.format(error=e))
+
+    def show_log_messages(self, component: Component) -> None:
+        dialog = LogColorDialog(component, COMPONENT_LOGS.format(component=component.type_name), self)
+        dialog.exec_()
+
+    def show_cluster_info(self, cluster: Cluster) -> None:
+        self.cluster_info_widget = ClusterInfoWidget(cluster)
+        self.cluster_info_widget.show()
+
+    def show_error_dialog(self, title: str, message: str) -> None:
+        """Show an error dialog with the specified title and message."""
+        msg_box = QMessageBox(self)
+        msg_box.setIcon(QMessageBox.Critical)
+        msg_box.setText(message)
+        msg_box.setWindowTitle(title)
+        msg_box.setStandardButtons(QMessageBox.Ok)
+        msg_box.exec_()
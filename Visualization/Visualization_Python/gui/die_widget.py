@@ -10,7 +10,7 @@ from entities.die import Die
 from gui.quad_widget import QuadWidget
 
 from utils.data_manager import DataManager
-from utils.constants import BLACK, NUM_QUADS_PER_SIDE, EMPTY, QUADS, FORBIDDEN_CURSOR, POINTING_CURSOR
+from utils.constants import BLACK, NUM_QUADS_PER_SIDE, EMPTY, QUADS
 from utils.error_messages import ErrorMessages
 from utils.type_names import DIE
 
@@ -21,6 +21,8 @@ class DieWidget(QWidget):
         self.data_manager = data_manager
         self.main_window = main_window
         self.dies = dies
+        self.die_index = None  # The die whose quads are shown
+        self.quad_widgets = []  # The quad widgets of the shown die
         self.initUI()
 
     def initUI(self) -> None:
@@ -42,8 +44,10 @@ class DieWidget(QWidget):
             if die is None:
                 raise ValueError(ErrorMessages.ERROR.value + ErrorMessages.OBJECT_IS_NONE.value.format(object=DIE))
 
+            self.die_index = die_index
             # Clear previous widgets from the quad layout
             self.clear_layout(self.quad_layout)
+            self.quad_widgets = []
 
             # Display new matrix of the quads
             for row in range(NUM_QUADS_PER_SIDE):
@@ -51,10 +55,7 @@ class DieWidget(QWidget):
                     quad = die.quads[row][column]
                     if quad:
                         quad_widget = QuadWidget(quad, column == 1, self)  # Pass position (row, column)
-                        if quad.is_enable:
-                            quad_widget.setCursor(POINTING_CURSOR)
-                        else:
-                            quad_widget.setCursor(FORBIDDEN_CURSOR)
+                        self.quad_widgets.append(quad_widget)
                     else:
                         quad_widget = QLabel(EMPTY, self)
                         quad_widget.setAlignment(Qt.AlignCenter)
@@ -67,6 +68,15 @@ class DieWidget(QWidget):
         except Exception as e:
             self.show_error_dialog(ErrorMessages.ERROR.value, str(e))
 
+    def refresh(self) -> int:
+        """
+        Updates the shown quads in place with the current logs.
+        Returns how many widgets were restyled.
+        """
+        if self.die_index is None or not self.isVisible():
+            return 0
+        return sum(quad_widget.update_display() for quad_widget in self.quad_widgets)
+
     def clear_layout(self, layout: Optional[QGridLayout] = None) -> None:
         if layout is None:
             layout = self.quad_layout
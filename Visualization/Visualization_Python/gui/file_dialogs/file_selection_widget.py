@@ -1,21 +1,19 @@
 import os
-import shutil
 from pathlib import Path
 
-from PyQt5.QtCore import Qt, QThreadPool, QTimer
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont, QIcon, QPixmap
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QMessageBox, QFileDialog
 
 from utils.data_manager import DataManager
-from utils.paths import APP_ICON_IMAGE, LOADING_DATA_IMAGE, CHIP_DATA_JSON, DATA_DIR, LOGS_CSV_BASE, TEMP_LOGS_CSV_BASE, \
-    STYLES_DIR, FILE_SELECTION_CSS
+from utils.paths import APP_ICON_IMAGE, LOADING_DATA_IMAGE, CHIP_DATA_JSON, STYLES_DIR, FILE_SELECTION_CSS
 from utils.constants import SELECT_REQUIRED_FILES, SELECT_REQUIRED_FILES_MESSAGE, SL_FILE_MESSAGE, \
     BROWSE, CSV_FILE_MESSAGE, PROCEED, DOT_JSON, JSON, SELECT_FILE_MESSAGE, SL, \
-    LOGS, CSV, TYPE_FILE, DOT_CSV, READ
+    LOGS, CSV, TYPE_FILE, DOT_CSV, READ, LOAD_DATA_JOB
 from utils.error_messages import ErrorMessages, SuccessMessages, WarningMessages
 
 from gui.main_window import MainWindow
-from gui.worker_thread import WorkerThread
+from gui.job_executor import JobExecutor
 
 
 class FileSelectionWidget(QWidget):
@@ -24,7 +22,7 @@ class FileSelectionWidget(QWidget):
 
         self.sl_file = None
         self.csv_file = None
-        self.threadpool = QThreadPool()
+        self.executor = JobExecutor.global_instance()
         self.setWindowTitle(SELECT_REQUIRED_FILES)
         icon_path = os.path.join(os.getcwd(), APP_ICON_IMAGE)
         self.setWindowIcon(QIcon(icon_path))
@@ -126,28 +124,11 @@ class FileSelectionWidget(QWidget):
                     self.show_error(ErrorMessages.SELECTED_FILE_ERROR.value.format(file_name=LOGS, type_file=CSV))
                     return
 
-                destination_dir = Path(os.getcwd()) / DATA_DIR
-                destination_dir.mkdir(exist_ok=True)
-
-                base_name = LOGS_CSV_BASE
-                destination_file = destination_dir / base_name
-                temp_file = destination_dir / TEMP_LOGS_CSV_BASE
-
-                try:
-                    shutil.copy(file, temp_file)
-                    if destination_file.exists():
-                        destination_file.unlink()
-
-                    temp_file.rename(destination_file)
-                    self.csv_file = destination_file
-                    self.csv_file_input.setText(self.csv_file.name)
-                    self.check_files_selected()
-                    self.show_success(SuccessMessages.FILE_SELECTED_SUCCESSFULLY.value.format(file_name=LOGS))
-
-                except OSError as e:
-                    self.show_error(ErrorMessages.ERROR_OCCURRED.value.format(error=e))
-                    if temp_file.exists():
-                        temp_file.unlink()
+                # The logs are read from the selected file itself, with no copy of it
+                self.csv_file = Path(file)
+                self.csv_file_input.setText(self.csv_file.name)
+                self.check_files_selected()
+                self.show_success(SuccessMessages.FILE_SELECTED_SUCCESSFULLY.value.format(file_name=LOGS))
 
         except Exception as e:
             self.show_error(ErrorMessages.ERROR_OCCURRED.value.format(error=e))
@@ -168,17 +149,19 @@ class FileSelectionWidget(QWidget):
 
     def perform_action_with_wait(self, action, *args):
         self.show_loading_overlay()
-        self.worker_thread = WorkerThread(action, args)
-        self.worker_thread.finished.connect(self.on_data_manager_created)
-        self.worker_thread.start()
+        self.job = self.executor.create_job(LOAD_DATA_JOB, action, *args)
+        self.job.signals.result.connect(self.on_data_manager_created)
+        self.job.signals.error.connect(self.on_error)
+        self.executor.start(self.job)
 
     def create_data_manager(self, *args):
         """Create the data manager instance."""
-        self.data_menager = DataManager(*args)
+        return DataManager(*args)
 
-    def on_data_manager_created(self):
+    def on_data_manager_created(self, data_manager):
         """Handle success and open the main window."""
         # self.hide_loading_overlay()
+        self.data_menager = data_manager
         main_window = MainWindow(self.data_menager)
         main_window.showMaximized()
         self.close()
@@ -186,7 +169,7 @@ class FileSelectionWidget(QWidget):
     def on_error(self, error_message):
         """Handle errors that occur during processing."""
         self.hide_loading_overlay()
-        self.show_error(ErrorMessages.ERROR_OCCURRED.value.format(error=e))
+        self.show_error(ErrorMessages.ERROR_OCCURRED.value.format(error=error_message))
 
     def show_loading_overlay(self):
         """Show a loading overlay with an image while processing."""
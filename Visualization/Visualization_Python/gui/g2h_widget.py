@@ -7,7 +7,7 @@ from entities.component import Component
 from entities.g2h import G2h
 
 from utils.error_messages import ErrorMessages
-from utils.constants import OBJECT_COLORS, TID, PACKET, UNKNOWN, CLOSE, BLACK, WHITE, VIEW_LOGS, COMPONENT_LOGS, POINTING_CURSOR
+from utils.constants import OBJECT_COLORS, UNKNOWN, CLOSE, BLACK, WHITE, VIEW_LOGS, COMPONENT_LOGS, POINTING_CURSOR
 from utils.type_names import G2H
 
 from gui.component_widget import ComponentWidget
@@ -21,9 +21,8 @@ class G2hWidget(QWidget):
         super().__init__(parent)
         self.g2h = g2h
         try:
-            self.g2h_tids = self.g2h.get_attribute_from_active_logs(TID)
+            self.g2h_tids = self.g2h.rollup.tids
             self.colors = get_colors_by_tids(self.g2h_tids)  # Fetch colors
-            self.packet_messages = self.g2h.get_attribute_from_active_logs(PACKET)  # Fetch packet messages
         except Exception as e:
             self.show_error_dialog(
                 ErrorMessages.ERROR.value + ErrorMessages.FAILED_TO_RETIEVE_ATTRIBUTE.value.format(attribute="G2H attributes", error=str(e))
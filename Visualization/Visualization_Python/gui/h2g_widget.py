@@ -6,7 +6,7 @@ from PyQt5.QtCore import Qt, QSize, QPoint
 from entities.component import Component
 from entities.h2g import H2g
 
-from utils.constants import OBJECT_COLORS, TID, PACKET, CLOSE, BLACK, WHITE, VIEW_LOGS,POINTING_CURSOR,COMPONENT_LOGS
+from utils.constants import OBJECT_COLORS, CLOSE, BLACK, WHITE, VIEW_LOGS,POINTING_CURSOR,COMPONENT_LOGS
 from utils.type_names import H2G
 from utils.error_messages import ErrorMessages
 
@@ -19,9 +19,8 @@ class H2gWidget(QWidget):
     def __init__(self, h2g: H2g, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.h2g = h2g
-        self.h2g_tids = self.h2g.get_attribute_from_active_logs(TID)  # Fetch TID attributes from logs
+        self.h2g_tids = self.h2g.rollup.tids  # Distinct TIDs of the logs
         self.colors = get_colors_by_tids(self.h2g_tids)  # Fetch colors for TIDs
-        self.packet_messages = self.h2g.get_attribute_from_active_logs(PACKET)  # Fetch packet messages
         self.initUI()
 
     def initUI(self) -> None:
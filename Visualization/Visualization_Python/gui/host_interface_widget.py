@@ -11,7 +11,7 @@ from gui.h2g_widget import H2gWidget
 from gui.log_colors_dialog import LogColorDialog
 from gui.packets_colors import get_colors_by_tids
 
-from utils.constants import OBJECT_COLORS, TID, PACKET, LIGHTGRAY, WHITE, BLACK, COMPONENT_LOGS, VIEW_LOGS, FORBIDDEN_CURSOR, POINTING_CURSOR
+from utils.constants import OBJECT_COLORS, LIGHTGRAY, WHITE, BLACK, COMPONENT_LOGS, VIEW_LOGS, FORBIDDEN_CURSOR, POINTING_CURSOR
 from utils.type_names import HOST_INTERFACE, H2G, G2H, BMT, PCIE
 from utils.error_messages import ErrorMessages
 
@@ -20,13 +20,12 @@ class HostInterfaceWidget(QWidget):
     def __init__(self, host_interface: HostInterface, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.host_interface = host_interface
-        self.host_interface_tids = self.host_interface.get_attribute_from_active_logs(TID)
+        self.host_interface_tids = self.host_interface.rollup.tids
         self.colors = list(get_colors_by_tids(self.host_interface_tids))
         self.colors_bmt = list(self.get_colors(self.host_interface.bmt))
         self.colors_H2G = list(self.get_colors(self.host_interface.h2g))
         self.colors_G2H = list(self.get_colors(self.host_interface.g2h))
         self.colors_pcie = list(self.get_colors(self.host_interface.pcie))
-        self.packet_messages = self.host_interface.get_attribute_from_active_logs(PACKET)
 
         self.color_map = self.create_color_map()
         self.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -115,7 +114,7 @@ class HostInterfaceWidget(QWidget):
         context_menu.exec_(self.mapToGlobal(point))
 
     def get_colors(self, data) -> list:
-        data_tids = data.get_attribute_from_active_logs(TID)
+        data_tids = data.rollup.tids
         return list(get_colors_by_tids(data_tids))
 
     def show_error_dialog(self, title: str, message: str) -> None:
@@ -146,7 +145,7 @@ class HostInterfaceWidget(QWidget):
         else:
             background_color = LIGHTGRAY  # Default color if type_name is unrecognized
 
-        if not component.get_attribute_from_active_logs(TID):
+        if not component.rollup:
             background_color = LIGHTGRAY
             clickable = False
 
@@ -0,0 +1,100 @@
+import threading
+import time
+from typing import Dict
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from utils.constants import JOB_POOL_MAX_THREADS
+
+
+class JobSignals(QObject):
+    result = pyqtSignal(object)  # Signal emitted with the value returned by the action.
+    error = pyqtSignal(str)  # Signal emitted instead of 'result' when the action raised.
+    progress = pyqtSignal(object)  # Signal emitted with each value the action reports while it runs.
+    finished = pyqtSignal()  # Signal emitted last, after 'result' or 'error'.
+
+
+class JobTimings:
+    """
+    Queue wait time and run time of the jobs, summed by job type.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.by_type: Dict[str, Dict[str, float]] = {}
+
+    def record(self, job_type: str, wait_seconds: float, run_seconds: float) -> None:
+        with self.lock:
+            timing = self.by_type.setdefault(job_type, {'count': 0, 'wait': 0.0, 'run': 0.0,
+                                                        'max_wait': 0.0, 'max_run': 0.0})
+            timing['count'] += 1
+            timing['wait'] += wait_seconds
+            timing['run'] += run_seconds
+            timing['max_wait'] = max(timing['max_wait'], wait_seconds)
+            timing['max_run'] = max(timing['max_run'], run_seconds)
+
+    def get_summary(self) -> Dict[str, Dict[str, float]]:
+        with self.lock:
+            return {job_type: dict(timing) for job_type, timing in self.by_type.items()}
+
+
+class Job(QRunnable):
+    def __init__(self, job_type: str, action, args, timings: JobTimings, report_progress: bool):
+        """Initialize the Job with an action and its arguments."""
+        super().__init__()
+        self.setAutoDelete(False)  # The executor keeps the job until its signals were delivered.
+        self.job_type = job_type
+        self.action = action
+        self.args = args
+        self.timings = timings
+        self.report_progress = report_progress  # Pass the action a report_progress callback.
+        self.signals = JobSignals()
+        self.submitted_at = time.perf_counter()
+
+    def run(self):
+        """Run the action in a thread of the pool."""
+        started_at = time.perf_counter()
+        try:
+            kwargs = {'report_progress': self.signals.progress.emit} if self.report_progress else {}
+            result = self.action(*self.args, **kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.timings.record(self.job_type, started_at - self.submitted_at, time.perf_counter() - started_at)
+            self.signals.finished.emit()
+
+
+class JobExecutor(QObject):
+    """
+    Runs the data operations of the GUI on a bounded pool of reused threads.
+    """
+    _global_instance = None
+
+    def __init__(self, max_threads: int = JOB_POOL_MAX_THREADS):
+        super().__init__()
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_threads)
+        self.timings = JobTimings()
+        self.jobs = set()
+
+    @classmethod
+    def global_instance(cls) -> 'JobExecutor':
+        if cls._global_instance is None:
+            cls._global_instance = cls()
+        return cls._global_instance
+
+    def create_job(self, job_type: str, action, *args, report_progress: bool = False) -> Job:
+        """Create a job for the action. Connect to its signals and then pass it to start."""
+        return Job(job_type, action, args, self.timings, report_progress)
+
+    def start(self, job: Job) -> None:
+        """Queue the job on the pool. It runs as soon as a thread is free."""
+        self.jobs.add(job)
+        job.signals.finished.connect(lambda: self.jobs.discard(job))
+        job.submitted_at = time.perf_counter()
+        self.pool.start(job)
+
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        return self.pool.waitForDone(timeout_ms)
@@ -0,0 +1,86 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from gui.job_executor import JobExecutor
+from utils.cancellation import CancellationToken, JobCancelled
+
+
+class JobScheduler(QObject):
+    """
+    Runs the data manager actions that relink the logs on the job executor, one job at a time.
+
+    A new request cancels the running job and every request still waiting, so only the latest one links.
+    The actions of cancelled requests still run, in order, because they change the filters cumulatively,
+    but their linking stops at its first check.
+    """
+    result_ready = pyqtSignal(object)  # Signal emitted with the linking of the latest request.
+    progress = pyqtSignal(object)  # Signal emitted with the LinkingProgress of the latest request.
+    failed = pyqtSignal(str)  # Signal emitted with the error of a job that failed.
+    idle = pyqtSignal()  # Signal emitted once no job is running or waiting.
+
+    def __init__(self, data_manager, executor: JobExecutor = None):
+        super().__init__()
+        self.data_manager = data_manager
+        self.executor = executor or JobExecutor.global_instance()
+        self.waiting_requests = []  # (token, action, args) of the requests that did not start yet
+        self.running_requests = []
+        self.job = None
+
+    def submit(self, action, *args) -> CancellationToken:
+        """Request an action, superseding every earlier request."""
+        for token, _, _ in self.running_requests + self.waiting_requests:
+            token.cancel()
+        token = CancellationToken()
+        self.waiting_requests.append((token, action, args))
+        if self.job is None:
+            self.start_waiting_requests()
+        return token
+
+    def is_busy(self) -> bool:
+        return self.job is not None
+
+    def start_waiting_requests(self):
+        self.running_requests, self.waiting_requests = self.waiting_requests, []
+        # Timed by the latest action, the one the user waits for
+        _, action, _ = self.running_requests[-1]
+        self.job = self.executor.create_job(getattr(action, '__name__', str(action)), self.run_requests,
+                                            self.running_requests, report_progress=True)
+        self.job.signals.progress.connect(self.on_progress)
+        self.job.signals.result.connect(self.on_requests_done)
+        self.job.signals.error.connect(self.failed)
+        self.job.signals.finished.connect(self.on_job_finished)
+        self.executor.start(self.job)
+
+    def run_requests(self, requests, report_progress):
+        """
+        Run in a thread of the executor. Returns the linking of the last request, if it was not cancelled and did
+        not fail, and the error of the last request that failed. A failed request does not stop the ones after it.
+        """
+        linked_logs, error = None, None
+        for token, action, args in requests:
+            try:
+                linked_logs = self.data_manager.build_linked_logs(action, *args, cancellation_token=token,
+                                                                  report_progress=report_progress)
+            except JobCancelled:
+                linked_logs = None
+            except Exception as e:
+                linked_logs, error = None, str(e)
+        return linked_logs, error
+
+    def on_progress(self, progress):
+        if self.running_requests and not self.waiting_requests and not self.running_requests[-1][0].is_cancelled:
+            self.progress.emit(progress)
+
+    def on_requests_done(self, outcome):
+        linked_logs, error = outcome
+        if error is not None:
+            self.failed.emit(error)
+        if linked_logs is not None and not self.waiting_requests:
+            self.result_ready.emit(linked_logs)
+
+    def on_job_finished(self):
+        self.job = None
+        self.running_requests = []
+        if self.waiting_requests:
+            self.start_waiting_requests()
+        else:
+            self.idle.emit()
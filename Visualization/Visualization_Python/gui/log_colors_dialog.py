@@ -1,39 +1,54 @@
-from PyQt5.QtCore import Qt, QTimer
+import threading
+
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QWidget, QTextEdit, QScrollArea, QGridLayout, QPushButton, QLineEdit, QLabel
+    QDialog, QVBoxLayout, QWidget, QScrollArea, QGridLayout, QPushButton, QLineEdit, QLabel, QTableView,
+    QAbstractItemView, QHeaderView
 )
-from typing import List
+from typing import Optional
+
+import numpy as np
 
+from gui.job_executor import JobExecutor
+from gui.log_list_model import LogListModel, LogItemDelegate, ROW_HEIGHT
 from gui.packets_colors import get_colors_by_tids
 
-from utils.constants import TID, PACKET, BLACK, WHITE, LIGHTGRAY,POINTING_CURSOR
+from utils.constants import BLACK, WHITE, LIGHTGRAY,POINTING_CURSOR, SEARCH_DEBOUNCE_MS, SEARCH_PACKETS_JOB
+from utils.log_store import LogViewChain
+from utils.packet_index import PacketIndex
 from utils.paths import SEARCH_ICON_IMAGE
 
 
 class LogColorDialog(QDialog):
+    search_done = pyqtSignal()  # Signal emitted when the logs of the latest search are listed.
+
     def __init__(self, data, title: str, parent=None) -> None:
         super().__init__(parent)
         self.data = data
         self.title = title
         self.is_dark_mode = False
-        self.current_animation = None
-        self.all_packets = []
-        self.all_colors = []
-        self.displayed_packets = []
-        self.displayed_colors = []
-        self.current_index = 0
-        self.batch_size = 20
+        self.logs = LogViewChain(self.data.get_active_log_views())
+        self.model = LogListModel(self.logs, self)
+        # Built by the first search and reused by the next ones
+        self.packet_index: Optional[PacketIndex] = None
+        self.packet_index_lock = threading.Lock()
+        self.search_id = 0  # Only the results of the latest search are listed
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.start_search)
         self.initUI()
 
     def initUI(self) -> None:
         try:
-            self.tids = self.data.get_attribute_from_active_logs(TID)
-            self.all_packets = self.data.get_attribute_from_active_logs(PACKET)
-            self.all_colors = list(get_colors_by_tids(self.tids))
+            # The rollup has the distinct TIDs in the order of the logs, without reading the logs
+            tids = self.data.rollup.tids
+            if self.data.rollup.count != len(self.logs):
+                tids = list(dict.fromkeys(self.logs.get_tids().tolist()))
             self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
-            color_tid_map = {color: set() for color in self.all_colors}
-            for tid, color in zip(self.tids, self.all_colors):
-                color_tid_map[color].add(tid)
+            color_tid_map = {}
+            for tid, color in zip(tids, get_colors_by_tids(tids)):
+                color_tid_map.setdefault(color, set()).add(tid)
 
             self.setWindowTitle(self.title)
             dialog_layout = QVBoxLayout(self)
@@ -108,16 +123,32 @@ class LogColorDialog(QDialog):
             header_scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
             dialog_layout.addWidget(header_scroll_area)
 
-            # Content area for logs
-            self.content_widget = QWidget()
-            self.content_layout = QVBoxLayout(self.content_widget)
+            # Content area for logs, only the rows in sight are painted.
+            # A table view with fixed row heights does not lay out every row, unlike a list view.
+            self.log_list = QTableView()
+            self.log_list.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            self.log_list.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+            self.log_list.setModel(self.model)
+            self.log_list.setItemDelegate(LogItemDelegate(self.log_list))
+            self.log_list.verticalHeader().hide()
+            self.log_list.horizontalHeader().setStretchLastSection(True)
+            self.log_list.horizontalHeader().hide()
+            self.log_list.setShowGrid(False)
+            self.log_list.setSelectionBehavior(QAbstractItemView.SelectRows)
+            self.log_list.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+            self.log_list.setFixedHeight(350)
+            self.log_list.setStyleSheet("background-color: transparent; border: none;")
+            dialog_layout.addWidget(self.log_list)
 
-            scroll_area = QScrollArea()
-            scroll_area.setWidgetResizable(True)
-            scroll_area.setWidget(self.content_widget)
-            scroll_area.setFixedHeight(350)
-            scroll_area.setStyleSheet("background-color: transparent; border: none;")
-            dialog_layout.addWidget(scroll_area)
+            self.no_logs_message = QLabel("No logs available")
+            self.no_logs_message.setAlignment(Qt.AlignCenter)  # Center the text
+            self.no_logs_message.setStyleSheet("""
+                font-size: 24px;  /* Larger font size */
+                font-weight: bold;  /* Bold text */
+                color: red;  /* Change the text color if needed */
+            """)
+            self.no_logs_message.setFixedHeight(350)
+            dialog_layout.addWidget(self.no_logs_message)
 
             # Show All Logs button
             self.show_all_button = QPushButton("Show All Logs")
@@ -148,74 +179,72 @@ class LogColorDialog(QDialog):
             self.setStyleSheet(f"background-color: {WHITE}; color: {BLACK};")
 
             # Initialize with all logs
-            self.update_content(self.all_packets, self.all_colors)
+            self.update_content(None)
 
         except Exception as e:
             print(f"Error initializing UI: {e}")
 
     def handle_tid_selection(self, tids: set) -> None:
-        if self.current_animation:
-            self.current_animation.stop()
-
-        filtered_packets = [pkt for idx, pkt in enumerate(self.all_packets) if self.tids[idx] in tids]
-        filtered_colors = [color for idx, color in enumerate(self.all_colors) if self.tids[idx] in tids]
-
-        self.update_content(filtered_packets, filtered_colors)
+        self.cancel_search()
+        self.update_content(np.flatnonzero(np.isin(self.logs.get_tids(), list(tids))))
 
     def show_all_logs(self) -> None:
-        self.update_content(self.all_packets, self.all_colors)
+        self.cancel_search()
+        self.update_content(None)
 
-    def update_content(self, packets: List[str], colors: List[str]) -> None:
-        try:
-            self.clear_content()
-            self.displayed_packets = packets
-            self.displayed_colors = colors
-            self.current_index = 0
+    def cancel_search(self) -> None:
+        # A search that is waiting or running does not list its logs over the ones listed now
+        self.search_timer.stop()
+        self.search_id += 1
 
+    def update_content(self, positions: Optional[np.ndarray]) -> None:
+        """
+        Lists the logs at the given positions, or all the logs for None.
+        """
+        try:
+            self.model.set_positions(positions)
+            self.log_list.scrollToTop()
             # Check if there are no logs available
-            if not packets:
-                no_logs_message = QLabel("No logs available")
-                no_logs_message.setAlignment(Qt.AlignCenter)  # Center the text
-                no_logs_message.setStyleSheet("""
-                    font-size: 24px;  /* Larger font size */
-                    font-weight: bold;  /* Bold text */
-                    color: red;  /* Change the text color if needed */
-                """)
-                self.content_layout.addWidget(no_logs_message)
-                return  # Exit the method since there are no logs to display
-
-            self.load_next_batch()
-
-            # Start a timer to load more logs
-            self.current_animation = QTimer()
-            self.current_animation.timeout.connect(self.load_next_batch)
-            self.current_animation.start(100)  # Load a new batch every 100ms
+            has_logs = self.model.rowCount() > 0
+            self.log_list.setVisible(has_logs)
+            self.no_logs_message.setVisible(not has_logs)
         except Exception as e:
             print(f"Error updating content: {e}")
-    def clear_content(self):
-        while self.content_layout.count():
-            child = self.content_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-    def load_next_batch(self):
-        end_index = min(self.current_index + self.batch_size, len(self.displayed_packets))
-        for i in range(self.current_index, end_index):
-            text_edit = QTextEdit()
-            text_edit.setReadOnly(True)
-            text_edit.setFixedHeight(100)
-            text_edit.setStyleSheet(f"background-color: {self.displayed_colors[i]}; border: none; color: {BLACK};")
-            text_edit.setPlainText(self.displayed_packets[i])
-            self.content_layout.addWidget(text_edit)
-
-        self.current_index = end_index
-        if self.current_index >= len(self.displayed_packets):
-            self.current_animation.stop()
 
     def filter_logs(self, text: str) -> None:
-        filtered_packets = [pkt for pkt in self.all_packets if text.lower() in pkt.lower()]
-        filtered_colors = [self.all_colors[i] for i, pkt in enumerate(self.all_packets) if text.lower() in pkt.lower()]
-        self.update_content(filtered_packets, filtered_colors)
+        # Searches once the typing pauses
+        self.search_timer.start()
+
+    def start_search(self) -> None:
+        """
+        Searches the packets for the text of the search bar on the job pool.
+        """
+        self.search_id += 1
+        text = self.search_bar.text()
+        if not text:
+            self.update_content(None)
+            self.search_done.emit()
+            return
+        job = JobExecutor.global_instance().create_job(SEARCH_PACKETS_JOB, self.search_packets, self.search_id, text)
+        job.signals.result.connect(self.on_search_done)
+        job.signals.error.connect(lambda error: print(f"Error searching logs: {error}"))
+        JobExecutor.global_instance().start(job)
+
+    def search_packets(self, search_id: int, text: str):
+        """
+        Runs on the job pool. Returns the id of the search with the positions of the matching logs.
+        """
+        with self.packet_index_lock:
+            if self.packet_index is None:
+                self.packet_index = PacketIndex(self.logs)
+            return search_id, self.packet_index.search(text)
+
+    def on_search_done(self, result) -> None:
+        search_id, positions = result
+        if search_id != self.search_id:
+            return
+        self.update_content(positions)
+        self.search_done.emit()
 
     def toggle_dark_and_light_mode(self) -> None:
         self.is_dark_mode = not self.is_dark_mode
@@ -0,0 +1,85 @@
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QVariant
+from PyQt5.QtGui import QBrush, QColor, QPainter
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QStyle
+
+from typing import Any, Optional
+
+import numpy as np
+
+from gui.packets_colors import get_brush
+
+from utils.constants import BLACK, LIGHTGRAY
+from utils.log_store import LogViewChain
+
+ROW_HEIGHT = 100
+ROW_MARGIN = 4
+TEXT_PADDING = 8
+
+
+class LogListModel(QAbstractListModel):
+    """
+    The packets of a chain of logs as a one column model, optionally narrowed to some of the logs.
+
+    Only the rows a view shows are asked for, and each one reads its packet from the LogStore then,
+    so the size of the model does not depend on the number of logs.
+    """
+
+    def __init__(self, logs: LogViewChain, parent=None) -> None:
+        super().__init__(parent)
+        self.logs = logs
+        self.positions: Optional[np.ndarray] = None  # The positions of the listed logs in the chain, None for all
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.logs) if self.positions is None else len(self.positions)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemNeverHasChildren
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return QVariant()
+        position = index.row() if self.positions is None else int(self.positions[index.row()])
+        if role == Qt.DisplayRole:
+            return self.logs.get_packet(position)
+        if role == Qt.BackgroundRole:
+            return self.get_brush(self.logs.get_tid(position))
+        if role == Qt.ForegroundRole:
+            return QBrush(QColor(BLACK))
+        return QVariant()
+
+    def get_brush(self, tid: int) -> QBrush:
+        return get_brush(tid)
+
+    def set_positions(self, positions: Optional[np.ndarray]) -> None:
+        """
+        Lists the logs at the given positions of the chain, or all the logs for None.
+        """
+        self.beginResetModel()
+        self.positions = positions
+        self.endResetModel()
+
+
+class LogItemDelegate(QStyledItemDelegate):
+    """
+    Paints a log as a block of its TID color with the wrapped packet text.
+    """
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        painter.save()
+        try:
+            rect = option.rect.adjusted(0, ROW_MARGIN // 2, 0, -ROW_MARGIN // 2)
+            background = index.data(Qt.BackgroundRole)
+            painter.fillRect(rect, background if isinstance(background, QBrush) else QBrush(QColor(LIGHTGRAY)))
+            if option.state & QStyle.State_Selected:
+                painter.fillRect(rect, option.palette.highlight().color().lighter(170))
+            painter.setPen(index.data(Qt.ForegroundRole).color())
+            painter.setClipRect(rect)
+            painter.drawText(rect.adjusted(TEXT_PADDING, TEXT_PADDING, -TEXT_PADDING, -TEXT_PADDING),
+                             Qt.AlignLeft | Qt.AlignTop | Qt.TextWrapAnywhere, index.data(Qt.DisplayRole))
+        finally:
+            painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), ROW_HEIGHT)
@@ -1,7 +1,7 @@
 import os
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QApplication, QMainWindow, QLabel,
-    QPushButton, QToolBar, QSizePolicy, QMessageBox
+    QPushButton, QToolBar, QSizePolicy, QMessageBox, QProgressBar
 )
 from PyQt5.QtCore import QSize
 from PyQt5.QtGui import QIcon
@@ -9,6 +9,7 @@ from PyQt5.QtCore import QPropertyAnimation
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QMovie
 
+from gui.die_canvas_widget import DieCanvasWidget
 from gui.die_widget import DieWidget
 from gui.host_interface_widget import HostInterfaceWidget
 from gui.log_colors_dialog import LogColorDialog
@@ -16,15 +17,15 @@ from gui.timeline_widget import TimelineWidget
 from gui.filter_menu_widget import FilterMenuWidget
 from gui.packets_colors import get_colors_by_tids
 from gui.file_dialogs.info_widget import InfoDialog
-from gui.worker_thread import WorkerThread
+from gui.job_scheduler import JobScheduler
 
 from utils.data_manager import DataManager
 from utils.paths import APP_ICON_IMAGE, INSTRUCTIONS_ICON_IMAGE, LOADING_ICON_IMAGE, STYLES_CSS
 from utils.type_names import HOST_INTERFACE, DIE1, DIE2, DIE2DIE, DIE
-from utils.constants import TID, PACKET, LIGHTGRAY, WHITE, BLACK, FORBIDDEN_CURSOR, SIMULATOR, MAIN_TOOLBAR, \
+from utils.constants import PACKET, LIGHTGRAY, WHITE, BLACK, FORBIDDEN_CURSOR, SIMULATOR, MAIN_TOOLBAR, \
     FILTER, GRAY, READ, MAIN_WINDOW, FILTER_MENU_WIDGET, HOST_INTERFACE_WIDGET, DIE_WIDGET, \
     TIME_LINE_WIDGET, UTF_8, TRANSPARENT, DIES, ANIMATION, WAIT_PROCESSING, TOOL_BAR, LIGHTBLUE, CLIK_FOR_INSTRUCTIONS, \
-    COMPONENT_LOGS, OVERLAY
+    COMPONENT_LOGS, OVERLAY, PROGRESS_BAR_RANGE, DIE_RENDERER, CANVAS_RENDERER
 from utils.error_messages import ErrorMessages, WarningMessages
 
 
@@ -37,12 +38,19 @@ class MainWindow(QMainWindow):
             super().__init__()
             self.die_widget = None
             self.data_manager = data_manager
+            self.job_scheduler = JobScheduler(data_manager)
+            self.job_scheduler.result_ready.connect(self.on_linked_logs_ready)
+            self.job_scheduler.progress.connect(self.on_linking_progress)
+            self.job_scheduler.failed.connect(self.on_action_failed)
+            self.job_scheduler.idle.connect(self.on_action_finished)
             self.is_closing = False
             self.host_interface_widget = None
             self.dies = {}
             self.load_dies()
             self.initUI()
             self.fade_in()
+            # The logs are linked in the background, showing the logs read so far while the file is read
+            self.perform_action_with_wait(self.data_manager.refresh_logs)
         except Exception as e:
             self.show_error_message(ErrorMessages.INITIALIZING.value.format(file_name=MAIN_WINDOW, error=str(e)))
             self.dies = {}
@@ -74,7 +82,8 @@ class MainWindow(QMainWindow):
 
             try:
                 self.host_interface_widget = HostInterfaceWidget(self.data_manager.host_interface)
-                self.die_widget = DieWidget(self.data_manager, self.dies, self)
+                die_widget_class = DieCanvasWidget if DIE_RENDERER == CANVAS_RENDERER else DieWidget
+                self.die_widget = die_widget_class(self.data_manager, self.dies, self)
                 self.die_widget.setVisible(False)
             except Exception as e:
                 self.show_warning_message(
@@ -239,7 +248,7 @@ class MainWindow(QMainWindow):
 
     def has_active_logs(self, data) -> bool:
         """Check if there are active logs in the given data"""
-        return bool(data.get_attribute_from_active_logs(TID))  # Adjust the method as necessary
+        return bool(data.rollup)
 
     def create_toolbar_button(self, text: str, click_action, index: int = None) -> QPushButton:
         button = QPushButton(text)
@@ -258,19 +267,19 @@ class MainWindow(QMainWindow):
             return []
         die_data = self.dies.get(index)
         if die_data:
-            tids = die_data.get_attribute_from_active_logs(TID)
+            tids = die_data.rollup.tids
             return list(get_colors_by_tids(tids))
         return []
 
     def get_data_colors(self, data) -> list:
-        tids = data.get_attribute_from_active_logs(TID)
+        tids = data.rollup.tids
         return list(get_colors_by_tids(tids))
 
     def load_dies(self) -> None:
         """Load DIE1 and DIE2 from the data manager"""
         try:
-            self.dies[self.DIE_1_INDEX] = self.data_manager.load_die(self.DIE_1_INDEX)
-            self.dies[self.DIE_2_INDEX] = self.data_manager.load_die(self.DIE_2_INDEX)
+            self.dies[self.DIE_1_INDEX] = self.data_manager.load_die(self.DIE_1_INDEX, link_logs=False)
+            self.dies[self.DIE_2_INDEX] = self.data_manager.load_die(self.DIE_2_INDEX, link_logs=False)
         except Exception as e:
             self.show_error_message(ErrorMessages.LOADING.value.format(object=DIES, error=str(e)))
             self.dies = {self.DIE_1_INDEX: None, self.DIE_2_INDEX: None}  # Initialize with None to prevent crashes
@@ -357,6 +366,8 @@ class MainWindow(QMainWindow):
             self.overlay.setGeometry(self.rect())
             self.overlay.setStyleSheet(f"background-color: {TRANSPARENT};")
             self.overlay.setWindowFlags(Qt.WindowStaysOnTopHint)
+            # The current view stays usable, and a new request supersedes the one being processed
+            self.overlay.setAttribute(Qt.WA_TransparentForMouseEvents)
 
             self.gif_label = QLabel(self.overlay)
             self.gif_label.setAlignment(Qt.AlignCenter)
@@ -371,6 +382,14 @@ class MainWindow(QMainWindow):
             self.gif_label.setMovie(self.movie)
             self.gif_label.setGeometry(self.overlay.rect())
 
+            # Shown once reading the logs file reports its progress
+            self.progress_bar = QProgressBar(self.overlay)
+            self.progress_bar.setRange(0, PROGRESS_BAR_RANGE)
+            overlay_rect = self.overlay.rect()
+            self.progress_bar.setGeometry(overlay_rect.width() // 4, overlay_rect.height() // 2 + 110,
+                                          overlay_rect.width() // 2, 20)
+            self.progress_bar.setVisible(False)
+
             self.overlay.show()
             self.movie.start()
             self.overlay.raise_()
@@ -389,18 +408,44 @@ class MainWindow(QMainWindow):
 
     def perform_action_with_wait(self, action, *args):
         try:
-            self.show_wait_message(WAIT_PROCESSING)
-            self.worker_thread = WorkerThread(action, args)
-            self.worker_thread.finished.connect(self.on_action_finished)
-            self.worker_thread.start()
+            if not self.job_scheduler.is_busy():
+                self.show_wait_message(WAIT_PROCESSING)
+            # The worker only builds the next linking, the widgets keep reading the current one until it is swapped in
+            self.job_scheduler.submit(action, *args)
         except Exception as e:
             self.hide_wait_message()
             self.show_error_message(ErrorMessages.PROCESSING_ERROR.value.format(error=str(e)))
 
+    def on_linked_logs_ready(self, linked_logs):
+        if linked_logs is not None:
+            self.data_manager.swap_linked_logs(linked_logs)
+
+    def on_linking_progress(self, progress):
+        if hasattr(self, OVERLAY):
+            self.progress_bar.setValue(int(progress.fraction * PROGRESS_BAR_RANGE))
+            self.progress_bar.setVisible(True)
+        if progress.linked_logs is not None:
+            self.data_manager.swap_linked_logs(progress.linked_logs)
+            self.refresh_view()
+
+    def refresh_view(self):
+        """Redraw the toolbar and update the shown die or host interface with the current logs."""
+        self.create_navbar()
+        if self.die_widget is not None:
+            self.die_widget.refresh()
+        if self.is_host_interface_shown():
+            self.show_host_interface()
+
+    def is_host_interface_shown(self) -> bool:
+        return self.host_interface_widget is not None and \
+            self.scroll_content_layout.indexOf(self.host_interface_widget) != -1
+
+    def on_action_failed(self, error: str):
+        self.show_error_message(ErrorMessages.PROCESSING_ERROR.value.format(error=error))
+
     def on_action_finished(self):
         self.hide_wait_message()
-        self.clear_content()
-        self.create_navbar()
+        self.refresh_view()
 
     def change_filter(self, filter_type: str, values: list) -> None:
         self.perform_action_with_wait(self.data_manager.change_filter, filter_type, values)
@@ -429,6 +474,8 @@ class MainWindow(QMainWindow):
             self.is_closing = True
             self.fade_out_and_close()
         else:
+            # A first load of the logs file still running is stopped
+            self.data_manager.close()
             event.accept()
 
     def show_error_message(self, message: str) -> None:
@@ -1,50 +1,81 @@
-import random
-
-# Updated list of bright and colorful colors in RGB format
-colors = [
-    '#ffb3b3', '#ffb3d9', '#ffb3ff', '#e0b3ff', '#c2b3ff', '#b3b3ff', '#b3c2ff', '#b3e0ff',
-    '#b3ffff', '#b3ffe0', '#b3ffc2', '#b3ffb3', '#d9ffb3', '#ffffb3', '#ffe0b3', '#ffc2b3',
-    '#ffcccc', '#ffccf2', '#e6ccff', '#ccccff', '#ccd9ff', '#ccf2ff', '#ccffff', '#ccffe6',
-    '#ccffd9', '#ccffcc', '#e6ffcc', '#ffffcc', '#ffe6cc', '#ffd9cc', '#ff9999', '#ff99c2',
-    '#ff99ff', '#cc99ff', '#9999ff', '#99b3ff', '#99ccff', '#99ffff', '#99ffcc', '#99ff99',
-    '#c2ff99', '#ffff99', '#ffcc99', '#ffb399', '#ff8080', '#ff80bf', '#ff80ff', '#bf80ff',
-    '#8080ff', '#80bfff', '#80ffff', '#80ffbf', '#80ff80', '#bfff80', '#ffff80', '#ffbf80',
-    '#ff8080', '#ff80a0', '#ff80d4', '#d480ff', '#a080ff', '#80a0ff', '#80d4ff', '#80ffd4'
-]
-
-process_tids_colors = {}
-used_colors = set()  # Set to keep track of used colors
-
-
-def get_random_color() -> str:
-    """Return a random color from the color list that has not been used."""
-    available_colors = [color for color in colors if color not in used_colors]
-
-    if available_colors:
-        chosen_color = random.choice(available_colors)
-        used_colors.add(chosen_color)  # Mark this color as used
-        return chosen_color
-    else:
-        # Generate a new color if there are no available colors
-        return generate_new_color()
+import colorsys
 
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from PyQt5.QtGui import QBrush, QColor
+
+# Bright colors that keep black text readable: the hues spread evenly around the color wheel, at three lightnesses
+HUES_COUNT = 16
+PALETTE_LIGHTNESSES = (0.78, 0.88, 0.68)
+PALETTE_SATURATION = 1.0
 MAX_COLOR_VALUE = 255
-MIN_COLOR_VALUE = 0
 
-def generate_new_color() -> str:
 
-    # Randomly generate RGB values
-    r = random.randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE)
-    g = random.randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE)
-    b = random.randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE)
-    return f'#{r:02x}{g:02x}{b:02x}'
+def create_palette() -> List[str]:
+    palette = []
+    for lightness in PALETTE_LIGHTNESSES:
+        for hue_index in range(HUES_COUNT):
+            rgb = colorsys.hls_to_rgb(hue_index / HUES_COUNT, lightness, PALETTE_SATURATION)
+            palette.append('#' + ''.join(f'{round(value * MAX_COLOR_VALUE):02x}' for value in rgb))
+    return palette
 
 
-def get_colors_by_tids(tids: list) -> list:
-    result = []
-    for tid in tids:
-        if tid not in process_tids_colors:
-            process_tids_colors[tid] = get_random_color()
-        result.append(process_tids_colors[tid])
-    return result
+colors = create_palette()
+palette_array = np.array(colors, dtype=object)  # Indexing it shares the strings of the palette
+
+# Fibonacci hashing: TIDs are multiplied by 2^64 divided by the golden ratio, so close TIDs land far apart
+TID_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+HASH_MASK = (1 << 64) - 1
+HASH_SHIFT = 32
+
+tids_colors: Dict[int, str] = {}
+tids_qcolors: Dict[int, QColor] = {}
+tids_brushes: Dict[int, QBrush] = {}
+
+
+def get_color_index(tid: int) -> int:
+    """Return the palette index of a TID. The same TID gets the same index in every run."""
+    hashed = ((int(tid) & HASH_MASK) * TID_HASH_MULTIPLIER & HASH_MASK) >> HASH_SHIFT
+    return (hashed * len(colors)) >> HASH_SHIFT
+
+
+def get_color_indices(tids: np.ndarray) -> np.ndarray:
+    """Return the palette indices of an array of TIDs, like get_color_index for each of them."""
+    hashed = np.asarray(tids, dtype=np.int64).view(np.uint64) * np.uint64(TID_HASH_MULTIPLIER)
+    return ((hashed >> np.uint64(HASH_SHIFT)) * np.uint64(len(colors))) >> np.uint64(HASH_SHIFT)
 
+
+def get_color(tid: int) -> str:
+    color = tids_colors.get(tid)
+    if color is None:
+        color = tids_colors[tid] = colors[get_color_index(tid)]
+    return color
+
+
+def get_qcolor(tid: int) -> QColor:
+    qcolor = tids_qcolors.get(tid)
+    if qcolor is None:
+        qcolor = tids_qcolors[tid] = QColor(get_color(tid))
+    return qcolor
+
+
+def get_brush(tid: int) -> QBrush:
+    brush = tids_brushes.get(tid)
+    if brush is None:
+        brush = tids_brushes[tid] = QBrush(get_qcolor(tid))
+    return brush
+
+
+def get_colors_by_tids(tids: Iterable[int]) -> list:
+    """Return the color of each TID, computed for all of them at once."""
+    tids = np.fromiter(tids, dtype=np.int64) if not isinstance(tids, np.ndarray) else tids
+    return palette_array[get_color_indices(tids)].tolist()
+
+
+def get_first_color(tids: Iterable[int], default: str) -> str:
+    """Return the color of the first TID, or the default color if there are no TIDs."""
+    for tid in tids:
+        return get_color(tid)
+    return default
@@ -10,10 +10,10 @@ from entities.quad import Quad
 from gui.cluster_info_widget import ClusterInfoWidget
 from gui.cluster_widget import ClusterWidget
 from gui.log_colors_dialog import LogColorDialog
-from gui.packets_colors import get_colors_by_tids
+from gui.packets_colors import get_first_color
 
-from utils.constants import VIEW_LOGS, FORBIDDEN_CURSOR, POINTING_CURSOR, GREEN, ARROW_CURSOR, TID, PACKET, BLACK, \
-    LIGHTGRAY, COMPONENT_LOGS
+from utils.constants import VIEW_LOGS, FORBIDDEN_CURSOR, POINTING_CURSOR, GREEN, ARROW_CURSOR, LIGHTGRAY, \
+    COMPONENT_LOGS
 from utils.type_names import QUAD, HBM
 
 COLUMN_LEFT = 0
@@ -30,18 +30,16 @@ class QuadWidget(QWidget):
     def __init__(self, quad: Quad, is_right_side: bool, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.quad = quad
-        self.quad_tids = self.quad.get_attribute_from_active_logs(TID)
-        self.hbm_tids = self.quad.hbm.get_attribute_from_active_logs(TID)
-        self.colors = list(get_colors_by_tids(self.quad_tids))
-        self.hbm_colors = list(get_colors_by_tids(self.hbm_tids))
-        self.packet_messages = self.quad.get_attribute_from_active_logs(PACKET)
-        self.hbm_packet_messages = self.quad.hbm.get_attribute_from_active_logs(PACKET)
         self.is_right_side = is_right_side
         self.parent = parent
+        self.back_color = LIGHTGRAY
         self.is_enable = False
-        self.is_hbm_enable = bool(self.hbm_packet_messages)  # Set based on whether there are HBM logs
-        if self.quad.is_enable and self.colors:
-            self.is_enable = True
+        self.hbm_back_color = LIGHTGRAY
+        self.is_hbm_enable = False
+        # The visible states the quad and its HBM label are styled with
+        self.visible_state = None
+        self.hbm_visible_state = None
+        self.cluster_widgets = []  # The shown cluster widgets
         self.initUI()
 
     def initUI(self) -> None:
@@ -65,45 +63,58 @@ class QuadWidget(QWidget):
         else:
             self.grid_layout.setColumnStretch(COLUMN_RIGHT, COLUMN_STRETCH_FACTOR)
 
-        back_color = LIGHTGRAY
-        if self.colors:
-            back_color = self.colors[0]
-
-        self.setStyleSheet(f'background-color: {back_color}; border: 2px dashed {BLACK};')
-        color = "green" if self.is_enable else LIGHTGRAY
-        self.setStyleSheet(f'background-color: {back_color}; border: 2px dashed {color};')
-        self.setEnabled(self.is_enable)
+        self.update_display()
 
     def add_hbm(self) -> None:
         # Adds HBM label to the layout
         self.label_hbm = QLabel(self.quad.hbm.type_name + "\n" + self.quad.name[:2], self)
         self.label_hbm.setAlignment(Qt.AlignCenter)
-        hbm_back_color = "grey"
-        if self.hbm_colors:
-            hbm_back_color = self.hbm_colors[0]
-
-        self.label_hbm.setStyleSheet(f"background-color: {hbm_back_color};")
-
-        # Disable the HBM label if there are no logs
-        if not self.is_hbm_enable:
-            self.label_hbm.setStyleSheet(
-                f"background-color: {LIGHTGRAY}; color: darkgray;")  # Change color to indicate it's disabled
-            self.label_hbm.setEnabled(False)  # Disable the label
-        else:
-            self.label_hbm.setEnabled(True)  # Enable the label
+        self.hbm_visible_state = None
 
         if self.is_right_side:
             self.grid_layout.addWidget(self.label_hbm, 0, COLUMN_RIGHT)
         else:
             self.grid_layout.addWidget(self.label_hbm, 0, COLUMN_LEFT)
 
-        # Only connect the event if HBM is enabled
-        if self.is_hbm_enable:
-            self.label_hbm.mousePressEvent = self.hbm_mouse_press_event
+        self.label_hbm.mousePressEvent = self.hbm_mouse_press_event
+
+    def update_display(self) -> int:
+        """
+        Restyles the quad, its HBM label and its shown clusters by their current rollups.
+        Only the widgets whose visible state changed are touched, returns how many were restyled.
+        """
+        restyled = 0
+        back_color = get_first_color(self.quad.rollup.tid_counts, LIGHTGRAY)
+        visible_state = (self.quad.is_enable and bool(self.quad.rollup), back_color)
+        if visible_state != self.visible_state:
+            self.visible_state = visible_state
+            self.is_enable, self.back_color = visible_state
+            color = GREEN if self.is_enable else LIGHTGRAY
+            self.setStyleSheet(f'background-color: {back_color}; border: 2px dashed {color};')
+            self.setEnabled(self.is_enable)
+            self.setCursor(POINTING_CURSOR if self.is_enable else FORBIDDEN_CURSOR)
+            restyled += 1
+
+        if self.label_hbm is not None:
+            hbm_visible_state = (bool(self.quad.hbm.rollup), get_first_color(self.quad.hbm.rollup.tid_counts, "grey"))
+            if hbm_visible_state != self.hbm_visible_state:
+                self.hbm_visible_state = hbm_visible_state
+                self.is_hbm_enable, self.hbm_back_color = hbm_visible_state
+                if self.is_hbm_enable:
+                    self.label_hbm.setStyleSheet(f"background-color: {self.hbm_back_color};")
+                else:
+                    # Change color to indicate it's disabled
+                    self.label_hbm.setStyleSheet(f"background-color: {LIGHTGRAY}; color: darkgray;")
+                self.label_hbm.setEnabled(self.is_hbm_enable)
+                restyled += 1
+
+        for cluster_widget in self.cluster_widgets:
+            restyled += cluster_widget.update_display()
+        return restyled
 
     def hbm_mouse_press_event(self, event: QMouseEvent) -> None:
         # Handles mouse press events on the HBM label
-        if event.button() == Qt.RightButton:
+        if event.button() == Qt.RightButton and self.is_hbm_enable:
             self.show_hbm_log_messages()  # Directly show logs
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
@@ -173,6 +184,7 @@ class QuadWidget(QWidget):
                     widget = item.widget()
                     if widget:
                         widget.deleteLater()
+            self.cluster_widgets = []
 
             self.cluster_layout = QGridLayout()
             self.cluster_layout.setSpacing(0)
@@ -186,6 +198,7 @@ class QuadWidget(QWidget):
                 for cluster in row:
                     if cluster is not None:
                         cluster_widget = ClusterWidget(cluster, self)
+                        self.cluster_widgets.append(cluster_widget)
                         self.cluster_layout.addWidget(cluster_widget, cluster.row, cluster.col)
 
             back_button = QPushButton(BACK_BUTTON_TEXT + self.quad.name)
@@ -204,6 +217,7 @@ class QuadWidget(QWidget):
         try:
             if self.label_quad:
                 self.label_quad.show()
+            self.cluster_widgets = []
             if hasattr(self, 'cluster_layout'):
                 while self.cluster_layout.count():
                     item = self.cluster_layout.takeAt(0)
@@ -226,22 +240,13 @@ class QuadWidget(QWidget):
     def show_cluster_info(self, cluster: Cluster) -> None:
         # Displays information about the cluster
         self.clear_layout()
+        self.cluster_widgets = []
+        self.label_hbm = None
         cluster_info_widget = ClusterInfoWidget(cluster, self)
         self.layout.addWidget(cluster_info_widget)
 
     def show_quad(self, init: Optional[bool] = 0) -> None:
         # Updates and shows the quad widget
-        if self.is_enable:
-            self.setCursor(POINTING_CURSOR)
-        else:
-            self.setCursor(FORBIDDEN_CURSOR)
-        self.setStyleSheet(f'border: 2px dashed {BLACK};')
-        back_color = LIGHTGRAY
-        if self.colors:
-            back_color = self.colors[0]
-        color = GREEN if self.is_enable else LIGHTGRAY
-        self.setStyleSheet(f'background-color:{back_color}; border: 2px dashed {color};')
-
         self.clear_layout()
 
         self.grid_layout = QGridLayout()
@@ -260,6 +265,7 @@ class QuadWidget(QWidget):
         else:
             self.grid_layout.setColumnStretch(COLUMN_RIGHT, COLUMN_STRETCH_FACTOR)
 
+        self.update_display()
         self.adjustSize()
         if init:
             self.show_clusters()
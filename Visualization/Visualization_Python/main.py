@@ -1,6 +1,7 @@
 import os
 import sys
 import ctypes
+import multiprocessing
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QApplication
 
@@ -8,6 +9,8 @@ from utils.paths import APP_ICON_IMAGE
 from gui.file_dialogs.file_selection_widget import FileSelectionWidget
 
 if __name__ == '__main__':
+    # The logs file is parsed by worker processes started from this script
+    multiprocessing.freeze_support()
     ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(' ')
     app = QApplication(sys.argv)
     icon_path = os.path.join(os.getcwd(),APP_ICON_IMAGE)
@@ -0,0 +1,107 @@
+"""
+Compares the frame times of the die renderers on both dies of the chip.
+
+Run from Visualization_Python:  python -m tests.gui.benchmark_die_renderers
+Every cluster is shown in both renderers, the widget renderer with all its quads expanded.
+"""
+import json
+import random
+import statistics
+import time
+
+from PyQt5.QtWidgets import QApplication
+
+from entities.die import Die
+from entities.linked_logs import LinkedLogs
+from entities.log_rollup import LogRollup
+
+from gui.die_canvas_widget import DieCanvasWidget
+from gui.die_widget import DieWidget
+
+from utils.constants import TOP, DIES
+from utils.paths import CHIP_DATA_JSON
+
+FRAMES_COUNT = 30
+TIDS_COUNT = 8
+# Share of the clusters whose logs change between two frames
+CHANGED_SHARES = [0.0, 0.05, 1.0]
+WINDOW_SIZE = 900
+
+
+def link_random_logs(dies, epoch, previous, changed_share, rnd):
+    """Links one log of a random TID to every cluster whose TID is picked to change, the way DataManager does."""
+    rollups = {}
+    for die in dies.values():
+        for quads_row in die.quads:
+            for quad in quads_row:
+                if quad is None:
+                    continue
+                quad.is_enable = True
+                for clusters_row in quad.clusters:
+                    for cluster in clusters_row:
+                        if cluster is None:
+                            continue
+                        cluster.is_enable = True
+                        tids = cluster.rollup.tids
+                        tid = rnd.randrange(TIDS_COUNT) if not tids or rnd.random() < changed_share else tids[0]
+                        rollups[cluster] = LogRollup(1, {tid: 1}, 0, 0)
+                rollups[quad] = LogRollup.merge(rollups[cluster] for clusters_row in quad.clusters
+                                                for cluster in clusters_row if cluster is not None)
+                rollups[quad.hbm] = LogRollup(1, {rnd.randrange(TIDS_COUNT): 1}, 0, 0)
+    if previous is not None:
+        previous.retire()
+    linked_logs = LinkedLogs(epoch, {}, rollups)
+    linked_logs.attach()
+    return linked_logs
+
+
+def create_renderers(renderer_class, dies):
+    renderers = []
+    for die_index in dies:
+        renderer = renderer_class(None, dies, None)
+        renderer.resize(WINDOW_SIZE, WINDOW_SIZE)
+        renderer.show()
+        renderer.show_quads(die_index)
+        for quad_widget in getattr(renderer, 'quad_widgets', []):
+            quad_widget.show_clusters()
+        renderers.append(renderer)
+    return renderers
+
+
+def measure_frames(app, dies, renderers, changed_share, linked_logs, rnd):
+    frame_times = []
+    for frame in range(FRAMES_COUNT):
+        linked_logs = link_random_logs(dies, frame + 1, linked_logs, changed_share, rnd)
+        start = time.perf_counter()
+        for renderer in renderers:
+            renderer.refresh()
+            renderer.repaint()
+        app.processEvents()
+        frame_times.append((time.perf_counter() - start) * 1000)
+    return frame_times, linked_logs
+
+
+def main():
+    app = QApplication.instance() or QApplication([])
+    with open(CHIP_DATA_JSON, 'r') as config:
+        chip_data = json.load(config)
+    dies = {index: Die(index, die_data) for index, die_data in enumerate(chip_data[TOP][DIES])}
+
+    for renderer_class in [DieWidget, DieCanvasWidget]:
+        rnd = random.Random(0)
+        linked_logs = link_random_logs(dies, 0, None, 1.0, rnd)
+        start = time.perf_counter()
+        renderers = create_renderers(renderer_class, dies)
+        app.processEvents()
+        print(f"{renderer_class.__name__}: built in {(time.perf_counter() - start) * 1000:.1f} ms")
+        for changed_share in CHANGED_SHARES:
+            frame_times, linked_logs = measure_frames(app, dies, renderers, changed_share, linked_logs, rnd)
+            print(f"  {changed_share:4.0%} of the clusters changed: median {statistics.median(frame_times):.1f} ms, "
+                  f"max {max(frame_times):.1f} ms per frame")
+        for renderer in renderers:
+            renderer.close()
+        linked_logs.retire()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+import json
+import os
+import unittest
+
+from PyQt5.QtCore import QPoint
+from PyQt5.QtWidgets import QApplication
+
+from entities.die import Die
+from entities.linked_logs import LinkedLogs
+from entities.log_rollup import LogRollup
+
+from gui.die_canvas_widget import DieCanvasWidget
+
+from utils.constants import TOP, DIES, NUM_QUADS_PER_SIDE
+from utils.paths import CHIP_DATA_JSON
+
+DIE_INDEX = 0
+
+
+class TestDieCanvasWidget(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Reuse the QApplication if another GUI test already created one
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        with open(os.path.join(os.path.dirname(__file__), '..', '..', CHIP_DATA_JSON), 'r') as config:
+            chip_data = json.load(config)
+        self.die = Die(DIE_INDEX, chip_data[TOP][DIES][DIE_INDEX])
+        self.quad = self.die.quads[0][0]
+        self.first_cluster, self.second_cluster = [cluster for row in self.quad.clusters
+                                                   for cluster in row if cluster is not None][:2]
+        self.linked_logs = None
+        self.epoch = 0
+
+        self.canvas = DieCanvasWidget(None, {DIE_INDEX: self.die}, None)
+        self.canvas.show()
+
+    def tearDown(self):
+        self.canvas.close()
+        self.canvas.deleteLater()
+
+    def link(self, clusters_tids):
+        # Swaps in a linking where each given cluster has logs of one TID, the way DataManager does
+        if self.linked_logs is not None:
+            self.linked_logs.retire()
+        self.epoch += 1
+        rollups = {}
+        for cluster, tid in clusters_tids.items():
+            cluster.is_enable = True
+            self.quad.is_enable = True
+            rollups[cluster] = LogRollup(1, {tid: 1}, 0, 0)
+        rollups[self.quad] = LogRollup.merge(rollups.values())
+        self.linked_logs = LinkedLogs(self.epoch, {}, rollups)
+        self.linked_logs.attach()
+
+    def test_hit_testing(self):
+        self.canvas.show_quads(DIE_INDEX)
+        for quad_index in range(NUM_QUADS_PER_SIDE * NUM_QUADS_PER_SIDE):
+            quad = self.canvas.quads[quad_index]
+            if quad is None:
+                continue
+            with self.subTest(quad=quad.name):
+                self.assertIs(self.canvas.component_at(self.canvas.get_hbm_rect(quad_index).center()), quad.hbm)
+                # The title of a quad is above its clusters
+                clusters_rect = self.canvas.get_clusters_rect(quad_index)
+                title = QPoint(clusters_rect.center().x(), clusters_rect.top() - 1)
+                self.assertIs(self.canvas.component_at(title), quad)
+                for row in quad.clusters:
+                    for cluster in row:
+                        if cluster is not None:
+                            center = self.canvas.get_rect(cluster).center()
+                            self.assertIs(self.canvas.component_at(center), cluster)
+        self.assertIsNone(self.canvas.component_at(self.canvas.rect().bottomRight()))
+
+    def test_refresh_repaints_only_the_changed_cells(self):
+        self.link({self.first_cluster: 1})
+        self.canvas.show_quads(DIE_INDEX)
+        self.assertTrue(self.canvas.is_enabled(self.quad))
+        self.assertTrue(self.canvas.is_enabled(self.first_cluster))
+        self.assertFalse(self.canvas.is_enabled(self.second_cluster))
+
+        self.link({self.first_cluster: 1})
+        self.assertEqual(self.canvas.refresh(), 0)
+
+        # The quad keeps the color of its first TID, so only the second cluster changes
+        self.link({self.first_cluster: 1, self.second_cluster: 2})
+        self.assertEqual(self.canvas.refresh(), 1)
+        self.assertTrue(self.canvas.is_enabled(self.second_cluster))
+
+        # Filtering out all the logs disables the quad and both clusters
+        self.link({})
+        self.assertEqual(self.canvas.refresh(), 3)
+        self.assertFalse(self.canvas.is_enabled(self.quad))
+
+# if __name__ == '__main__':
+#     unittest.main()
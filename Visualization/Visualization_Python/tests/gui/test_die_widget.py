@@ -0,0 +1,88 @@
+import json
+import os
+import unittest
+
+from PyQt5.QtWidgets import QApplication
+
+from entities.die import Die
+from entities.linked_logs import LinkedLogs
+from entities.log_rollup import LogRollup
+
+from gui.die_widget import DieWidget
+
+from utils.constants import TOP, DIES
+from utils.paths import CHIP_DATA_JSON
+
+DIE_INDEX = 0
+
+
+class TestDieWidget(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Reuse the QApplication if another GUI test already created one
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        with open(os.path.join(os.path.dirname(__file__), '..', '..', CHIP_DATA_JSON), 'r') as config:
+            chip_data = json.load(config)
+        self.die = Die(DIE_INDEX, chip_data[TOP][DIES][DIE_INDEX])
+        self.quad = self.die.quads[0][0]
+        self.first_cluster, self.second_cluster = [cluster for row in self.quad.clusters
+                                                   for cluster in row if cluster is not None][:2]
+        self.linked_logs = None
+        self.epoch = 0
+
+        self.die_widget = DieWidget(None, {DIE_INDEX: self.die}, None)
+        self.die_widget.show()
+
+    def tearDown(self):
+        self.die_widget.close()
+        self.die_widget.deleteLater()
+
+    def link(self, clusters_tids):
+        # Swaps in a linking where each given cluster has logs of one TID, the way DataManager does
+        if self.linked_logs is not None:
+            self.linked_logs.retire()
+        self.epoch += 1
+        rollups = {}
+        for cluster, tid in clusters_tids.items():
+            cluster.is_enable = True
+            self.quad.is_enable = True
+            rollups[cluster] = LogRollup(1, {tid: 1}, 0, 0)
+        rollups[self.quad] = LogRollup.merge(rollups.values())
+        self.linked_logs = LinkedLogs(self.epoch, {}, rollups)
+        self.linked_logs.attach()
+
+    def test_refresh_keeps_the_widgets(self):
+        self.link({self.first_cluster: 1})
+        self.die_widget.show_quads(DIE_INDEX)
+        quad_widgets = list(self.die_widget.quad_widgets)
+        self.assertTrue(quad_widgets[0].is_enable)
+
+        self.link({self.first_cluster: 1})
+        self.assertEqual(self.die_widget.refresh(), 0)
+        self.assertEqual(self.die_widget.quad_widgets, quad_widgets)
+
+    def test_refresh_restyles_only_the_changed_widgets(self):
+        self.link({self.first_cluster: 1})
+        self.die_widget.show_quads(DIE_INDEX)
+        quad_widget = self.die_widget.quad_widgets[0]
+        quad_widget.show_clusters()
+        cluster_widgets = {widget.cluster: widget for widget in quad_widget.cluster_widgets}
+        self.assertFalse(cluster_widgets[self.second_cluster].is_enable)
+
+        # The quad keeps the color of its first TID, so only the second cluster changes
+        self.link({self.first_cluster: 1, self.second_cluster: 2})
+        self.assertEqual(self.die_widget.refresh(), 1)
+        self.assertTrue(cluster_widgets[self.second_cluster].is_enable)
+        self.assertEqual(quad_widget.cluster_widgets, list(cluster_widgets.values()))
+
+        # Filtering out all the logs disables the quad and both clusters
+        self.link({})
+        self.assertEqual(self.die_widget.refresh(), 3)
+        self.assertFalse(quad_widget.is_enable)
+        self.assertFalse(any(widget.is_enable for widget in cluster_widgets.values()))
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,129 @@
+import os
+import tempfile
+import time
+import unittest
+
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+
+from gui.job_executor import JobExecutor
+from utils.backend import FilterFactory, LogsFactory
+
+LOGS_COUNT = 200000
+THREAD_ID = 7
+TICK_INTERVAL_MS = 5
+MIN_FILTERING_SECONDS = 1
+
+
+class TestJobExecutor(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Reuse the QApplication if another GUI test already created one
+        cls.app = QApplication.instance() or QApplication([])
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.logs_file = os.path.join(cls.temp_dir.name, 'logs.csv')
+        with open(cls.logs_file, 'w') as file:
+            for i in range(LOGS_COUNT):
+                file.write(f"timestamp:{1726671833.525302 + i * 0.01:.6f},"
+                           f"cluster_id:chip:0;die:{i % 2};quad:{i % 4};row:{i % 8};col:{i % 8},"
+                           f"area:hbm,unit:hbm,in/out:in,tid:{i % 40},packet/data:sample data {i}\n")
+
+    def setUp(self):
+        self.executor = JobExecutor()
+
+    def run_job(self, job_type, action, *args, report_progress=False):
+        # Run one job and collect its signals in the order the GUI thread receives them
+        events = []
+        loop = QEventLoop()
+        job = self.executor.create_job(job_type, action, *args, report_progress=report_progress)
+        job.signals.progress.connect(lambda value: events.append(('progress', value)))
+        job.signals.result.connect(lambda result: events.append(('result', result)))
+        job.signals.error.connect(lambda error: events.append(('error', error)))
+        job.signals.finished.connect(lambda: events.append(('finished', None)))
+        job.signals.finished.connect(loop.quit)
+        self.executor.start(job)
+        loop.exec_()
+        self.executor.wait_for_done()
+        return events
+
+    def run_in_worker_and_count_ticks(self, action):
+        # Count QTimer ticks on the GUI thread while the action runs in a job of the pool
+        ticks = []
+        timer = QTimer()
+        timer.setInterval(TICK_INTERVAL_MS)
+        timer.timeout.connect(lambda: ticks.append(time.perf_counter()))
+
+        start = time.perf_counter()
+        timer.start()
+        self.run_job("ticks", action)
+        timer.stop()
+        return ticks, time.perf_counter() - start
+
+    def test_event_loop_ticks_while_filtering(self):
+        # Filtering the whole file must not freeze the GUI thread, even inside join_thread()
+        filter_factory = FilterFactory(self.logs_file)
+        filter_factory.add_filter_to_chain(("ThreadId", [THREAD_ID]))
+        result = []
+
+        def filter_logs():
+            # Repeat whole passes so the GUI thread has enough time to show a freeze inside join_thread()
+            start = time.perf_counter()
+            while time.perf_counter() - start < MIN_FILTERING_SECONDS:
+                filter_factory.start_logs()
+                filter_factory.join_thread()
+                result[:] = filter_factory.get_logs(LOGS_COUNT)
+
+        ticks, elapsed = self.run_in_worker_and_count_ticks(filter_logs)
+
+        self.assertTrue(result)
+        self.assertTrue(all(log.tid == THREAD_ID for log in result))
+        expected_ticks = elapsed * 1000 / TICK_INTERVAL_MS
+        self.assertGreaterEqual(len(ticks), expected_ticks // 4)
+
+    def test_event_loop_ticks_while_reading_log_times(self):
+        # The timeline reads the first and last log times from a worker as well
+        times = []
+
+        def read_log_times():
+            logs_factory = LogsFactory(self.logs_file)
+            times.append(logs_factory.get_first_log_time())
+            times.append(logs_factory.get_last_log_time())
+
+        self.run_in_worker_and_count_ticks(read_log_times)
+
+        self.assertEqual(len(times), 2)
+        self.assertLessEqual(times[0], times[1])
+
+    def test_result_progress_and_error(self):
+        def count(*values, report_progress):
+            for value in values:
+                report_progress(value)
+            return sum(values)
+
+        self.assertEqual(self.run_job("count", count, 1, 2, 3, report_progress=True),
+                         [('progress', 1), ('progress', 2), ('progress', 3), ('result', 6), ('finished', None)])
+
+        def fail():
+            raise ValueError("bad filter")
+
+        self.assertEqual(self.run_job("fail", fail), [('error', "bad filter"), ('finished', None)])
+        # The executor releases its jobs once their signals were delivered
+        self.app.processEvents()
+        self.assertFalse(self.executor.jobs)
+
+    def test_timings_by_job_type(self):
+        self.run_job("sleep", time.sleep, 0.02)
+        self.run_job("sleep", time.sleep, 0.01)
+        timing = self.executor.timings.get_summary()["sleep"]
+        self.assertEqual(timing['count'], 2)
+        self.assertGreaterEqual(timing['run'], 0.03)
+        self.assertGreaterEqual(timing['max_run'], 0.02)
+        self.assertGreaterEqual(timing['wait'], 0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+# if __name__ == '__main__':
+#     unittest.main()
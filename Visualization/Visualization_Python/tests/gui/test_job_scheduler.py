@@ -0,0 +1,93 @@
+import time
+import unittest
+
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+
+from gui.job_scheduler import JobScheduler
+from utils.cancellation import JobCancelled
+
+STEP_SECONDS = 0.005
+STEPS_COUNT = 200
+TIMEOUT_MS = 10000
+
+
+class LinkingDataManager:
+    """Builds a linking the way DataManager.build_linked_logs does, in steps that check the token."""
+
+    def __init__(self):
+        self.filters = []
+        self.stopped_after = {}
+
+    def build_linked_logs(self, action, *args, cancellation_token=None, report_progress=None):
+        action(*args)
+        for step in range(STEPS_COUNT):
+            if cancellation_token.is_cancelled:
+                self.stopped_after[tuple(self.filters)] = step
+                raise JobCancelled()
+            time.sleep(STEP_SECONDS)
+        return tuple(self.filters)
+
+
+class TestJobScheduler(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Reuse the QApplication if another GUI test already created one
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.data_manager = LinkingDataManager()
+        self.scheduler = JobScheduler(self.data_manager)
+        self.results = []
+        self.scheduler.result_ready.connect(self.results.append)
+
+    def wait_until_idle(self):
+        loop = QEventLoop()
+        self.scheduler.idle.connect(loop.quit)
+        QTimer.singleShot(TIMEOUT_MS, loop.quit)
+        loop.exec_()
+        self.assertFalse(self.scheduler.is_busy())
+
+    def test_latest_request_wins(self):
+        self.scheduler.submit(self.data_manager.filters.append, 'first')
+        time.sleep(STEP_SECONDS * 4)
+        self.scheduler.submit(self.data_manager.filters.append, 'second')
+        self.scheduler.submit(self.data_manager.filters.append, 'third')
+        self.wait_until_idle()
+
+        # Every action ran in order, but only the latest one was linked to the end
+        self.assertEqual(self.results, [('first', 'second', 'third')])
+        self.assertLess(self.data_manager.stopped_after[('first',)], STEPS_COUNT // 2)
+        self.assertEqual(self.data_manager.stopped_after[('first', 'second')], 0)
+
+    def test_failed_job(self):
+        errors = []
+        self.scheduler.failed.connect(errors.append)
+
+        def fail():
+            raise ValueError("bad filter")
+
+        self.scheduler.submit(fail)
+        self.wait_until_idle()
+        self.assertEqual(errors, ["bad filter"])
+        self.assertEqual(self.results, [])
+
+    def test_failed_request_does_not_stop_the_next(self):
+        errors = []
+        self.scheduler.failed.connect(errors.append)
+
+        def fail():
+            raise ValueError("bad filter")
+
+        self.scheduler.submit(self.data_manager.filters.append, 'first')
+        self.scheduler.submit(fail)
+        self.scheduler.submit(self.data_manager.filters.append, 'second')
+        self.wait_until_idle()
+
+        # The error is reported, and the latest request still links
+        self.assertEqual(errors, ["bad filter"])
+        self.assertEqual(self.results, [('first', 'second')])
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+from PyQt5.QtCore import Qt, QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+
+from entities.linked_logs import LinkedLogs
+from entities.log_rollup import LogRollup
+from entities.mcu import Mcu
+
+from gui.log_colors_dialog import LogColorDialog
+from gui.packets_colors import get_colors_by_tids
+
+from utils.constants import EQS, ID
+from utils.log_store import LogStore
+from utils.type_names import MCU
+
+TIDS = [5, 3, 5, 9, 3, 3]
+SEARCH_TIMEOUT_MS = 5000
+
+
+def make_log(time_stamp, tid):
+    cluster_id = SimpleNamespace(chip=0, die=0, quad=0, row=0, col=0)
+    return SimpleNamespace(timeStamp=time_stamp, clusterId=cluster_id, area="mcu gate 1", unit="iqr", io="in",
+                           tid=tid, packet=f"packet {time_stamp}")
+
+
+class TestLogColorDialog(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Reuse the QApplication if another GUI test already created one
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.store = LogStore.from_log_batches([[make_log(100 + i, tid) for i, tid in enumerate(TIDS)]])
+        self.mcu = Mcu(None, MCU, {EQS: [{ID: 1}, {ID: 2}]})
+        # Links the rows to the leaves the way DataManager does
+        leaves_indices = {self.mcu.iqr: [3, 4], self.mcu.eqs[1]: [0, 1, 2]}
+        leaves_logs = {leaf: self.store.view(indices) for leaf, indices in leaves_indices.items()}
+        leaf_rollups = LogRollup.from_groups(self.store, [np.array(indices) for indices in leaves_indices.values()])
+        rollups = {}
+        self.mcu.collect_rollups(dict(zip(leaves_indices, leaf_rollups)), rollups)
+        self.linked_logs = LinkedLogs(1, leaves_logs, rollups)
+        self.linked_logs.attach()
+        self.dialog = LogColorDialog(self.mcu, "Mcu Logs")
+
+    def tearDown(self):
+        self.dialog.deleteLater()
+
+    def search(self, text):
+        # Types the text and waits until the logs it matches are listed
+        loop = QEventLoop()
+        self.dialog.search_done.connect(loop.quit)
+        QTimer.singleShot(SEARCH_TIMEOUT_MS, loop.quit)
+        self.dialog.search_bar.setText(text)
+        loop.exec_()
+        self.dialog.search_done.disconnect(loop.quit)
+
+    def listed_packets(self):
+        model = self.dialog.model
+        return [model.index(row).data() for row in range(model.rowCount())]
+
+    def test_lists_the_logs_of_the_component(self):
+        self.assertEqual(self.listed_packets(), self.mcu.get_attribute_from_active_logs('packet'))
+        self.assertFalse(self.dialog.no_logs_message.isVisibleTo(self.dialog))
+
+    def test_tid_selection_and_search(self):
+        packets = self.mcu.get_attribute_from_active_logs('packet')
+        tids = self.mcu.get_attribute_from_active_logs('tid')
+        self.dialog.handle_tid_selection({3})
+        self.assertEqual(self.listed_packets(), [packet for packet, tid in zip(packets, tids) if tid == 3])
+        self.search("PACKET 10")
+        self.assertEqual(len(self.listed_packets()), 5)
+        self.search("packet 104")
+        self.assertEqual(self.listed_packets(), ["packet 104"])
+        self.search("missing")
+        self.assertEqual(self.listed_packets(), [])
+        self.assertTrue(self.dialog.no_logs_message.isVisibleTo(self.dialog))
+        self.search("")
+        self.assertEqual(len(self.listed_packets()), 5)
+
+    def test_search_lists_only_the_latest_text(self):
+        # Each key restarts the wait, so only the last text is searched
+        self.dialog.search_bar.setText("packet 10")
+        self.search("packet 103")
+        self.assertEqual(self.listed_packets(), ["packet 103"])
+        self.assertEqual(list(self.dialog.packet_index.results), ["packet 103"])
+        # Listing the logs of a TID drops the search that is still waiting
+        self.dialog.search_bar.setText("missing")
+        self.dialog.handle_tid_selection({3})
+        self.assertFalse(self.dialog.search_timer.isActive())
+        self.assertEqual(len(self.listed_packets()), 2)
+
+    def test_rows_are_colored_by_tid(self):
+        model = self.dialog.model
+        self.dialog.handle_tid_selection({9})
+        self.assertIs(model.data(model.index(0), Qt.BackgroundRole), model.get_brush(9))
+        self.assertEqual(model.get_brush(9).color().name(), get_colors_by_tids([9])[0])
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -1,3 +1,5 @@
+import tempfile
+import time
 import unittest
 from PyQt5.QtWidgets import QApplication
 from gui.main_window import MainWindow
@@ -6,7 +8,10 @@ from utils.data_manager import DataManager
 import sys
 import os
 
-from utils.paths import CHIP_DATA_JSON
+from utils.filter_types import FILTER_TYPES_NAMES, THREADID
+from utils.paths import CHIP_DATA_JSON, SL_JSON
+
+TIMEOUT_SECONDS = 10
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../Visualization_Python')))
 
@@ -52,5 +57,51 @@ class TestMainWindow(unittest.TestCase):
         # Close the QApplication after the tests
         cls.app.quit()
 
+
+class TestMainWindowRefresh(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Reuse the QApplication if another GUI test already created one
+        cls.app = QApplication.instance() or QApplication([])
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.logs_file = os.path.join(cls.temp_dir.name, 'logs.csv')
+        with open(cls.logs_file, 'w') as file:
+            # BMT logs of the host interface have row -1
+            for i, (area, row, tid) in enumerate([("bmt", -1, 1), ("pcie", 0, 2), ("bmt", -1, 1), ("pcie", 0, 2)]):
+                file.write(f"timestamp:{1726671833 + i}.000000,cluster_id:chip:0;die:0;quad:0;row:{row};col:0,"
+                           f"area:{area},unit:{area},in/out:in,tid:{tid},packet/data:sample data {i}\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def setUp(self):
+        self.main_window = MainWindow(DataManager(CHIP_DATA_JSON, SL_JSON, self.logs_file))
+        self.wait_until_idle()
+
+    def wait_until_idle(self):
+        # Events are processed by hand, an event loop would return at once once another test quit the application
+        deadline = time.perf_counter() + TIMEOUT_SECONDS
+        while self.main_window.job_scheduler.is_busy() and time.perf_counter() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.01)
+        QApplication.processEvents()
+        self.assertFalse(self.main_window.job_scheduler.is_busy())
+
+    def test_filter_change_refreshes_host_interface(self):
+        self.main_window.show_host_interface()
+        shown_widget = self.main_window.host_interface_widget
+        self.assertTrue(shown_widget.colors_pcie)
+
+        self.main_window.change_filter(FILTER_TYPES_NAMES[THREADID], [1])
+        self.wait_until_idle()
+
+        # The host interface on screen is rebuilt with the logs of the new linking
+        self.assertTrue(self.main_window.is_host_interface_shown())
+        self.assertIsNot(self.main_window.host_interface_widget, shown_widget)
+        self.assertTrue(self.main_window.host_interface_widget.colors_bmt)
+        self.assertEqual(self.main_window.host_interface_widget.colors_pcie, [])
+
 # if __name__ == '__main__':
 #     unittest.main()
\ No newline at end of file
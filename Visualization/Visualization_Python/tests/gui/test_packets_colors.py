@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+
+from PyQt5.QtWidgets import QApplication
+
+from gui.packets_colors import (
+    colors, get_color, get_color_index, get_color_indices, get_colors_by_tids, get_first_color, get_qcolor, get_brush
+)
+
+
+class TestPacketsColors(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Reuse the QApplication if another GUI test already created one
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_palette(self):
+        self.assertEqual(len(set(colors)), len(colors))
+        for color in colors:
+            self.assertRegex(color, r'^#[0-9a-f]{6}$')
+
+    def test_colors_are_stable(self):
+        # A TID has the same color in every run, and the first TIDs all have different colors
+        self.assertEqual(get_color(7), colors[get_color_index(7)])
+        self.assertEqual(get_color_index(0), 0)
+        self.assertEqual(len({get_color(tid) for tid in range(len(colors) // 2)}), len(colors) // 2)
+        self.assertEqual(get_color(np.int64(117)), get_color(117))
+
+    def test_bulk_colors_match_single_colors(self):
+        tids = [7, 117, 7, 0, -1, 2 ** 40, 3]
+        expected = [get_color(tid) for tid in tids]
+        self.assertEqual(get_colors_by_tids(tids), expected)
+        self.assertEqual(get_colors_by_tids(np.array(tids)), expected)
+        self.assertEqual(get_colors_by_tids({7: 2, 117: 1}), expected[:2])
+        self.assertEqual(get_color_indices(np.array(tids)).tolist(), [get_color_index(tid) for tid in tids])
+        self.assertEqual(get_colors_by_tids([]), [])
+
+    def test_cached_qt_objects(self):
+        self.assertIs(get_qcolor(5), get_qcolor(5))
+        self.assertEqual(get_qcolor(5).name(), get_color(5))
+        self.assertIs(get_brush(5), get_brush(5))
+        self.assertEqual(get_brush(5).color(), get_qcolor(5))
+        self.assertEqual(get_first_color([], "grey"), "grey")
+        self.assertEqual(get_first_color({9: 1, 5: 2}, "grey"), get_color(9))
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import time
+import unittest
+
+from utils.backend import FilterFactory, FilterType
+from utils.cancellation import CancellationToken, JobCancelled
+from utils.constants import NUM_DIES
+from utils.data_manager import DataManager
+from utils.paths import CHIP_DATA_JSON, SL_JSON
+
+LOGS_COUNT = 200000
+MAX_STOP_SECONDS = 0.5
+
+
+class TestCancellation(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.logs_file = os.path.join(cls.temp_dir.name, 'logs.csv')
+        with open(cls.logs_file, 'w') as file:
+            for i in range(LOGS_COUNT):
+                file.write(f"timestamp:{1726671833.525302 + i * 0.01:.6f},"
+                           f"cluster_id:chip:0;die:{i % 2};quad:{i % 4};row:{i % 8};col:{i % 8},"
+                           f"area:hbm,unit:hbm,in/out:in,tid:{i % 40},packet/data:sample data {i}\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def test_callbacks(self):
+        token = CancellationToken()
+        calls = []
+        token.add_callback(lambda: calls.append('first'))
+        removed = lambda: calls.append('removed')
+        token.add_callback(removed)
+        token.remove_callback(removed)
+        token.raise_if_cancelled()
+
+        token.cancel()
+        token.cancel()
+        self.assertEqual(calls, ['first'])
+        # A callback added after the cancellation is called right away
+        token.add_callback(lambda: calls.append('late'))
+        self.assertEqual(calls, ['first', 'late'])
+        with self.assertRaises(JobCancelled):
+            token.raise_if_cancelled()
+
+    def test_cancel_stops_the_producer_thread(self):
+        filter_factory = FilterFactory(self.logs_file)
+        token = CancellationToken()
+        token.add_callback(filter_factory.cancel)
+        filter_factory.start_logs()
+        batches = filter_factory.stream(1000)
+        next(batches)
+
+        start = time.perf_counter()
+        token.cancel()
+        remaining = sum(len(batch) for batch in batches)
+        filter_factory.join_thread()
+        self.assertLess(time.perf_counter() - start, MAX_STOP_SECONDS)
+        self.assertTrue(filter_factory.is_cancelled())
+        self.assertLess(remaining, LOGS_COUNT)
+
+        # A new factory is not affected by the cancelled one
+        filter_factory = FilterFactory(self.logs_file)
+        filter_factory.start_logs()
+        self.assertEqual(sum(len(batch) for batch in filter_factory.stream(10000)), LOGS_COUNT)
+        filter_factory.join_thread()
+
+    def test_cancel_stops_reading_without_matching_logs(self):
+        # The producer checks for a cancel while it reads, not only when a log passes the filters
+        filter_factory = FilterFactory(self.logs_file)
+        filter_factory.add_filter_to_chain((FilterType.ThreadId, [LOGS_COUNT]))
+        filter_factory.start_logs()
+        filter_factory.cancel()
+        self.assertEqual(sum(len(batch) for batch in filter_factory.stream(1000)), 0)
+        filter_factory.join_thread()
+        self.assertLess(filter_factory.get_bytes_read(), filter_factory.get_file_size())
+
+    def test_cancelled_linking_keeps_the_log_store(self):
+        # A superseded job still reads the whole file, only its linking is cancelled
+        data_manager = DataManager(CHIP_DATA_JSON, SL_JSON, self.logs_file)
+        for die_index in range(NUM_DIES):
+            data_manager.load_die(die_index, link_logs=False)
+        token = CancellationToken()
+        token.cancel()
+        with self.assertRaises(JobCancelled):
+            data_manager.build_linked_logs(data_manager.refresh_logs, cancellation_token=token)
+        log_store = data_manager.log_store
+        self.assertEqual(len(log_store), LOGS_COUNT)
+
+        # The next request links the same store without reading the file again
+        linked_logs = data_manager.build_linked_logs(data_manager.refresh_logs, cancellation_token=CancellationToken())
+        self.assertIs(data_manager.log_store, log_store)
+        self.assertIsNotNone(linked_logs)
+
+    def test_closed_data_manager_stops_reading(self):
+        # Closing stops the reading of the logs file, and the logs read in part are not kept
+        data_manager = DataManager(CHIP_DATA_JSON, SL_JSON, self.logs_file)
+        for die_index in range(NUM_DIES):
+            data_manager.load_die(die_index, link_logs=False)
+        data_manager.close()
+        start = time.perf_counter()
+        with self.assertRaises(JobCancelled):
+            data_manager.build_linked_logs(data_manager.refresh_logs, cancellation_token=CancellationToken())
+        self.assertLess(time.perf_counter() - start, MAX_STOP_SECONDS)
+        self.assertIsNone(data_manager.log_store)
+
+# if __name__ == '__main__':
+#     unittest.main()
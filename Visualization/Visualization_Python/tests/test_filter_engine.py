@@ -0,0 +1,138 @@
+import os
+import tempfile
+import unittest
+
+from utils.backend import FilterFactory, Cluster
+from utils.filter_engine import FilterEngine
+from utils.filter_types import FILTER_TYPES_NAMES, THREADID, CLUSTER, QUAD, IO, UNIT, AREA
+from utils.log_store import LogStore
+
+LOGS_COUNT = 2000
+FIRST_TIME = 1726671833
+AREAS_UNITS = [("hbm", "hbm"), ("mcu gate 1", "eq;3"), ("ecore 0", "Ecore;1"), ("d2d", "d2d")]
+
+
+def log_fields(log):
+    cluster_id = log.clusterId
+    return (log.timeStamp, cluster_id.chip, cluster_id.die, cluster_id.quad, cluster_id.row, cluster_id.col,
+            log.area, log.unit, log.io, log.tid, log.packet)
+
+
+class TestFilterEngine(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.logs_file = os.path.join(cls.temp_dir.name, 'logs.csv')
+        with open(cls.logs_file, 'w') as file:
+            for i in range(LOGS_COUNT):
+                area, unit = AREAS_UNITS[i % len(AREAS_UNITS)]
+                file.write(f"timestamp:{FIRST_TIME + i * 0.1:.6f},"
+                           f"cluster_id:chip:0;die:{i % 2};quad:{i % 4};row:{i % 3};col:{i % 5},"
+                           f"area:{area},unit:{unit},in/out:{'in' if i % 3 else 'out'},tid:{i % 11},"
+                           f"packet/data:sample data {i}\n")
+        cls.store = LogStore.from_log_batches(cls.read_logs([]))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    @classmethod
+    def read_logs(cls, filters, start_time=None, end_time=None):
+        # Runs the C++ filter chain over the file and returns its batches
+        filter_factory = FilterFactory(cls.logs_file)
+        for log_filter in filters:
+            filter_factory.add_filter_to_chain(log_filter)
+        if start_time is not None:
+            filter_factory.set_start_time(start_time)
+        if end_time is not None:
+            filter_factory.set_end_time(end_time)
+        filter_factory.start_logs()
+        batches = list(filter_factory.stream(500))
+        filter_factory.join_thread()
+        return batches
+
+    def assert_same_as_filter_chain(self, filters, start_time=None, end_time=None):
+        expected = [log_fields(log) for batch in self.read_logs(filters, start_time, end_time) for log in batch]
+        indices = FilterEngine(self.store).get_indices(filters, start_time, end_time)
+        rows = self.store.rows[indices]
+        view = self.store.view(indices)
+        actual = list(zip(view.get_attribute('timeStamp'), rows['chip'].tolist(), rows['die'].tolist(),
+                          rows['quad'].tolist(), rows['row'].tolist(), rows['col'].tolist(),
+                          view.get_attribute('area'), view.get_attribute('unit'), view.get_attribute('io'),
+                          view.get_attribute('tid'), view.get_attribute('packet')))
+        self.assertEqual(actual, expected)
+
+    def test_single_filters(self):
+        # Each filter type selects exactly the logs the C++ filter selects
+        for log_filter in [(FILTER_TYPES_NAMES[THREADID], [3, 7]),
+                           (FILTER_TYPES_NAMES[CLUSTER], Cluster(0, 1, 1, 2, 3)),
+                           (FILTER_TYPES_NAMES[QUAD], [0, 0, 2]),
+                           (FILTER_TYPES_NAMES[IO], "out"),
+                           (FILTER_TYPES_NAMES[UNIT], "eq;3"),
+                           (FILTER_TYPES_NAMES[AREA], "hbm")]:
+            with self.subTest(log_filter=log_filter):
+                self.assert_same_as_filter_chain([log_filter])
+
+    def test_combined_filters_and_time_range(self):
+        filters = [(FILTER_TYPES_NAMES[AREA], "ecore 0"), (FILTER_TYPES_NAMES[THREADID], [1, 2, 5])]
+        self.assert_same_as_filter_chain(filters)
+        self.assert_same_as_filter_chain(filters, FIRST_TIME + 20, FIRST_TIME + 120)
+        self.assert_same_as_filter_chain([], FIRST_TIME + 50, FIRST_TIME + 50)
+
+    def test_cluster_ids_list(self):
+        # The filter menu passes a cluster as a list of its ids
+        engine = FilterEngine(self.store)
+        self.assertEqual(engine.get_indices([(FILTER_TYPES_NAMES[CLUSTER], [0, 1, 1, 2, 3])]).tolist(),
+                         engine.get_indices([(FILTER_TYPES_NAMES[CLUSTER], Cluster(0, 1, 1, 2, 3))]).tolist())
+
+    def test_values_without_logs(self):
+        # Unknown strings and out of range ids match no log instead of failing
+        engine = FilterEngine(self.store)
+        self.assertEqual(len(engine.get_indices([(FILTER_TYPES_NAMES[UNIT], "lnb")])), 0)
+        self.assertEqual(len(engine.get_indices([(FILTER_TYPES_NAMES[QUAD], [0, 300, 1])])), 0)
+        self.assertEqual(len(engine.get_indices([], FIRST_TIME + 1000, FIRST_TIME + 2000)), 0)
+
+    def test_narrowing_steps_refine_the_last_result(self):
+        # Every step of a drill-down and back matches a fresh scan of the store
+        engine = FilterEngine(self.store)
+        tid_filter = (FILTER_TYPES_NAMES[THREADID], [1, 2, 3, 4])
+        area_filter = (FILTER_TYPES_NAMES[AREA], "hbm")
+        steps = [([tid_filter], None, None, False),
+                 ([tid_filter, area_filter], None, None, True),
+                 ([tid_filter, area_filter], FIRST_TIME + 10, FIRST_TIME + 150, True),
+                 ([(FILTER_TYPES_NAMES[THREADID], [2, 4]), area_filter], FIRST_TIME + 10, FIRST_TIME + 150, True),
+                 ([(FILTER_TYPES_NAMES[THREADID], [2, 4])], FIRST_TIME + 10, FIRST_TIME + 150, False),
+                 ([(FILTER_TYPES_NAMES[THREADID], [2, 4])], FIRST_TIME, FIRST_TIME + 150, False)]
+        for filters, start_time, end_time, narrowing in steps:
+            with self.subTest(filters=filters, start_time=start_time, end_time=end_time):
+                self.assertEqual(engine.is_narrowing(FilterEngine.compile(filters), start_time, end_time), narrowing)
+                expected = FilterEngine(self.store).get_indices(filters, start_time, end_time).tolist()
+                self.assertEqual(engine.get_indices(filters, start_time, end_time).tolist(), expected)
+
+        # A narrowing filter is evaluated on the last result only, without a mask over the whole store
+        engine.get_indices([tid_filter])
+        engine.get_indices([tid_filter, area_filter])
+        self.assertNotIn(FilterEngine.compile([area_filter])[0], engine.masks)
+
+    def test_undoing_a_filter_reuses_the_cached_result(self):
+        engine = FilterEngine(self.store)
+        tid_filter = (FILTER_TYPES_NAMES[THREADID], [4])
+        io_filter = (FILTER_TYPES_NAMES[IO], "in")
+        first = engine.get_indices([tid_filter])
+        engine.get_indices([tid_filter, io_filter])
+        self.assertIs(engine.get_indices([tid_filter]), first)
+        self.assertEqual(engine.results.hits, 1)
+        self.assertFalse(first.flags.writeable)
+
+    def test_masks_of_removed_filters_are_dropped(self):
+        engine = FilterEngine(self.store)
+        tid_filter = (FILTER_TYPES_NAMES[THREADID], [4])
+        io_filter = (FILTER_TYPES_NAMES[IO], "in")
+        engine.get_indices([tid_filter, io_filter])
+        self.assertEqual(len(engine.masks), 2)
+        engine.get_indices([io_filter])
+        self.assertEqual(list(engine.masks), FilterEngine.compile([io_filter]))
+
+# if __name__ == '__main__':
+#     unittest.main()
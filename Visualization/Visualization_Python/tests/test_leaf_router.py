@@ -0,0 +1,60 @@
+import json
+import os
+import unittest
+
+from entities.component import Component
+from entities.die import Die
+from entities.ecore import Ecore
+from entities.host_interface import HostInterface
+
+from utils.constants import TOP, DIES, NUM_QUADS_PER_SIDE
+from utils.leaf_router import LeafRouter
+from utils.paths import CHIP_DATA_JSON
+from utils.type_names import HOST_INTERFACE, D2D, EQ
+
+
+class TestLeafRouter(unittest.TestCase):
+
+    def setUp(self):
+        with open(os.path.join(os.path.dirname(__file__), '..', CHIP_DATA_JSON), 'r') as config:
+            chip_data = json.load(config)
+
+        self.dies = {index: Die(index, die_data) for index, die_data in enumerate(chip_data[TOP][DIES])}
+        self.host_interface = HostInterface(chip_data[TOP][HOST_INTERFACE])
+        self.die2die = Component(None, D2D)
+        self.router = LeafRouter(self.dies, self.host_interface, self.die2die)
+
+        # The Ecore cluster of die 1, quad 3
+        self.quad = self.dies[1].quads[3 // NUM_QUADS_PER_SIDE][3 % NUM_QUADS_PER_SIDE]
+        self.ecore = next(cluster for row in self.quad.clusters for cluster in row if isinstance(cluster, Ecore))
+        self.location = (1, 3, self.ecore.row, self.ecore.col)
+
+    def test_die_area_leaves(self):
+        self.assertIs(self.router.route("hbm", "hbm", 1, 3, 0, 0), self.quad.hbm)
+        self.assertIs(self.router.route("mcu gate 1", "iqr", *self.location), self.ecore.mcu.iqr)
+        self.assertIs(self.router.route("ecore req cip", "bmt", *self.location), self.ecore.bmt)
+        self.assertIs(self.router.route("nfi", "lnb", *self.location), self.ecore.lnb)
+
+    def test_numbered_units(self):
+        # eq and Ecore units are matched by their number, counted from 1
+        if self.ecore.mcu.eqs:
+            self.assertIs(self.router.route("mcu gate 0", f"{EQ};{len(self.ecore.mcu.eqs)}", *self.location),
+                          self.ecore.mcu.eqs[-1])
+        self.assertIs(self.router.route("ecore rsp cip", f"Ecore;{len(self.ecore.ecores)}", *self.location),
+                      self.ecore.ecores[-1])
+        self.assertIsNone(self.router.route("ecore rsp cip", f"Ecore;{len(self.ecore.ecores) + 1}", *self.location))
+        # Units that are not numbered ignore the number
+        self.assertIs(self.router.route("mcu gate 1", "iqd;2", *self.location), self.ecore.mcu.iqd)
+
+    def test_host_interface_and_die2die_leaves(self):
+        self.assertIs(self.router.route("bmt", "bmt", 0, 0, -1, 0), self.host_interface.bmt)
+        self.assertIs(self.router.route("pcie", "pcie", 1, 2, 3, 4), self.host_interface.pcie)
+        self.assertIs(self.router.route("host if", "cbus inj", 0, 0, 0, 0), self.host_interface.h2g.cbus_inj)
+        self.assertIs(self.router.route("d2d", "d2d", 1, 0, 5, 5), self.die2die)
+
+    def test_unknown_location(self):
+        self.assertIsNone(self.router.route("hbm", "hbm", 5, 0, 0, 0))
+        self.assertIsNone(self.router.route("mcu gate 1", "iqr", 0, 0, 40, 40))
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from entities.linked_logs import LinkedLogs
+from entities.log_rollup import LogRollup
+from entities.mcu import Mcu
+from utils.constants import EQS, ID, TID
+from utils.log_store import LogStore
+from utils.type_names import MCU
+
+
+def make_log(time_stamp, tid):
+    cluster_id = SimpleNamespace(chip=0, die=0, quad=0, row=0, col=0)
+    return SimpleNamespace(timeStamp=time_stamp, clusterId=cluster_id, area="mcu gate 1", unit="iqr", io="in",
+                           tid=tid, packet=f"packet {time_stamp}")
+
+
+class TestLinkedLogs(unittest.TestCase):
+
+    def setUp(self):
+        self.store = LogStore.from_log_batches([[make_log(100 + i, tid) for i, tid in enumerate([5, 3, 5, 9, 3, 3])]])
+        self.mcu = Mcu(None, MCU, {EQS: [{ID: 1}, {ID: 2}]})
+
+    def link(self, epoch, leaves_indices):
+        # Links the given rows to the leaves the way DataManager does
+        leaves_logs = {leaf: self.store.view(indices) for leaf, indices in leaves_indices.items()}
+        leaf_rollups = LogRollup.from_groups(self.store, [np.array(indices) for indices in leaves_indices.values()])
+        rollups = {}
+        self.mcu.collect_rollups(dict(zip(leaves_indices, leaf_rollups)), rollups)
+        linked_logs = LinkedLogs(epoch, leaves_logs, rollups)
+        linked_logs.attach()
+        return linked_logs
+
+    def test_components_read_the_attached_linking(self):
+        linked_logs = self.link(1, {self.mcu.iqr: [3, 4], self.mcu.eqs[1]: [1]})
+        self.assertIs(self.mcu.iqr.linked_logs, linked_logs)
+        self.assertEqual(self.mcu.iqr.active_logs.get_attribute(TID), [9, 3])
+        self.assertEqual(self.mcu.get_attribute_from_active_logs(TID), [9, 3, 3])
+        self.assertEqual(self.mcu.rollup.count, 3)
+        self.assertEqual(self.mcu.bin.active_logs, [])
+        self.assertFalse(self.mcu.bin.rollup)
+
+    def test_retiring_clears_every_component(self):
+        linked_logs = self.link(1, {self.mcu.iqr: [3, 4], self.mcu.eqs[1]: [1]})
+        linked_logs.retire()
+        self.assertEqual(self.mcu.get_attribute_from_active_logs(TID), [])
+        self.assertFalse(self.mcu.rollup)
+        self.assertFalse(self.mcu.eqs[1].rollup)
+
+    def test_new_linking_replaces_the_previous_one(self):
+        first = self.link(1, {self.mcu.iqr: [3, 4], self.mcu.eqs[1]: [1]})
+        second = self.link(2, {self.mcu.iqr: [0]})
+        first.retire()
+        self.assertEqual(self.mcu.get_attribute_from_active_logs(TID), [5])
+        # Components without logs in the new linking still refer to the retired one and read as empty
+        self.assertIs(self.mcu.eqs[1].linked_logs, first)
+        self.assertFalse(self.mcu.eqs[1].rollup)
+        # The retired linking no longer holds the views of its logs
+        self.assertEqual(first.logs, {})
+        self.assertEqual(first.rollups, {})
+        self.assertEqual(self.mcu.rollup.tids, [5])
+        self.assertEqual(second.epoch, 2)
+
+    def test_assigning_logs_detaches_the_component(self):
+        self.link(1, {self.mcu.iqr: [3, 4]})
+        self.mcu.iqr.active_logs = self.store.view([2])
+        self.assertIsNone(self.mcu.iqr.linked_logs)
+        self.assertEqual(self.mcu.iqr.active_logs.get_attribute(TID), [5])
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from utils.backend import FilterFactory
+from utils.log_ingest import LogFileReader, get_rows_capacity
+from utils.log_store import LogStoreBuilder, ENCODED_COLUMNS
+
+LOGS_COUNT = 5000
+FIRST_TIME = 1726671833
+SMALL_CHUNK_BYTES = 4096
+WORKERS = 2
+SHORTEST_LOG = "timestamp:1.0,cluster_id:chip:0;die:0;quad:0;row:0;col:0,area:,unit:,in/out:in,tid:0,packet/data:"
+
+
+class TestLogIngest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.logs_file = os.path.join(cls.temp_dir.name, 'logs.csv')
+        lines = []
+        for i in range(LOGS_COUNT):
+            line = (f"timestamp:{FIRST_TIME + i // 4}.{i % 1000:06d},"
+                    f"cluster_id:chip:0;die:{i % 2};quad:{i % 4};row:{i % 3};col:{i % 5},"
+                    f"area:{'hbm' if i % 3 else 'mcu gate 1'},unit:{'eq;3' if i % 5 else 'lnb'},"
+                    f"in/out:{'in' if i % 7 else 'out'},tid:{i % 11},packet/data:sample data {i} é")
+            if i % 97 == 1:
+                line = line.replace(",tid:", ",tid:x")
+            elif i % 89 == 2:
+                line += "\r"
+            lines.append(line)
+        with open(cls.logs_file, 'w', newline='', encoding='utf-8') as file:
+            file.write("\n".join(lines))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def read_filter_factory_store(self):
+        filter_factory = FilterFactory(self.logs_file)
+        filter_factory.start_logs()
+        builder = LogStoreBuilder()
+        for columns in filter_factory.stream_columns(1000):
+            builder.add_columns(columns)
+        filter_factory.join_thread()
+        return builder.build()
+
+    def assert_same_logs(self, store, expected):
+        self.assertEqual(len(store), len(expected))
+        for column in store.rows.dtype.names:
+            with self.subTest(column=column):
+                if column in ENCODED_COLUMNS:
+                    self.assertEqual(store.decode(column, store.rows[column]),
+                                     expected.decode(column, expected.rows[column]))
+                elif column != 'packet_offset':
+                    self.assertTrue(np.array_equal(store.rows[column], expected.rows[column]))
+        indices = np.arange(len(store))
+        self.assertEqual(store.get_packets(indices), expected.get_packets(indices))
+
+    def test_same_logs_as_filter_factory(self):
+        # Malformed lines are skipped and line ends are dropped as FilterFactory does
+        reader = LogFileReader(self.logs_file)
+        store = reader.read_log_store()
+        self.assertLess(len(store), LOGS_COUNT)
+        self.assert_same_logs(store, self.read_filter_factory_store())
+        self.assertEqual(reader.bytes_read, reader.file_size)
+
+    def test_packets_stay_in_file(self):
+        # The packets are read from the mapped file at their offsets in it
+        reader = LogFileReader(self.logs_file)
+        store = reader.read_log_store()
+        self.assertIs(store.packets, reader.mapping)
+        with open(self.logs_file, 'rb') as file:
+            contents = file.read()
+        offset, length = int(store.rows['packet_offset'][-1]), int(store.rows['packet_length'][-1])
+        self.assertEqual(contents[offset:offset + length], f"sample data {LOGS_COUNT - 1} é".encode())
+
+    def test_chunks(self):
+        # Chunks end on whole lines, so small chunks read the same logs
+        reader = LogFileReader(self.logs_file)
+        builder = reader.create_builder()
+        chunks_count = 0
+        for columns in reader.read_chunks(SMALL_CHUNK_BYTES):
+            builder.add_shared_columns(columns)
+            chunks_count += 1
+            self.assertLessEqual(reader.bytes_read, reader.file_size)
+        self.assertGreater(chunks_count, 1)
+        self.assert_same_logs(builder.build(), LogFileReader(self.logs_file).read_log_store())
+
+    def test_workers(self):
+        # The chunks parsed by the workers are taken in file order
+        reader = LogFileReader(self.logs_file, workers=WORKERS)
+        builder = reader.create_builder()
+        for columns in reader.read_chunks(SMALL_CHUNK_BYTES):
+            builder.add_shared_columns(columns)
+        self.assertEqual(reader.bytes_read, reader.file_size)
+        self.assert_same_logs(builder.build(), self.read_filter_factory_store())
+
+    def test_workers_stopped(self):
+        # A reading stopped early releases the chunks parsed ahead, and the file can be read again
+        chunks = LogFileReader(self.logs_file, workers=WORKERS).read_chunks(SMALL_CHUNK_BYTES)
+        self.assertGreater(len(next(chunks)), 0)
+        chunks.close()
+        self.assertGreater(len(LogFileReader(self.logs_file, workers=WORKERS).read_log_store()), 0)
+
+    def test_rows_capacity(self):
+        # The shared memory of a chunk has room for a log on every line of it
+        for count in (1, 2, 100):
+            chunk = "\n".join([SHORTEST_LOG] * count).encode()
+            self.assertEqual(get_rows_capacity(len(chunk)), count)
+            self.assertEqual(get_rows_capacity(len(chunk) + 1), count)
+
+    def test_empty_file(self):
+        empty_file = os.path.join(self.temp_dir.name, 'empty.csv')
+        open(empty_file, 'w').close()
+        self.assertEqual(len(LogFileReader(empty_file).read_log_store()), 0)
+
+# if __name__ == '__main__':
+#     unittest.main()
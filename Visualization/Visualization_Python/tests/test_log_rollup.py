@@ -0,0 +1,55 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from entities.log_rollup import LogRollup
+from entities.mcu import Mcu
+from utils.constants import EQS, ID, TID
+from utils.log_store import LogStore
+from utils.type_names import MCU
+
+
+def make_log(time_stamp, tid):
+    cluster_id = SimpleNamespace(chip=0, die=0, quad=0, row=0, col=0)
+    return SimpleNamespace(timeStamp=time_stamp, clusterId=cluster_id, area="mcu gate 1", unit="iqr", io="in",
+                           tid=tid, packet=f"packet {time_stamp}")
+
+
+class TestLogRollup(unittest.TestCase):
+
+    def setUp(self):
+        self.store = LogStore.from_log_batches([[make_log(100 + i, tid) for i, tid in enumerate([5, 3, 5, 9, 3, 3])]])
+
+    def test_from_groups(self):
+        groups = [np.array([0, 1, 2, 4]), np.array([], dtype=np.int64), np.array([1, 3, 5])]
+        rollup, empty, last = LogRollup.from_groups(self.store, groups)
+        self.assertEqual(rollup.count, 4)
+        # TIDs are kept in order of first appearance
+        self.assertEqual(list(rollup.tid_counts.items()), [(5, 2), (3, 2)])
+        self.assertEqual((rollup.first_time, rollup.last_time), (100, 104))
+        self.assertFalse(empty)
+        self.assertEqual(list(last.tid_counts.items()), [(3, 2), (9, 1)])
+        self.assertEqual((last.first_time, last.last_time), (101, 105))
+
+    def test_component_tree_rollup(self):
+        # The rollup of a component agrees with the logs returned by get_attribute_from_active_logs
+        mcu = Mcu(None, MCU, {EQS: [{ID: 1}, {ID: 2}]})
+        mcu.iqr.active_logs = self.store.view([3, 4])
+        mcu.eqs[1].active_logs = self.store.view([1])
+        mcu.active_logs = self.store.view([5])
+        leaf_rollups = dict(zip([mcu.iqr, mcu.eqs[1], mcu], LogRollup.from_groups(
+            self.store, [np.array([3, 4]), np.array([1]), np.array([5])])))
+        rollups = {}
+        rollup = mcu.collect_rollups(leaf_rollups, rollups)
+        tids = mcu.get_attribute_from_active_logs(TID)
+        self.assertEqual(rollup.count, len(tids))
+        self.assertEqual(rollup.tids, list(dict.fromkeys(tids)))
+        self.assertEqual((rollup.first_time, rollup.last_time), (101, 105))
+        self.assertEqual(rollups[mcu.eqs[1]].tids, [3])
+        # Only non-empty rollups are kept, and components without a linking have an empty one
+        self.assertEqual(set(rollups), {mcu, mcu.iqr, mcu.eqs[1]})
+        self.assertFalse(mcu.bin.rollup)
+
+# if __name__ == '__main__':
+#     unittest.main()
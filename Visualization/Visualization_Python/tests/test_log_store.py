@@ -0,0 +1,113 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from entities.component import Component
+from utils.log_store import LogStore, LogStoreBuilder, LogViewChain, LOG_DTYPE, ENCODED_COLUMNS
+
+
+def make_log(time_stamp, die, area, unit, io, tid, packet):
+    # Mirrors the fields of filter_factory_module.Log
+    cluster_id = SimpleNamespace(chip=0, die=die, quad=1, row=2, col=3)
+    return SimpleNamespace(timeStamp=time_stamp, clusterId=cluster_id, area=area, unit=unit, io=io, tid=tid,
+                           packet=packet)
+
+
+def make_columns(batch):
+    # Mirrors filter_factory_module.LogColumns: the codes and packet offsets are those of the batch alone
+    store = LogStore.from_log_batches([batch])
+    return SimpleNamespace(rows=store.rows.copy(), packets=np.frombuffer(store.packets, dtype=np.uint8),
+                           dictionaries={column: store.dictionaries[column] for column in ENCODED_COLUMNS})
+
+
+class TestLogStore(unittest.TestCase):
+
+    def setUp(self):
+        batches = [
+            [make_log(1726671833, 0, "hbm", "hbm", "in", 7, "sample data 0"),
+             make_log(1726671834, 1, "mcu gate 1", "eq;3", "out", 117, "")],
+            [make_log(1726671835, 0, "hbm", "hbm", "out", 7, "sample data 2 é")],
+        ]
+        self.batches = batches
+        self.store = LogStore.from_log_batches(batches)
+
+    def test_row_size(self):
+        # A log takes less than 40 bytes in the store, packets excluded
+        self.assertLess(LOG_DTYPE.itemsize, 40)
+        self.assertEqual(len(self.store), 3)
+
+    def test_dictionary_encoding(self):
+        # Repeated strings are stored once per column
+        self.assertEqual(self.store.dictionaries['area'], ["hbm", "mcu gate 1"])
+        self.assertEqual(self.store.dictionaries['io'], ["in", "out"])
+        self.assertEqual(self.store.get_code('unit', "eq;3"), 1)
+        self.assertIsNone(self.store.get_code('unit', "lnb"))
+
+    def test_get_attribute(self):
+        # Attributes are read back with the names and values of the original logs
+        indices = [2, 0]
+        self.assertEqual(self.store.get_attribute('tid', indices), [7, 7])
+        self.assertEqual(self.store.get_attribute('io', indices), ["out", "in"])
+        self.assertEqual(self.store.get_attribute('packet', indices), ["sample data 2 é", "sample data 0"])
+        with self.assertRaises(AttributeError):
+            self.store.get_attribute('missing', indices)
+
+    def test_builder_partial_stores(self):
+        # A store built from the first batches is not changed by the batches added after it
+        builder = LogStoreBuilder()
+        builder.add_batch(self.batches[0])
+        partial = builder.build()
+        builder.add_batch(self.batches[1])
+        full = builder.build()
+        self.assertEqual(len(partial), 2)
+        self.assertEqual(partial.get_attribute('io', [0, 1]), ["in", "out"])
+        self.assertEqual(partial.dictionaries['area'], ["hbm", "mcu gate 1"])
+        self.assertEqual(full.rows.tolist(), self.store.rows.tolist())
+        self.assertEqual(full.get_attribute('packet', [2]), ["sample data 2 é"])
+
+    def test_builder_columns(self):
+        # Batches of columns give the same store as the logs, whatever the codes of each batch
+        builder = LogStoreBuilder()
+        builder.add_columns(make_columns(self.batches[1]))
+        builder.add_batch(self.batches[0])
+        builder.add_columns(make_columns(self.batches[1] + self.batches[0]))
+        store = builder.build()
+        expected = LogStore.from_log_batches([self.batches[1], self.batches[0], self.batches[1] + self.batches[0]])
+        self.assertEqual(len(builder), 6)
+        self.assertEqual(store.dictionaries, expected.dictionaries)
+        self.assertEqual(store.rows.tolist(), expected.rows.tolist())
+        self.assertEqual(store.get_attribute('packet', range(6)), expected.get_attribute('packet', range(6)))
+
+    def test_component_active_logs_view(self):
+        # A component reads its attributes through the view of its rows
+        component = Component(type_name="test")
+        self.assertEqual(component.get_attribute_from_active_logs('tid'), [])
+        component.active_logs = self.store.view([1])
+        self.assertEqual(component.get_attribute_from_active_logs('tid'), [117])
+        self.assertEqual(component.get_attribute_from_active_logs('packet'), [""])
+        self.assertEqual(component.get_attribute_from_active_logs('missing'), [])
+
+    def test_view_chain(self):
+        # A chain reads its views as one list, in order, and skips the empty ones
+        chain = LogViewChain([self.store.view([2]), self.store.view([]), self.store.view([1, 0])])
+        self.assertEqual(len(chain), 3)
+        self.assertEqual([chain.get_tid(position) for position in range(3)], [7, 117, 7])
+        self.assertEqual(chain.get_packet(0), "sample data 2 é")
+        self.assertEqual(chain.get_packet(2), "sample data 0")
+        self.assertEqual(chain.get_tids().tolist(), [7, 117, 7])
+        self.assertEqual(chain.get_packets(), ["sample data 2 é", "", "sample data 0"])
+        self.assertEqual(len(LogViewChain([])), 0)
+        self.assertEqual(LogViewChain([]).get_tids().tolist(), [])
+
+    def test_component_active_log_views(self):
+        # The views of a component list its logs like get_attribute_from_active_logs
+        component = Component(type_name="test")
+        self.assertEqual(component.get_active_log_views(), [])
+        component.active_logs = self.batches[0]
+        chain = LogViewChain(component.get_active_log_views())
+        self.assertEqual(chain.get_tids().tolist(), component.get_attribute_from_active_logs('tid'))
+        self.assertEqual(chain.get_packets(), component.get_attribute_from_active_logs('packet'))
+
+# if __name__ == '__main__':
+#     unittest.main()
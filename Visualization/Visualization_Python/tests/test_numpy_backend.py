@@ -0,0 +1,281 @@
+import os
+import random
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from utils import numpy_backend
+
+try:
+    import filter_factory_module
+    import logs_factory
+    NATIVE = SimpleNamespace(FilterFactory=filter_factory_module.FilterFactory,
+                             FilterType=filter_factory_module.FilterType, Cluster=filter_factory_module.Cluster,
+                             LogsFactory=logs_factory.LogsFactory)
+except ImportError:
+    NATIVE = None
+
+# The logs file of the FilterFactory tests in main.cpp, the last line without a new line
+TEST_LOGS = (
+    "timestamp:1726671833.525302,cluster_id:chip:0;die:0;quad:0;row:1;col:1,area:mcu gate 1,unit:BMT,in/out:in,tid:117,packet/data:sample data 0\n"
+    "timestamp:1726671845.525302,cluster_id:chip:0;die:1;quad:2;row:2;col:2,area:hbm,unit:lnb,in/out:out,tid:7,packet/data:sample data 1\n"
+    "timestamp:1726671855.525302,cluster_id:chip:0;die:0;quad:3;row:3;col:3,area:host_if,unit:hbm,in/out:in,tid:5,packet/data:sample data 2\n"
+    "timestamp:1726671865.525302,cluster_id:chip:0;die:1;quad:1;row:0;col:0,area:hbm,unit:lnb,in/out:in,tid:117,packet/data:sample data 3\n"
+    "timestamp:1726671875.525302,cluster_id:chip:0;die:1;quad:0;row:1;col:1,area:host_if,unit:BMT,in/out:in,tid:7,packet/data:sample data 4\n"
+    "timestamp:1726671885.525302,cluster_id:chip:0;die:1;quad:1;row:2;col:2,area:host_if,unit:hbm,in/out:in,tid:7,packet/data:sample data 5\n"
+    "timestamp:1726671895.525302,cluster_id:chip:0;die:1;quad:2;row:3;col:3,area:hbm,unit:hbm,in/out:in,tid:117,packet/data:sample data 6\n"
+    "timestamp:1726671905.525302,cluster_id:chip:0;die:0;quad:1;row:0;col:0,area:host_if,unit:hbm,in/out:in,tid:7,packet/data:sample data 7\n"
+    "timestamp:1726671915.525302,cluster_id:chip:0;die:0;quad:3;row:1;col:1,area:host_if,unit:hbm,in/out:in,tid:117,packet/data:sample data 8\n"
+    "timestamp:1726671925.525302,cluster_id:chip:0;die:0;quad:1;row:3;col:3,area:hbm,unit:BMT,in/out:in,tid:117,packet/data:sample data 9"
+)
+START_TIME = 1726671833
+END_TIME = 1726671915
+PARITY_LOGS_COUNT = 3000
+
+
+class FilterFactoryCases:
+    """
+    The FilterFactory and LogsFactory tests of main.cpp, run over the backend of the test class.
+    """
+    backend = numpy_backend
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.logs_file = os.path.join(self.temp_dir.name, 'tests_logs.csv')
+        with open(self.logs_file, 'w', newline='') as file:
+            file.write(TEST_LOGS)
+        self.filter_factory = self.backend.FilterFactory(self.logs_file)
+        self.filter_factory.set_start_time(START_TIME)
+        self.filter_factory.set_end_time(END_TIME)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read_logs(self):
+        logs = []
+        self.filter_factory.start_logs()
+        while not self.filter_factory.is_finished_process() or self.filter_factory.has_log():
+            if self.filter_factory.has_log():
+                logs.append(self.filter_factory.get_log())
+        self.filter_factory.join_thread()
+        return logs
+
+    def test_time_range(self):
+        self.assertEqual(len(self.read_logs()), 9)
+
+    def test_cluster(self):
+        cluster_id = self.backend.Cluster(0, 0, 0, 1, 1)
+        self.filter_factory.add_filter_to_chain((self.backend.FilterType.Cluster, cluster_id))
+        logs = self.read_logs()
+        self.assertEqual(len(logs), 1)
+        self.assertTrue(all(log.clusterId == cluster_id for log in logs))
+
+        self.filter_factory.remove_filter(self.backend.FilterType.Cluster)
+        self.assertEqual(len(self.read_logs()), 9)
+
+    def test_quad(self):
+        self.filter_factory.add_filter_to_chain((self.backend.FilterType.Quad, (0, 1, 1)))
+        logs = self.read_logs()
+        self.assertEqual(len(logs), 2)
+        self.assertTrue(all((log.clusterId.chip, log.clusterId.die, log.clusterId.quad) == (0, 1, 1) for log in logs))
+
+    def test_area_unit_io(self):
+        for filter_type, value, count in ((self.backend.FilterType.Area, "host_if", 5),
+                                          (self.backend.FilterType.Unit, "lnb", 2),
+                                          (self.backend.FilterType.Io, "in", 8)):
+            self.filter_factory.clear_filters()
+            self.filter_factory.add_filter_to_chain((filter_type, value))
+            logs = self.read_logs()
+            self.assertEqual(len(logs), count)
+            self.assertTrue(all(getattr(log, filter_type.name.lower()) == value for log in logs))
+
+    def test_thread_id(self):
+        self.filter_factory.add_filter_to_chain((self.backend.FilterType.ThreadId, [117]))
+        logs = self.read_logs()
+        self.assertEqual(len(logs), 4)
+        self.assertTrue(all(log.tid == 117 for log in logs))
+
+    def test_filter_by_name(self):
+        # The data manager names the filter types
+        self.filter_factory.add_filter_to_chain(("ThreadId", [117]))
+        self.filter_factory.update_filter_in_chain(("ThreadId", [7]))
+        self.assertEqual(list(self.filter_factory.get_value_of_filter("ThreadId")), [7])
+        self.assertEqual(len(self.read_logs()), 4)
+
+    def test_get_logs_batches(self):
+        logs = []
+        self.filter_factory.start_logs()
+        while not self.filter_factory.is_finished_process() or self.filter_factory.has_log():
+            batch = self.filter_factory.get_logs(4)
+            self.assertLessEqual(len(batch), 4)
+            logs.extend(batch)
+        self.filter_factory.join_thread()
+        self.assertEqual(len(logs), 9)
+        times = [log.timeStamp for log in logs]
+        self.assertEqual(times, sorted(times))
+        self.assertEqual(self.filter_factory.get_logs(4), [])
+
+    def test_stream(self):
+        self.filter_factory.add_filter_to_chain((self.backend.FilterType.ThreadId, [7]))
+        self.filter_factory.start_logs()
+        batches = list(self.filter_factory.stream(2))
+        self.filter_factory.join_thread()
+        self.assertTrue(self.filter_factory.is_finished_process())
+        self.assertTrue(all(len(batch) <= 2 for batch in batches))
+        self.assertEqual([log.tid for batch in batches for log in batch], [7] * 4)
+
+    def test_stream_columns(self):
+        self.filter_factory.start_logs()
+        batches = list(self.filter_factory.stream_columns(3))
+        self.filter_factory.join_thread()
+        self.assertTrue(all(0 < len(batch) <= 3 for batch in batches))
+        rows = np.concatenate([np.asarray(batch.rows) for batch in batches])
+        self.assertEqual(rows.dtype.itemsize, 33)
+        self.assertEqual(rows['tid'].tolist(), [117, 7, 5, 117, 7, 7, 117, 7, 117])
+        last = batches[-1]
+        packets = np.asarray(last.packets).tobytes()
+        offset, length = int(last.rows['packet_offset'][-1]), int(last.rows['packet_length'][-1])
+        self.assertEqual(packets[offset:offset + length], b"sample data 8")
+        self.assertEqual(last.dictionaries['area'][int(last.rows['area'][-1])], "host_if")
+
+    def test_cancel(self):
+        self.filter_factory.add_filter_to_chain((self.backend.FilterType.ThreadId, [7]))
+        # A cancelled process ends the stream without logs
+        self.filter_factory.start_logs()
+        self.filter_factory.cancel()
+        self.assertEqual(list(self.filter_factory.stream(2)), [])
+        self.filter_factory.join_thread()
+        self.assertTrue(self.filter_factory.is_cancelled())
+
+        # A cancelled factory stays cancelled, a new process needs a new factory
+        self.filter_factory.start_logs()
+        self.assertEqual(list(self.filter_factory.stream(2)), [])
+        self.filter_factory.join_thread()
+        self.assertTrue(self.filter_factory.is_cancelled())
+
+        filter_factory = self.backend.FilterFactory(self.logs_file)
+        filter_factory.add_filter_to_chain((self.backend.FilterType.ThreadId, [7]))
+        filter_factory.start_logs()
+        self.assertEqual(sum(len(batch) for batch in filter_factory.stream(2)), 4)
+        filter_factory.join_thread()
+
+    def test_cancel_before_start(self):
+        # A cancel made before the start is kept, so the process ends without logs
+        self.filter_factory.cancel()
+        self.filter_factory.start_logs()
+        self.assertEqual(list(self.filter_factory.stream(2)), [])
+        self.filter_factory.join_thread()
+        self.assertTrue(self.filter_factory.is_cancelled())
+
+    def test_bytes_read(self):
+        filter_factory = self.backend.FilterFactory(self.logs_file)
+        file_size = filter_factory.get_file_size()
+        self.assertGreater(file_size, 0)
+        filter_factory.start_logs()
+        for _ in filter_factory.stream(2):
+            self.assertLessEqual(filter_factory.get_bytes_read(), file_size + 1)
+        filter_factory.join_thread()
+        self.assertGreaterEqual(filter_factory.get_bytes_read(), file_size)
+        self.assertEqual(filter_factory.get_filtered_count(), 10)
+
+    def test_logs_factory(self):
+        logs_factory = self.backend.LogsFactory(self.logs_file)
+        self.assertEqual(logs_factory.get_first_log_time(), 1726671833)
+        self.assertEqual(logs_factory.get_last_log_time(), 1726671925)
+        self.assertEqual(self.backend.LogsFactory(os.path.join(self.temp_dir.name, 'missing.csv'))
+                         .get_first_log_time(), -1)
+
+
+class TestNumpyBackend(FilterFactoryCases, unittest.TestCase):
+    backend = numpy_backend
+
+
+@unittest.skipUnless(NATIVE, "The native modules are not built")
+class TestNativeBackend(FilterFactoryCases, unittest.TestCase):
+    backend = NATIVE
+
+
+@unittest.skipUnless(NATIVE, "The native modules are not built")
+class TestBackendParity(unittest.TestCase):
+    """
+    Both backends take the same logs of a file with malformed lines, line ends and values.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.logs_file = os.path.join(cls.temp_dir.name, 'logs.csv')
+        generator = random.Random(7)
+        lines = []
+        for i in range(PARITY_LOGS_COUNT):
+            line = (f"timestamp:{1726671833 + i // 3}.{generator.randint(0, 999999)},"
+                    f"cluster_id:chip:{generator.randint(-2, 2)};die:{i % 2};quad:{i % 4};row:{i % 3};col:{i % 5},"
+                    f"area:{generator.choice(['hbm', 'host if', 'a,unit:b'])},unit:{generator.choice(['lnb', 'eq;1', ''])},"
+                    f"in/out:{generator.choice(['in', 'out', 'inout'])},tid:{i % 11},packet/data:sample data {i},tid:1")
+            kind = i % 23
+            if kind == 1:
+                line = line.replace("timestamp:", "timestamp: ")
+            elif kind == 2:
+                line = line[:generator.randint(1, len(line))]
+            elif kind == 3:
+                line += "\r"
+            elif kind == 4:
+                line = line.replace(",area:", " \t,area:")
+            elif kind == 5:
+                line = line.replace(";col:", ";col:-")
+            elif kind == 6:
+                line = line.replace(",tid:", ",tid:99999999999", 1)
+            elif kind == 7:
+                line = line.replace("timestamp:", "timestamp:99999999999999999999")
+            lines.append(line)
+        with open(cls.logs_file, 'w', newline='') as file:
+            file.write("\n".join(lines))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def read_logs(self, backend, filters, start_time=None, end_time=None):
+        filter_factory = backend.FilterFactory(self.logs_file)
+        for filter_type, value in filters:
+            if filter_type == "Cluster":
+                value = backend.Cluster(*value)
+            filter_factory.add_filter_to_chain((filter_type, value))
+        if start_time is not None:
+            filter_factory.set_start_time(start_time)
+        if end_time is not None:
+            filter_factory.set_end_time(end_time)
+        filter_factory.start_logs()
+        logs = []
+        for columns in filter_factory.stream_columns(100):
+            packets = np.asarray(columns.packets).tobytes()
+            for row in np.asarray(columns.rows).tolist():
+                time_stamp, chip, die, quad, row_id, col, area, unit, io, tid, offset, length = row
+                logs.append((time_stamp, chip, die, quad, row_id, col, columns.dictionaries['area'][area],
+                             columns.dictionaries['unit'][unit], columns.dictionaries['io'][io], tid,
+                             packets[offset:offset + length]))
+        filter_factory.join_thread()
+        return logs
+
+    def test_same_logs(self):
+        cases = [([], None, None),
+                 ([("ThreadId", [1, 2, 3]), ("Io", "in")], None, None),
+                 ([("Area", "a")], None, None),
+                 ([("Unit", "")], None, None),
+                 ([("Cluster", (-1, 1, 1, 1, 1))], None, None),
+                 ([("Quad", (2, 1, 3))], 1726672000, 1726672500)]
+        for filters, start_time, end_time in cases:
+            with self.subTest(filters=filters, start_time=start_time):
+                expected = self.read_logs(NATIVE, filters, start_time, end_time)
+                self.assertTrue(expected)
+                self.assertEqual(self.read_logs(numpy_backend, filters, start_time, end_time), expected)
+
+    def test_same_times(self):
+        native, fallback = NATIVE.LogsFactory(self.logs_file), numpy_backend.LogsFactory(self.logs_file)
+        self.assertEqual(fallback.get_first_log_time(), native.get_first_log_time())
+        self.assertEqual(fallback.get_last_log_time(), native.get_last_log_time())
+
+# if __name__ == '__main__':
+#     unittest.main()
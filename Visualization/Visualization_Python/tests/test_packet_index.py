@@ -0,0 +1,54 @@
+import unittest
+from types import SimpleNamespace
+
+from utils.log_store import LogStore, LogViewChain
+from utils.packet_index import PacketIndex
+
+PACKETS = ["READ addr=0x10 data=FF", "write addr=0x20", "", "read addr=0x30 data=ff É", "Écrit 0x10", "ff"]
+
+
+def make_log(time_stamp, packet):
+    cluster_id = SimpleNamespace(chip=0, die=0, quad=0, row=0, col=0)
+    return SimpleNamespace(timeStamp=time_stamp, clusterId=cluster_id, area="hbm", unit="hbm", io="in", tid=1,
+                           packet=packet)
+
+
+class TestPacketIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.store = LogStore.from_log_batches([[make_log(i, packet) for i, packet in enumerate(PACKETS)]])
+        # The chain lists the packets in another order than the store
+        self.chain = LogViewChain([self.store.view([3, 4, 5]), self.store.view([]), self.store.view([0, 1, 2])])
+        self.index = PacketIndex(self.chain)
+
+    def scan(self, query):
+        return [position for position, packet in enumerate(self.chain.get_packets())
+                if query.lower() in packet.lower()]
+
+    def test_matches_a_scan_of_the_packets(self):
+        self.assertEqual(len(self.index), len(self.chain))
+        for query in ["read", "READ ADDR", "0x10", "ff", "f", "data=ff é", "é", "addr=0x20", "0x10 data", "x"]:
+            with self.subTest(query=query):
+                self.assertEqual(self.index.search(query).tolist(), self.scan(query))
+
+    def test_no_match_across_packets(self):
+        # The end of a packet and the start of the next one never match together
+        self.assertEqual(self.index.search("0x10ff").tolist(), [])
+        self.assertEqual(self.index.search("missing").tolist(), [])
+        self.assertEqual(self.index.search("\0").tolist(), [])
+
+    def test_empty_query(self):
+        self.assertIsNone(self.index.search(""))
+        self.assertEqual(len(PacketIndex(LogViewChain([]))), 0)
+        self.assertEqual(PacketIndex(LogViewChain([])).search("read").tolist(), [])
+
+    def test_longer_queries_reuse_the_results(self):
+        # Typing a query searches only the packets that matched its start
+        first = self.index.search("ADDR=0x")
+        self.assertIs(self.index.search("addr=0x"), first)
+        self.assertEqual(self.index.search("addr=0x1").tolist(), self.scan("addr=0x1"))
+        self.assertEqual(self.index.search("addr=0x10 data=ff").tolist(), self.scan("addr=0x10 data=ff"))
+        self.assertEqual(list(self.index.results), ["addr=0x", "addr=0x1", "addr=0x10 data=ff"])
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+import numpy as np
+
+from utils.result_cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        # Room for three results of 10 indices
+        self.cache = ResultCache(budget_bytes=3 * 10 * 4)
+        self.results = {name: np.arange(10, dtype=np.uint32) for name in "abcd"}
+
+    def test_hits_and_misses(self):
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.put("a", self.results["a"])
+        self.assertIs(self.cache.get("a"), self.results["a"])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_least_recently_used_is_evicted(self):
+        for name in "abc":
+            self.cache.put(name, self.results[name])
+        self.cache.get("a")
+        self.cache.put("d", self.results["d"])
+        self.assertEqual(list(self.cache.entries), ["c", "a", "d"])
+        self.assertEqual(self.cache.size_bytes, 3 * 10 * 4)
+
+    def test_result_over_budget_is_not_cached(self):
+        self.cache.put("a", self.results["a"])
+        self.cache.put("big", np.arange(100, dtype=np.uint32))
+        self.assertEqual(list(self.cache.entries), ["a"])
+        self.cache.clear()
+        self.assertEqual((len(self.cache), self.cache.size_bytes), (0, 0))
+
+    def test_canonical_key(self):
+        # The same filters in another order share the result
+        self.assertEqual(ResultCache.make_key([("Io", "in"), ("Area", "hbm")], 1, 2),
+                         ResultCache.make_key([("Area", "hbm"), ("Io", "in")], 1, 2))
+        self.assertNotEqual(ResultCache.make_key([("Io", "in")], 1, 2), ResultCache.make_key([("Io", "in")], 1, 3))
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,20 @@
+"""
+The engine that reads the logs file: the native filter_factory_module and logs_factory modules when they can be
+imported, otherwise their NumPy counterparts in utils.numpy_backend.
+"""
+import os
+
+from utils.constants import LOG_BACKEND_ENV, NATIVE_BACKEND, NUMPY_BACKEND
+
+BACKEND_NAME = NUMPY_BACKEND
+if os.environ.get(LOG_BACKEND_ENV, NATIVE_BACKEND) != NUMPY_BACKEND:
+    try:
+        from filter_factory_module import FilterFactory, FilterType, Cluster, Log
+        from logs_factory import LogsFactory
+        BACKEND_NAME = NATIVE_BACKEND
+    except ImportError:
+        # The native modules are built for Windows only
+        pass
+
+if BACKEND_NAME == NUMPY_BACKEND:
+    from utils.numpy_backend import FilterFactory, FilterType, Cluster, Log, LogsFactory
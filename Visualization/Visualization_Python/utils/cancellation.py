@@ -0,0 +1,52 @@
+import threading
+from typing import Callable, List
+
+from utils.error_messages import ErrorMessages
+
+
+class JobCancelled(Exception):
+    """
+    Raised inside a job once its token was cancelled.
+    """
+
+
+class CancellationToken:
+    """
+    Tells a running job that its result is no longer wanted.
+
+    The job checks the token between its steps, and work it hands to other threads, such as the C++ producer
+    thread of a FilterFactory, registers a callback that stops that work as soon as the token is cancelled.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.is_cancelled = False
+        self.callbacks: List[Callable[[], None]] = []
+
+    def cancel(self) -> None:
+        with self.lock:
+            if self.is_cancelled:
+                return
+            self.is_cancelled = True
+            callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Calls the callback once the token is cancelled, right away if it already is.
+        """
+        with self.lock:
+            if not self.is_cancelled:
+                self.callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        with self.lock:
+            if callback in self.callbacks:
+                self.callbacks.remove(callback)
+
+    def raise_if_cancelled(self) -> None:
+        if self.is_cancelled:
+            raise JobCancelled(ErrorMessages.JOB_CANCELLED.value)
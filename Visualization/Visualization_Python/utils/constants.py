@@ -93,6 +93,20 @@ UTF_8 = 'utf-8'
 NUM_QUADS_PER_SIDE = 2
 NUM_CLUSTERS_PER_SIDE = 8
 NUM_DIES = 2
+LOGS_BATCH_SIZE = 10000
+LOG_BACKEND_ENV = "VISUALIZATION_LOG_BACKEND"  # Set to NUMPY_BACKEND to read the logs without the native modules
+NATIVE_BACKEND = "native"
+NUMPY_BACKEND = "numpy"
+PARTIAL_RESULT_INTERVAL_SECONDS = 0.1  # Least time between two partial linkings while the logs file is read
+PROGRESS_BAR_RANGE = 1000
+RESULT_CACHE_BUDGET_BYTES = 64 * 1024 * 1024
+JOB_POOL_MAX_THREADS = 2  # One query of the main window and one load of data
+LOAD_DATA_JOB = "load data"
+SEARCH_PACKETS_JOB = "search packets"
+SEARCH_DEBOUNCE_MS = 250  # Typing pause before the logs are searched
+CANVAS_RENDERER = "canvas"  # Paints a die on one widget
+WIDGETS_RENDERER = "widgets"  # Builds a widget for every quad and cluster of a die
+DIE_RENDERER = WIDGETS_RENDERER  # The canvas is opt-in: it does not expand quads or show cluster info inline
 TYPE_FILE = "{type_file} Files (*{dot_type_file});;All Files (*)"
 DOT_JSON = ".json"
 DOT_CSV = ".csv"
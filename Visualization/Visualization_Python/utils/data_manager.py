@@ -1,19 +1,29 @@
 import json
+import os
+import time
 import datetime
-from typing import Dict, Any, List
+from contextlib import closing
+from typing import Dict, Any, List, Tuple, Optional, Callable, Iterable
+
+import numpy as np
 
 from entities.die import Die
 from entities.host_interface import HostInterface
 from entities.component import Component
-
-import filter_factory_module
-import logs_factory
-
-from utils.filter_types import FILTER_TYPES_NAMES, CLUSTER, IO
-from utils.type_names import HOST_INTERFACE, BMT, PCIE, AREAS, D2D, ECORE, EQ, HBM, MCU, QUAD, DIE
+from entities.linked_logs import LinkedLogs, LinkingProgress
+from entities.log_rollup import LogRollup
+
+from utils.backend import FilterFactory, LogsFactory, BACKEND_NAME
+from utils.cancellation import CancellationToken
+from utils.filter_engine import FilterEngine
+from utils.leaf_router import LeafRouter
+from utils.log_ingest import LogFileReader, get_workers_count
+from utils.numpy_backend import get_file_size
+from utils.filter_types import FILTER_TYPES_NAMES, CLUSTER
+from utils.log_store import LogStore, LogStoreBuilder, DIE_COLUMN, QUAD_COLUMN, ROW_COLUMN, COL_COLUMN, AREA_COLUMN, UNIT_COLUMN
+from utils.type_names import HOST_INTERFACE, D2D, QUAD, DIE
 from utils.constants import TOP, DIES, ID, ENABLED_CLUSTERS, COL, DID, ROW, NUM_DIES, NUM_QUADS_PER_SIDE, READ, \
-    TIMESTAMP, CLUSTER_ID, CHIP, AREA, UNIT, TID, PACKET
-from utils.paths import LOGS_CSV
+    LOGS_BATCH_SIZE, PARTIAL_RESULT_INTERVAL_SECONDS, NUMPY_BACKEND
 from utils.error_messages import ErrorMessages, WarningMessages
 
 
@@ -21,14 +31,27 @@ class DataManager:
     def __init__(self, chip_file: str, sl_file: str, log_file: str) -> None:
         self.chip_file = chip_file
         self.sl_file = sl_file
-        self.log_file = log_file
+        self.log_file = str(log_file)
         self.chip_data = self.load_json(self.chip_file)
         self.sl_data = self.load_json(self.sl_file)
         self.die_objects = {}
         self.die2die = Component(None, D2D)
         self.host_interface = self.load_host_interface()
-        self.filter_factory = filter_factory_module.FilterFactory(LOGS_CSV)
-        self.logs_factory = logs_factory.LogsFactory(LOGS_CSV)
+        self.logs_factory = LogsFactory(self.log_file)
+        self.log_store = None  # Built from the logs file on the first linking and whenever the file changes
+        self.log_file_signature = None
+        self.filter_engine = None
+        self.leaf_router = None  # Built once all the dies are loaded
+        self.linked_logs = None  # The logs and rollups the entities currently read
+        self.link_epoch = 0  # Epoch of the last linking built
+        self.is_swap_deferred = False  # While set, a linking is kept in pending_linked_logs instead of swapped in
+        self.pending_linked_logs = None
+        self.cancellation_token = None  # Token of the job building the next linking, if it can be cancelled
+        self.report_progress = None  # Receives a LinkingProgress while the logs file is read, if set
+        self.close_token = CancellationToken()  # Cancelled by close, stops reading the logs file
+        self.filters = []  # (filter type, values) pairs, in the order they were added
+        self.start_time = None
+        self.end_time = None
 
     def load_json(self, filename: str) -> Dict[str, Any]:
         """
@@ -44,9 +67,10 @@ class DataManager:
             raise ValueError(ErrorMessages.ERROR.value+
                              ErrorMessages.JSON_NOT_VALID.value.format(filename=filename, error=e))
 
-    def load_die(self, die_index: int) -> Die:
+    def load_die(self, die_index: int, link_logs: bool = True) -> Die:
         """
-        Load a die object by index
+        Load a die object by index.
+        The logs are linked once all the dies are loaded, unless link_logs is False and the caller links them later.
         """
         # Validate the die_index
         dies_data = self.chip_data.get(TOP)
@@ -63,7 +87,8 @@ class DataManager:
             # Check if all dies are loaded, and if so, enable widgets and link logs
             if len(self.die_objects) == NUM_DIES:
                 self.enable_widgets()
-                self.link_the_logs_to_leaf_objects()
+                if link_logs:
+                    self.link_the_logs_to_leaf_objects()
 
         return self.die_objects[die_index]
 
@@ -89,109 +114,230 @@ class DataManager:
 
         return self.host_interface
 
+    def load_log_store(self) -> LogStore:
+        """
+        Reads all the logs of the file once into a columnar log store.
+        While it reads, the logs read so far are linked and reported through report_progress, if set.
+        A cancelled job still reads the whole file, so the request that superseded it links the same store.
+        Closing the data manager stops the reading, and then no store is kept.
+        """
+        # Parsed by several processes, the file is read faster in Python than by the native stream
+        if BACKEND_NAME == NUMPY_BACKEND or get_workers_count(get_file_size(self.log_file)) > 1:
+            return self.ingest_log_store()
+        filter_factory = FilterFactory(self.log_file)
+        # Stops the producer thread as well, not only the loop taking its batches
+        self.close_token.add_callback(filter_factory.cancel)
+        try:
+            filter_factory.start_logs()
+            builder = LogStoreBuilder()
+
+            def get_bytes_consumed() -> int:
+                # The producer reads ahead of the stream, the bytes behind the logs taken so far are estimated
+                # from the share of the queued logs that were taken
+                bytes_read, filtered_count = filter_factory.get_bytes_read(), filter_factory.get_filtered_count()
+                return bytes_read * len(builder) // filtered_count if filtered_count else 0
+
+            # The stream sleeps on the factory's condition variable without holding the GIL between batches
+            return self.build_log_store(builder, filter_factory.stream_columns(LOGS_BATCH_SIZE), builder.add_columns,
+                                        get_bytes_consumed, filter_factory.get_file_size())
+        finally:
+            self.close_token.remove_callback(filter_factory.cancel)
+            filter_factory.join_thread()
+
+    def ingest_log_store(self) -> LogStore:
+        """
+        Reads all the logs of the file into a log store in Python, the packets left in the mapped file.
+        """
+        reader = LogFileReader(self.log_file)
+        builder = reader.create_builder()
+        # Closing the chunks stops the worker processes if the reading stops early
+        with closing(reader.read_chunks()) as chunks:
+            return self.build_log_store(builder, chunks, builder.add_shared_columns,
+                                        lambda: reader.bytes_read, reader.file_size)
+
+    def build_log_store(self, builder: LogStoreBuilder, batches: Iterable[Any], add_batch: Callable[[Any], None],
+                        get_bytes_consumed: Callable[[], int], file_size: int) -> LogStore:
+        """
+        Adds the batches to the builder and returns the store of all of them.
+        """
+        next_report_time = time.perf_counter() + PARTIAL_RESULT_INTERVAL_SECONDS
+        for batch in batches:
+            if self.close_token.is_cancelled:
+                break
+            add_batch(batch)
+            # The partial linkings of a cancelled job would not be shown
+            if self.report_progress is not None and not self.is_cancelled() and time.perf_counter() >= next_report_time:
+                report_start = time.perf_counter()
+                self.report_partial_linking(builder, get_bytes_consumed(), file_size)
+                # Linking a prefix costs more as the file is read, reporting at most a third of the time
+                # keeps the whole load within a constant factor of reading the file
+                report_time = time.perf_counter() - report_start
+                next_report_time = time.perf_counter() + max(PARTIAL_RESULT_INTERVAL_SECONDS, 2 * report_time)
+        # The logs read before the data manager was closed are not all the logs of the file
+        self.close_token.raise_if_cancelled()
+        return builder.build()
+
+    def report_partial_linking(self, builder: LogStoreBuilder, bytes_read: int, file_size: int) -> None:
+        """
+        Links the logs read so far and reports them with the progress of reading the file
+        """
+        log_store = builder.build()
+        linked_logs = self.link_logs(log_store, FilterEngine(log_store))
+        self.report_progress(LinkingProgress(bytes_read, file_size, linked_logs))
+
+    def close(self) -> None:
+        """
+        Stops reading the logs file, for a data manager that is no longer used.
+        """
+        self.close_token.cancel()
+
+    def is_cancelled(self) -> bool:
+        return self.cancellation_token is not None and self.cancellation_token.is_cancelled
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancellation_token is not None:
+            self.cancellation_token.raise_if_cancelled()
+
+    def get_log_file_signature(self) -> Tuple[int, int]:
+        """
+        Returns the size and modification time of the logs file, which change whenever it is rewritten
+        """
+        stat = os.stat(self.log_file)
+        return stat.st_size, stat.st_mtime_ns
+
     def link_the_logs_to_leaf_objects(self) -> None:
         """
-        Link logs to the corresponding leaf objects
+        Link logs to the corresponding leaf objects.
+        While the swap is deferred the linking is only built, and the entities keep reading the current logs.
         """
         try:
-            self.filter_factory.start_logs()
-            while not self.filter_factory.is_finished_process() or self.filter_factory.has_log():
-                if self.filter_factory.has_log():
-                    log = self.filter_factory.get_log()
-                    print(
-                        f"{TIMESTAMP}:{log.timeStamp},{CLUSTER_ID}:{CHIP}:{log.clusterId.chip},{DIE}:{log.clusterId.die},{QUAD}{log.clusterId.quad},{ROW}:{log.clusterId.row},{COL}:{log.clusterId.col},{AREA}:{log.area},{UNIT}:{log.unit},{IO}:{log.io},{TID}:{log.tid},{PACKET}:{log.packet}")
-                    self.link_the_log_to_leaf_object(log)
+            if self.leaf_router is None:
+                self.leaf_router = LeafRouter(self.die_objects, self.host_interface, self.die2die)
+
+            log_file_signature = self.get_log_file_signature()
+            if self.log_store is None or log_file_signature != self.log_file_signature:
+                # A new engine also starts with an empty result cache
+                self.log_store = self.load_log_store()
+                self.filter_engine = FilterEngine(self.log_store)
+                self.log_file_signature = log_file_signature
+
+            linked_logs = self.link_logs(self.log_store, self.filter_engine)
+            if self.is_swap_deferred:
+                self.pending_linked_logs = linked_logs
+            else:
+                self.swap_linked_logs(linked_logs)
         except ValueError as e:
             raise ValueError(ErrorMessages.ERROR_OCCURRED.value.fomramt(error=str(e)))
-        finally:
-            self.filter_factory.join_thread()
-
-    def link_the_log_to_leaf_object(self, log) -> None:
-        """
-        Link a single log to the corresponding leaf object
-        """
-        area = AREAS.get(log.area)
-        # Separation sign between a unit and its number - ;
-        sep_sign = ";"
-        unit = list(log.unit.split(sep_sign))
-        cluster_id = log.clusterId
-        if (area == BMT and cluster_id.row == -1) or area == PCIE:
-            self._add_log_to_host_interface(area, log)
-        elif area == HOST_INTERFACE:
-            self._add_log_to_host_interface_unit(unit, log)
-        elif area == D2D:
-            self.die2die.active_logs.append(log)
-        else:
-            self._add_log_to_die_area(area, unit, cluster_id, log)
 
-    def _add_log_to_host_interface(self, area, log) -> None:
+    def link_logs(self, log_store: LogStore, filter_engine: FilterEngine) -> LinkedLogs:
         """
-        Add log to the host interface
+        Builds a linking of the logs of the store that pass the time range and all the filters
         """
-        getattr(self.host_interface, area).active_logs.append(log)
+        # Each step is checked, so a superseded job stops without finishing the linking
+        self.raise_if_cancelled()
+        indices = self.get_filtered_indices(filter_engine)
+        self.raise_if_cancelled()
+        leaves_indices = self.group_indices_by_leaf(log_store, indices)
+        leaves_logs = {leaf: log_store.view(leaf_indices) for leaf, leaf_indices in leaves_indices.items()}
+        self.raise_if_cancelled()
+        leaf_rollups = LogRollup.from_groups(log_store, list(leaves_indices.values()))
+        rollups = self.collect_rollups(dict(zip(leaves_indices, leaf_rollups)))
+        self.raise_if_cancelled()
+        self.link_epoch += 1
+        return LinkedLogs(self.link_epoch, leaves_logs, rollups)
 
-    def _add_log_to_host_interface_unit(self, unit, log) -> None:
+    def collect_rollups(self, leaf_rollups: Dict[Component, LogRollup]) -> Dict[Component, LogRollup]:
         """
-        Add log to a specific unit of the host interface
+        Computes the log rollups of all the entities, bottom-up, from the rollups of the linked leaves
         """
-        eq_count = 0
-        for detail in self.host_interface.get_all_inner_details():
-            if detail.type_name != unit[0]: continue
-            if detail.type_name == EQ:
-                eq_count += 1
-                num_of_unit = int(unit[1])
-                if num_of_unit != eq_count: continue
-            detail.active_logs.append(log)
-            break
+        rollups = {}
+        for die in self.die_objects.values():
+            die.collect_rollups(leaf_rollups, rollups)
+            # The HBM logs are not part of their quad's logs
+            for quad in (quad for row in die.quads for quad in row if quad):
+                quad.hbm.collect_rollups(leaf_rollups, rollups)
+        self.host_interface.collect_rollups(leaf_rollups, rollups)
+        self.die2die.collect_rollups(leaf_rollups, rollups)
+        return rollups
+
+    def build_linked_logs(self, action: Callable[..., None], *args,
+                          cancellation_token: Optional[CancellationToken] = None,
+                          report_progress: Optional[Callable[[LinkingProgress], None]] = None) -> Optional[LinkedLogs]:
+        """
+        Runs an action that relinks the logs, such as change_filter, without swapping its linking in.
+        Safe to run off the GUI thread while the widgets read the current logs.
+
+        :param cancellation_token: Stops the linking, with JobCancelled, once cancelled. The state the action
+                                   changed before linking, such as the filters and the log store, is kept.
+        :param report_progress: Receives the progress of reading the logs file, with partial linkings to swap in.
+        :return: The linking to pass to swap_linked_logs, or None if the action did not link.
+        """
+        self.is_swap_deferred = True
+        self.pending_linked_logs = None
+        self.cancellation_token = cancellation_token
+        self.report_progress = report_progress
+        try:
+            action(*args)
+            return self.pending_linked_logs
+        finally:
+            self.is_swap_deferred = False
+            self.pending_linked_logs = None
+            self.cancellation_token = None
+            self.report_progress = None
 
-    def _add_log_to_die_area(self, area, unit, cluster_id, log) -> None:
+    def swap_linked_logs(self, linked_logs: LinkedLogs) -> None:
         """
-        Add log to the die area
+        Makes the given linking the one the entities read their logs from, unless a newer one already is.
+        Entities without logs in it still refer to the previous linking, which is retired and reads as empty.
         """
-        die = self.die_objects[cluster_id.die]
-        quad = die.quads[cluster_id.quad // NUM_QUADS_PER_SIDE][cluster_id.quad % NUM_QUADS_PER_SIDE]
-        if area == HBM:
-            quad.hbm.active_logs.append(log)
-        else:
-            self._add_log_to_cluster(area, unit, quad, cluster_id, log)
+        if self.linked_logs is not None and linked_logs.epoch <= self.linked_logs.epoch:
+            return
+        linked_logs.attach()
+        previous, self.linked_logs = self.linked_logs, linked_logs
+        if previous is not None:
+            previous.retire()
 
-    def _add_log_to_cluster(self, area, unit, quad, cluster_id, log) -> None:
+    def group_indices_by_leaf(self, log_store: LogStore, indices: np.ndarray) -> Dict[Component, np.ndarray]:
         """
-        Add log to a specific cluster
+        Splits the given row indices of the store by the leaf object of their logs, keeping file order within each leaf
         """
-        cluster = quad.clusters[cluster_id.row][cluster_id.col]
-        if area == MCU:
-            self._add_log_to_mcu(unit, cluster, log)
-        else:
-            self._add_log_to_ecore_or_other(unit, cluster, log)
+        rows = log_store.rows[indices]
+        # Only one log of each distinct (area, unit, location) is routed, the rest follow its leaf
+        route_keys, first_rows, inverse = np.unique(self.get_route_keys(rows), return_index=True,
+                                                    return_inverse=True)
+        areas = log_store.dictionaries[AREA_COLUMN]
+        units = log_store.dictionaries[UNIT_COLUMN]
+        first = rows[first_rows]
+        leaf_slots = {}
+        slots = np.empty(len(route_keys), dtype=np.int32)
+        for key_index, (area, unit, die, quad, row, col) in enumerate(zip(
+                first[AREA_COLUMN].tolist(), first[UNIT_COLUMN].tolist(), first[DIE_COLUMN].tolist(),
+                first[QUAD_COLUMN].tolist(), first[ROW_COLUMN].tolist(), first[COL_COLUMN].tolist())):
+            leaf = self.leaf_router.route(areas[area], units[unit], die, quad, row, col)
+            slots[key_index] = -1 if leaf is None else leaf_slots.setdefault(leaf, len(leaf_slots))
+
+        # The stable sort by slot keeps the logs of each leaf in file order, logs without a leaf come first
+        row_slots = slots[inverse.ravel()]
+        grouped_indices = indices[np.argsort(row_slots, kind='stable')]
+        ends = np.cumsum(np.bincount(row_slots + 1, minlength=len(leaf_slots) + 1))
+        return {leaf: grouped_indices[ends[slot]:ends[slot + 1]] for leaf, slot in leaf_slots.items()}
 
-    def _add_log_to_mcu(self, unit, cluster, log) -> None:
+    @staticmethod
+    def get_route_keys(rows: np.ndarray) -> np.ndarray:
         """
-        Add log to the MCU
+        Packs the area code, unit code and location of each log into one integer key
         """
-        eq_count = 0
-        for detail in cluster.mcu.get_details():
-            if detail.type_name != unit[0]: continue
-            if detail.type_name == EQ:
-                eq_count += 1
-                num_of_unit = int(unit[1])
-                if num_of_unit != eq_count: continue
-            detail.active_logs.append(log)
-            break
+        keys = rows[AREA_COLUMN].astype(np.uint64) << np.uint64(56)
+        keys |= rows[UNIT_COLUMN].astype(np.uint64) << np.uint64(40)
+        for shift, column in ((24, DIE_COLUMN), (16, QUAD_COLUMN), (8, ROW_COLUMN), (0, COL_COLUMN)):
+            keys |= rows[column].astype(np.uint8).astype(np.uint64) << np.uint64(shift)
+        return keys
 
-    def _add_log_to_ecore_or_other(self, unit, cluster, log) -> None:
+    def get_filtered_indices(self, filter_engine: FilterEngine) -> np.ndarray:
         """
-        Add log to ECORE or other types
+        Returns the row indices of the logs in the engine's log store that pass the time range and all the filters.
         """
-        ecore_count = 0
-        for detail in cluster.get_details():
-            if detail.type_name != unit[0]: continue
-            if detail.type_name == ECORE:
-                ecore_count += 1
-                num_of_unit = int(unit[1])
-                if num_of_unit != ecore_count: continue
-            detail.active_logs.append(log)
-            break
+        return filter_engine.get_indices(self.filters, self.start_time, self.end_time)
 
     def enable_widgets(self) -> None:
         """
@@ -268,14 +414,14 @@ class DataManager:
         """
         if filter_type in FILTER_TYPES_NAMES.values():
             try:
-                if filter_type == FILTER_TYPES_NAMES[CLUSTER]:
-                    cluster = filter_factory_module.Cluster(values[0], values[1], values[2], values[3], values[4])
-                    self.filter_factory.update_filter_in_chain((filter_type, cluster))
+                print(filter_type, values)
+                if any(active_type == filter_type for active_type, _ in self.filters):
+                    self.filters = [(active_type, values if active_type == filter_type else active_values)
+                                    for active_type, active_values in self.filters]
                 else:
-                    print(filter_type, values)
-                    self.filter_factory.update_filter_in_chain((filter_type, values))
+                    self.filters.append((filter_type, values))
 
-                self.clean_the_prev_logs_from_leaf_objects()
+                # Linking replaces the previous logs only once it succeeds
                 self.link_the_logs_to_leaf_objects()
             except ValueError as e:
                 raise ValueError(ErrorMessages.ERROR_OCCURRED.value.fomramt(error=str(e)))
@@ -289,12 +435,8 @@ class DataManager:
         """
         if filter_type in FILTER_TYPES_NAMES.values():
             try:
-                if filter_type == FILTER_TYPES_NAMES[CLUSTER]:
-                    cluster = filter_factory_module.Cluster(values[0], values[1], values[2], values[3], values[4])
-                    self.filter_factory.add_filter_to_chain((filter_type, cluster))
-                else:
-                    self.filter_factory.add_filter_to_chain((filter_type, values))
-                self.clean_the_prev_logs_from_leaf_objects()
+                self.filters.append((filter_type, values))
+                # Linking replaces the previous logs only once it succeeds
                 self.link_the_logs_to_leaf_objects()
             except ValueError as e:
                 raise ValueError(ErrorMessages.ERROR_OCCURRED.value.fomramt(error=str(e)))
@@ -304,28 +446,15 @@ class DataManager:
 
     def clean_the_prev_logs_from_leaf_objects(self) -> None:
         """
-        Cleans the previous logs from all leaf objects before connecting new logs.
+        Cleans the previous logs from all leaf objects by retiring the last linking.
         """
-        # Clean logs from each leaf in the inner layers of die objects
-        for die in self.die_objects.values():
-            for quad in (quad for row in die.quads for quad in row if quad):
-                quad.hbm.active_logs = []
-                for cluster in (cluster for row in quad.clusters for cluster in row):
-                    for detail in cluster.get_all_inner_details():
-                        detail.active_logs = []
-
-        # Clean logs from host interface
-        for detail in self.host_interface.get_all_inner_details():
-            detail.active_logs = []
-
-        # Clean die2die logs
-        self.die2die.active_logs = []
+        if self.linked_logs is not None:
+            self.linked_logs.retire()
 
     def refresh_logs(self):
         """
-        Cleaning the previous logs and linking the new logs to the leafs
+        Linking the new logs to the leafs in place of the previous logs
         """
-        self.clean_the_prev_logs_from_leaf_objects()
         self.link_the_logs_to_leaf_objects()
 
     def change_time(self, start_time: datetime.datetime, end_time: datetime.datetime) -> None:
@@ -333,8 +462,8 @@ class DataManager:
         Changes the start and end time for log filtering.
         """
         try:
-            self.filter_factory.set_start_time(start_time)
-            self.filter_factory.set_end_time(end_time)
+            self.start_time = start_time
+            self.end_time = end_time
             self.refresh_logs()
         except ValueError as e:
             raise ValueError(ErrorMessages.ERROR_OCCURRED.value.fomramt(error=str(e)))
@@ -344,7 +473,7 @@ class DataManager:
         Clears all filters and resets the logs.
         """
         try:
-            self.filter_factory.clear_filters()
+            self.filters = []
             self.refresh_logs()
         except ValueError as e:
             raise ValueError(ErrorMessages.ERROR_OCCURRED.value.fomramt(error=str(e)))
@@ -354,7 +483,7 @@ class DataManager:
         Removes a specific filter and resets the logs.
         """
         try:
-            self.filter_factory.remove_filter(filter_type)
+            self.filters = [(active_type, values) for active_type, values in self.filters if active_type != filter_type]
             self.refresh_logs()
         except ValueError as e:
             raise ValueError(ErrorMessages.ERROR_OCCURRED.value.fomramt(error=str(e)))
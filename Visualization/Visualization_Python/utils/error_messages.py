@@ -16,6 +16,8 @@ class ErrorMessages(Enum):
     INITIALIZING = "Error initializing {file_name}: {error}"
     LOADING = "Error loading {object}: {error}"
     PROCESSING_ERROR = "Error processing action: {error}"
+    UNKNOWN_LOG_ATTRIBUTE = "Unknown log attribute: {attribute}"
+    JOB_CANCELLED = "The job was cancelled by a newer request"
 
 class WarningMessages(Enum):
     WARNING = "Warning: "
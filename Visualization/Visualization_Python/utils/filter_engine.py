@@ -0,0 +1,206 @@
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from utils.filter_types import FILTER_TYPES_NAMES, CLUSTER, THREADID, IO, QUAD, UNIT, AREA
+from utils.log_store import LogStore, INDEX_DTYPE, TIMESTAMP_COLUMN, CHIP_COLUMN, DIE_COLUMN, QUAD_COLUMN, \
+    ROW_COLUMN, COL_COLUMN, AREA_COLUMN, UNIT_COLUMN, IO_COLUMN, TID_COLUMN
+from utils.result_cache import ResultCache
+
+# String filters compare dictionary codes of these log store columns
+ENCODED_COLUMN_OF_FILTER = {
+    FILTER_TYPES_NAMES[IO]: IO_COLUMN,
+    FILTER_TYPES_NAMES[UNIT]: UNIT_COLUMN,
+    FILTER_TYPES_NAMES[AREA]: AREA_COLUMN,
+}
+
+# A compiled filter: (filter type, normalized values), hashable so its mask can be reused
+FilterKey = Tuple[str, Hashable]
+
+
+class FilterEngine:
+    """
+    Evaluates the filter set of the GUI over a LogStore with vectorized column masks.
+
+    The semantics follow the C++ filter chain of FilterFactory: every filter must pass, a time
+    range is inclusive on both ends, and the Time/TimeRange filter types do not filter.
+    """
+
+    def __init__(self, log_store: LogStore) -> None:
+        self.log_store = log_store
+        self.masks: Dict[FilterKey, np.ndarray] = {}
+        # The last result, refined in place when the next filter set can only narrow it
+        self.last_keys: Optional[List[FilterKey]] = None
+        self.last_start_time: Optional[int] = None
+        self.last_end_time: Optional[int] = None
+        self.last_indices: Optional[np.ndarray] = None
+        self.results = ResultCache()
+        timestamps = log_store.rows[TIMESTAMP_COLUMN]
+        # The logs file is written in time order, which lets a time range become a slice
+        self.is_sorted_by_time = bool(np.all(timestamps[1:] >= timestamps[:-1]))
+
+    @staticmethod
+    def compile(filters: List[Tuple[str, Any]]) -> List[FilterKey]:
+        """
+        Normalizes (filter type, values) pairs into mask keys, dropping duplicates and filter types that do not filter.
+        """
+        keys = []
+        for filter_type, values in filters:
+            if filter_type == FILTER_TYPES_NAMES[THREADID]:
+                key = (filter_type, tuple(sorted({int(tid) for tid in np.atleast_1d(values).tolist()})))
+            elif filter_type == FILTER_TYPES_NAMES[CLUSTER]:
+                if hasattr(values, 'chip'):  # A Cluster of either backend
+                    values = (values.chip, values.die, values.quad, values.row, values.col)
+                key = (filter_type, tuple(int(value) for value in values))
+            elif filter_type == FILTER_TYPES_NAMES[QUAD]:
+                key = (filter_type, tuple(int(value) for value in values))
+            elif filter_type in ENCODED_COLUMN_OF_FILTER:
+                key = (filter_type, values)
+            else:
+                continue
+            if key not in keys:
+                keys.append(key)
+        return keys
+
+    def get_indices(self, filters: List[Tuple[str, Any]], start_time: Optional[int] = None,
+                    end_time: Optional[int] = None) -> np.ndarray:
+        """
+        Returns the row indices of the logs in the time range that pass all the filters, in file order.
+        """
+        keys = self.compile(filters)
+        # Masks of filters that are no longer active are dropped
+        self.masks = {key: self.masks[key] for key in keys if key in self.masks}
+
+        result_key = self.results.make_key(keys, start_time, end_time)
+        indices = self.results.get(result_key)
+        if indices is None:
+            if self.is_narrowing(keys, start_time, end_time):
+                indices = self.refine(keys, start_time, end_time)
+            else:
+                indices = self.scan(keys, start_time, end_time)
+            # Results are shared by the cache and the components, so they are never written to
+            indices = indices.astype(INDEX_DTYPE, copy=False)
+            indices.flags.writeable = False
+            self.results.put(result_key, indices)
+
+        self.last_keys, self.last_start_time, self.last_end_time = keys, start_time, end_time
+        self.last_indices = indices
+        return indices
+
+    def is_narrowing(self, keys: List[FilterKey], start_time: Optional[int], end_time: Optional[int]) -> bool:
+        """
+        Returns True if every log passing the new filters and time range is already in the last result.
+        """
+        if self.last_keys is None:
+            return False
+        if self.last_start_time is not None and (start_time is None or start_time < self.last_start_time):
+            return False
+        if self.last_end_time is not None and (end_time is None or end_time > self.last_end_time):
+            return False
+
+        thread_ids_type = FILTER_TYPES_NAMES[THREADID]
+        new_thread_ids = next((set(values) for filter_type, values in keys if filter_type == thread_ids_type), None)
+        for filter_type, values in self.last_keys:
+            if (filter_type, values) in keys:
+                continue
+            # Removing thread ids from the ThreadId filter also narrows the result
+            if filter_type == thread_ids_type and new_thread_ids is not None and new_thread_ids <= set(values):
+                continue
+            return False
+        return True
+
+    def refine(self, keys: List[FilterKey], start_time: Optional[int], end_time: Optional[int]) -> np.ndarray:
+        """
+        Applies the added filters and the narrower time range to the rows of the last result only.
+        """
+        indices = self.last_indices
+        rows = self.log_store.rows[indices]
+        mask = None
+        if start_time is not None and start_time != self.last_start_time:
+            mask = rows[TIMESTAMP_COLUMN] >= start_time
+        if end_time is not None and end_time != self.last_end_time:
+            end_mask = rows[TIMESTAMP_COLUMN] <= end_time
+            mask = end_mask if mask is None else np.logical_and(mask, end_mask, out=mask)
+        for key in keys:
+            if key in self.last_keys:
+                continue
+            filter_mask = self.masks[key][indices] if key in self.masks else self.evaluate(key, rows)
+            mask = filter_mask if mask is None else np.logical_and(mask, filter_mask, out=mask)
+
+        return indices if mask is None else indices[mask]
+
+    def scan(self, keys: List[FilterKey], start_time: Optional[int], end_time: Optional[int]) -> np.ndarray:
+        """
+        Evaluates the filters over all the rows of the time range.
+        """
+        start, end, time_mask = self.get_time_range(start_time, end_time)
+        mask = time_mask
+        for key in keys:
+            filter_mask = self.get_mask(key)[start:end]
+            mask = filter_mask.copy() if mask is None else np.logical_and(mask, filter_mask, out=mask)
+
+        if mask is None:
+            return np.arange(start, end, dtype=INDEX_DTYPE)
+        return np.flatnonzero(mask) + start
+
+    def get_time_range(self, start_time: Optional[int], end_time: Optional[int]) -> Tuple[int, int, Optional[np.ndarray]]:
+        """
+        Returns the slice of rows to look at and, for unsorted files, the mask of the time range within it.
+        """
+        timestamps = self.log_store.rows[TIMESTAMP_COLUMN]
+        if self.is_sorted_by_time:
+            # bisect reads the strided column in place, where np.searchsorted would first copy it
+            start = 0 if start_time is None else bisect_left(timestamps, start_time)
+            end = len(timestamps) if end_time is None else bisect_right(timestamps, end_time)
+            return start, max(start, end), None
+
+        if start_time is None and end_time is None:
+            return 0, len(timestamps), None
+        mask = np.ones(len(timestamps), dtype=bool)
+        if start_time is not None:
+            mask &= timestamps >= start_time
+        if end_time is not None:
+            mask &= timestamps <= end_time
+        return 0, len(timestamps), mask
+
+    def get_mask(self, key: FilterKey) -> np.ndarray:
+        """
+        Returns the mask of a compiled filter over the whole store, computing it on first use.
+        """
+        mask = self.masks.get(key)
+        if mask is None:
+            mask = self.masks[key] = self.evaluate(key, self.log_store.rows)
+        return mask
+
+    def evaluate(self, key: FilterKey, rows: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a compiled filter over the given rows of the store in one vectorized pass.
+        """
+        filter_type, values = key
+        if filter_type == FILTER_TYPES_NAMES[THREADID]:
+            return np.isin(rows[TID_COLUMN], values)
+        if filter_type == FILTER_TYPES_NAMES[CLUSTER]:
+            return self.match_location(rows, zip((CHIP_COLUMN, DIE_COLUMN, QUAD_COLUMN, ROW_COLUMN, COL_COLUMN), values))
+        if filter_type == FILTER_TYPES_NAMES[QUAD]:
+            return self.match_location(rows, zip((CHIP_COLUMN, DIE_COLUMN, QUAD_COLUMN), values))
+
+        column = ENCODED_COLUMN_OF_FILTER[filter_type]
+        code = self.log_store.get_code(column, values)
+        if code is None:
+            return np.zeros(len(rows), dtype=bool)
+        return rows[column] == code
+
+    @staticmethod
+    def match_location(rows: np.ndarray, columns_values) -> np.ndarray:
+        """
+        Returns the rows whose location columns all equal the given values.
+        """
+        mask = np.ones(len(rows), dtype=bool)
+        for column, value in columns_values:
+            info = np.iinfo(rows.dtype[column])
+            if not info.min <= value <= info.max:
+                # No stored log can hold an id outside its column type
+                return np.zeros(len(rows), dtype=bool)
+            mask &= rows[column] == value
+        return mask
@@ -1,5 +1,5 @@
-import filter_factory_module
-filter_types = filter_factory_module.FilterType
+from utils.backend import FilterType
+filter_types = FilterType
 
 TIME = "Time"
 THREADID = "ThreadId"
@@ -0,0 +1,94 @@
+from typing import Dict, List, Optional, Tuple
+
+from entities.component import Component
+from entities.die import Die
+from entities.host_interface import HostInterface
+
+from utils.constants import NUM_QUADS_PER_SIDE
+from utils.type_names import HOST_INTERFACE, BMT, PCIE, AREAS, D2D, ECORE, EQ, HBM, MCU
+
+# (unit type, ordinal) as written in a log unit, e.g. "eq;3" -> ("eq", 3), "hbm" -> ("hbm", None)
+UnitKey = Tuple[str, Optional[int]]
+# Separation sign between a unit and its number
+UNIT_SEP_SIGN = ";"
+
+
+class LeafRouter:
+    """
+    Maps the location, area and unit of a log to its leaf component.
+
+    The tables are built once from the entity tree, so routing a log is a few dictionary lookups
+    instead of a scan over the details of its cluster.
+    """
+
+    def __init__(self, die_objects: Dict[int, Die], host_interface: HostInterface, die2die: Component) -> None:
+        self.die2die = die2die
+        self.host_interface_areas = {BMT: host_interface.bmt, PCIE: host_interface.pcie}
+        self.host_interface_units = self.index_units(host_interface.get_all_inner_details(), EQ)
+        self.hbms: Dict[Tuple[int, int], Component] = {}
+        self.mcu_units: Dict[Tuple[int, int, int, int], Dict[UnitKey, Component]] = {}
+        self.cluster_units: Dict[Tuple[int, int, int, int], Dict[UnitKey, Component]] = {}
+
+        for die_index, die in die_objects.items():
+            for quad_row_index, quads_row in enumerate(die.quads):
+                for quad_col_index, quad in enumerate(quads_row):
+                    if quad is None:
+                        continue
+                    quad_index = quad_row_index * NUM_QUADS_PER_SIDE + quad_col_index
+                    self.hbms[(die_index, quad_index)] = quad.hbm
+                    for row, clusters_row in enumerate(quad.clusters):
+                        for col, cluster in enumerate(clusters_row):
+                            if cluster is None:
+                                continue
+                            location = (die_index, quad_index, row, col)
+                            self.mcu_units[location] = self.index_units(cluster.mcu.get_details(), EQ)
+                            self.cluster_units[location] = self.index_units(cluster.get_details(), ECORE)
+
+    @staticmethod
+    def index_units(details: List[Component], counted_type: str) -> Dict[UnitKey, Component]:
+        """
+        Keys the details by unit. Details of the counted type are numbered from 1 in their order,
+        any other type is keyed by its first detail.
+        """
+        units = {}
+        count = 0
+        for detail in details:
+            if detail.type_name == counted_type:
+                count += 1
+                key = (detail.type_name, count)
+            else:
+                key = (detail.type_name, None)
+            units.setdefault(key, detail)
+        return units
+
+    @staticmethod
+    def to_unit_key(unit: str) -> UnitKey:
+        unit_type, _, ordinal = unit.partition(UNIT_SEP_SIGN)
+        return unit_type, int(ordinal) if ordinal.isdigit() else None
+
+    @staticmethod
+    def find_unit(units: Dict[UnitKey, Component], unit_key: UnitKey) -> Optional[Component]:
+        leaf = units.get(unit_key)
+        if leaf is None:
+            # Only the counted type is numbered, for any other type the ordinal is ignored
+            leaf = units.get((unit_key[0], None))
+        return leaf
+
+    def route(self, area_name: str, unit: str, die: int, quad: int, row: int, col: int) -> Optional[Component]:
+        """
+        Returns the leaf component of a log, or None if the entity tree has no such leaf.
+        """
+        area = AREAS.get(area_name)
+        if (area == BMT and row == -1) or area == PCIE:
+            return self.host_interface_areas[area]
+        elif area == HOST_INTERFACE:
+            return self.find_unit(self.host_interface_units, self.to_unit_key(unit))
+        elif area == D2D:
+            return self.die2die
+        elif area == HBM:
+            return self.hbms.get((die, quad))
+
+        units = (self.mcu_units if area == MCU else self.cluster_units).get((die, quad, row, col))
+        if units is None:
+            return None
+        return self.find_unit(units, self.to_unit_key(unit))
@@ -0,0 +1,178 @@
+"""
+Reads a logs file straight into LogStore records.
+
+The file is mapped into memory and split into chunks of whole lines. The lines of a chunk are found with one
+scan for new lines, and their fields are parsed for all of them at once by numpy_backend.parse_chunk. The packets
+are never copied: the records keep their offsets in the file, and the store reads them from the mapping.
+
+Large files are parsed by a pool of worker processes, one chunk per task. Each worker writes the records of its
+chunk into shared memory given by the reader, and the reader takes the chunks in file order.
+"""
+import mmap
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from utils.log_store import LogStore, LogStoreBuilder, LOG_DTYPE, PACKET_OFFSET_COLUMN
+from utils.numpy_backend import LogColumns, LogsFactory, MIN_LOG_LINE_BYTES, get_chunk_end, get_file_size, \
+    parse_chunk
+
+INGEST_CHUNK_BYTES = 4 * 1024 * 1024
+# Smaller files are parsed in this process, starting the workers would take longer than parsing them
+MIN_PARALLEL_FILE_BYTES = 64 * 1024 * 1024
+# Chunks parsed ahead of the one taken, per worker
+CHUNKS_AHEAD_PER_WORKER = 2
+# Workers are started fresh on every platform: forking the threads of the GUI is not safe
+WORKER_START_METHOD = "spawn"
+
+
+def get_workers_count(file_size: int) -> int:
+    if file_size < MIN_PARALLEL_FILE_BYTES:
+        return 1
+    return os.cpu_count() or 1
+
+
+def get_rows_capacity(chunk_size: int) -> int:
+    """
+    Returns the most logs a chunk of that many bytes can have, each on a line of its own.
+    """
+    return (chunk_size + 1) // (MIN_LOG_LINE_BYTES + 1)
+
+
+def read_range(path: str, start: int, stop: int, start_time: int, end_time: int) \
+        -> Tuple[np.ndarray, Dict[str, List[str]], bool]:
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+        data = np.frombuffer(mapping, dtype=np.uint8, count=stop - start, offset=start)
+        columns, is_last = parse_chunk(data, start_time, end_time)
+        rows, dictionaries = columns.rows, columns.dictionaries
+        # The mapping is closed only once nothing points into it
+        del data, columns
+    rows[PACKET_OFFSET_COLUMN] += start
+    return rows, dictionaries, is_last
+
+
+def parse_range(path: str, start: int, stop: int, start_time: int, end_time: int, memory_name: str) \
+        -> Tuple[int, Dict[str, List[str]], bool]:
+    """
+    Parses the lines between two offsets of the file in a worker process. Writes their records into the shared
+    memory and returns how many there are, the strings of their codes and whether reading stops at these lines.
+    """
+    rows, dictionaries, is_last = read_range(path, start, stop, start_time, end_time)
+    memory = SharedMemory(name=memory_name)
+    try:
+        np.ndarray((len(rows),), dtype=LOG_DTYPE, buffer=memory.buf)[:] = rows
+    finally:
+        memory.close()
+    return len(rows), dictionaries, is_last
+
+
+def release(memory: SharedMemory) -> None:
+    memory.close()
+    memory.unlink()
+
+
+class LogFileReader:
+    """
+    Reads the logs of a file that FilterFactory passes on without filters, in file order.
+
+    A store built from the reader keeps the file mapped for as long as it is used, so a logs file that changes
+    must be replaced by a new file and not rewritten in place.
+    """
+
+    def __init__(self, path: str, workers: Optional[int] = None) -> None:
+        self.path = path
+        self.file_size = get_file_size(path)
+        self.workers = workers if workers is not None else get_workers_count(self.file_size)
+        self.bytes_read = 0
+        self.mapping: Optional[mmap.mmap] = None
+        if self.file_size > 0:
+            with open(path, 'rb') as file:
+                self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def create_builder(self) -> LogStoreBuilder:
+        """
+        Returns a builder whose stores read their packets from the mapped file.
+        """
+        return LogStoreBuilder(self.mapping if self.mapping is not None else b"")
+
+    def get_ranges(self, chunk_bytes: int) -> Iterator[Tuple[int, int]]:
+        """
+        Yields the start and stop offsets of the chunks of whole lines of the file.
+        """
+        start = 0
+        while start < len(self.mapping):
+            stop = get_chunk_end(self.mapping, start, chunk_bytes)
+            yield start, stop
+            start = stop
+
+    def read_chunks(self, chunk_bytes: int = INGEST_CHUNK_BYTES) -> Iterator[LogColumns]:
+        """
+        Yields the logs of each chunk of the file, with the offsets of their packets in the file.
+        """
+        self.bytes_read = 0
+        if self.mapping is None:
+            return
+        logs_factory = LogsFactory(self.path)
+        start_time, end_time = logs_factory.get_first_log_time(), logs_factory.get_last_log_time()
+        if self.workers > 1:
+            yield from self.read_chunks_in_workers(chunk_bytes, start_time, end_time)
+            return
+        data = np.frombuffer(self.mapping, dtype=np.uint8)
+        for start, stop in self.get_ranges(chunk_bytes):
+            columns, is_last = parse_chunk(data[start:stop], start_time, end_time)
+            columns.rows[PACKET_OFFSET_COLUMN] += start
+            self.bytes_read = stop
+            if len(columns):
+                yield LogColumns(columns.rows, data, columns.dictionaries)
+            if is_last:
+                break
+
+    def read_chunks_in_workers(self, chunk_bytes: int, start_time: int, end_time: int) -> Iterator[LogColumns]:
+        data = np.frombuffer(self.mapping, dtype=np.uint8)
+        ranges = self.get_ranges(chunk_bytes)
+        pending: Deque[Tuple[Future, SharedMemory, int]] = deque()
+        executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context(WORKER_START_METHOD))
+
+        def submit_next() -> None:
+            chunk_range = next(ranges, None)
+            if chunk_range is not None:
+                start, stop = chunk_range
+                memory = SharedMemory(create=True, size=max(get_rows_capacity(stop - start) * LOG_DTYPE.itemsize, 1))
+                pending.append((executor.submit(parse_range, self.path, start, stop, start_time, end_time,
+                                                memory.name), memory, stop))
+
+        try:
+            for _ in range(self.workers * CHUNKS_AHEAD_PER_WORKER):
+                submit_next()
+            while pending:
+                future, memory, stop = pending[0]
+                count, dictionaries, is_last = future.result()
+                rows = np.ndarray((count,), dtype=LOG_DTYPE, buffer=memory.buf).copy()
+                pending.popleft()
+                release(memory)
+                self.bytes_read = stop
+                if not is_last:
+                    submit_next()
+                if count:
+                    yield LogColumns(rows, data, dictionaries)
+                if is_last:
+                    break
+        finally:
+            # The shared memory of the chunks not taken is released once no worker writes into it
+            executor.shutdown(wait=True, cancel_futures=True)
+            for _, memory, _ in pending:
+                release(memory)
+
+    def read_log_store(self) -> LogStore:
+        """
+        Returns a store of all the logs of the file.
+        """
+        builder = self.create_builder()
+        for columns in self.read_chunks():
+            builder.add_shared_columns(columns)
+        return builder.build()
@@ -0,0 +1,281 @@
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+
+import numpy as np
+
+from utils.error_messages import ErrorMessages
+
+TIMESTAMP_COLUMN = 'timestamp'
+CHIP_COLUMN = 'chip'
+DIE_COLUMN = 'die'
+QUAD_COLUMN = 'quad'
+ROW_COLUMN = 'row'
+COL_COLUMN = 'col'
+AREA_COLUMN = 'area'
+UNIT_COLUMN = 'unit'
+IO_COLUMN = 'io'
+TID_COLUMN = 'tid'
+PACKET_OFFSET_COLUMN = 'packet_offset'
+PACKET_LENGTH_COLUMN = 'packet_length'
+
+# One row per log. Strings are dictionary-encoded and packets live in a separate arena, so a row is 33 bytes.
+LOG_DTYPE = np.dtype([
+    (TIMESTAMP_COLUMN, np.int64),
+    (CHIP_COLUMN, np.int8),
+    (DIE_COLUMN, np.int8),
+    (QUAD_COLUMN, np.int8),
+    (ROW_COLUMN, np.int8),
+    (COL_COLUMN, np.int8),
+    (AREA_COLUMN, np.uint8),
+    (UNIT_COLUMN, np.uint16),
+    (IO_COLUMN, np.uint8),
+    (TID_COLUMN, np.int32),
+    (PACKET_OFFSET_COLUMN, np.int64),
+    (PACKET_LENGTH_COLUMN, np.int32),
+])
+
+# Row indices kept by the components, 4 bytes per linked log
+INDEX_DTYPE = np.uint32
+
+ENCODED_COLUMNS = (AREA_COLUMN, UNIT_COLUMN, IO_COLUMN)
+
+# Log attribute names (as on filter_factory_module.Log) and the store columns backing them
+LOG_ATTRIBUTES = {
+    'timeStamp': TIMESTAMP_COLUMN,
+    'area': AREA_COLUMN,
+    'unit': UNIT_COLUMN,
+    'io': IO_COLUMN,
+    'tid': TID_COLUMN,
+}
+PACKET_ATTRIBUTE = 'packet'
+
+
+class LogStore:
+    """
+    Columnar, read-only storage of all the logs of one file.
+    """
+
+    def __init__(self, rows: np.ndarray, dictionaries: Dict[str, List[str]], packets: bytes) -> None:
+        self.rows = rows
+        self.dictionaries = dictionaries
+        self.packets = packets
+        self._codes = {column: {value: code for code, value in enumerate(values)}
+                       for column, values in dictionaries.items()}
+
+    @classmethod
+    def from_log_batches(cls, batches: Iterable[List[Any]]) -> 'LogStore':
+        """
+        Builds the store from batches of filter_factory_module.Log objects, in file order.
+        """
+        builder = LogStoreBuilder()
+        for batch in batches:
+            builder.add_batch(batch)
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def get_code(self, column: str, value: str) -> Optional[int]:
+        """
+        Returns the dictionary code of a value in an encoded column, or None if no log has that value.
+        """
+        return self._codes[column].get(value)
+
+    def decode(self, column: str, codes: np.ndarray) -> List[str]:
+        """
+        Returns the string values of the given codes of an encoded column.
+        """
+        values = self.dictionaries[column]
+        return [values[code] for code in codes.tolist()]
+
+    def get_packets(self, indices: np.ndarray) -> List[str]:
+        """
+        Returns the packet text of the logs at the given row indices.
+        """
+        selected = self.rows[indices]
+        return [self.packets[offset:offset + length].decode()
+                for offset, length in zip(selected[PACKET_OFFSET_COLUMN].tolist(), selected[PACKET_LENGTH_COLUMN].tolist())]
+
+    def get_packet(self, index: int) -> str:
+        """
+        Returns the packet text of the log at one row index.
+        """
+        row = self.rows[index]
+        offset = int(row[PACKET_OFFSET_COLUMN])
+        return self.packets[offset:offset + int(row[PACKET_LENGTH_COLUMN])].decode()
+
+    def get_attribute(self, attribute: str, indices: np.ndarray) -> List[Any]:
+        """
+        Returns a Log attribute (tid, packet, area, ...) of the logs at the given row indices.
+        """
+        if attribute == PACKET_ATTRIBUTE:
+            return self.get_packets(indices)
+        column = LOG_ATTRIBUTES.get(attribute)
+        if column is None:
+            raise AttributeError(ErrorMessages.UNKNOWN_LOG_ATTRIBUTE.value.format(attribute=attribute))
+        values = self.rows[column][indices]
+        if column in ENCODED_COLUMNS:
+            return self.decode(column, values)
+        return values.tolist()
+
+    def view(self, indices: np.ndarray) -> 'LogView':
+        """
+        Returns a view over the logs at the given row indices.
+        """
+        return LogView(self, np.asarray(indices, dtype=INDEX_DTYPE))
+
+
+class LogStoreBuilder:
+    """
+    Builds a LogStore from batches of logs, in file order. A store of the logs added so far can be built
+    at any point, and the builder goes on from there.
+    """
+
+    def __init__(self, packets: Optional[Any] = None) -> None:
+        self.dictionaries = {column: [] for column in ENCODED_COLUMNS}
+        self.codes = {column: {} for column in ENCODED_COLUMNS}
+        self.chunks = []
+        # The packets are copied into the builder, unless it is given the buffer the packet offsets point into
+        self.is_packets_shared = packets is not None
+        self.packets = bytearray() if packets is None else packets
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def encode(self, column: str, value: str) -> int:
+        code = self.codes[column].get(value)
+        if code is None:
+            code = self.codes[column][value] = len(self.dictionaries[column])
+            self.dictionaries[column].append(value)
+        return code
+
+    def add_batch(self, batch: List[Any]) -> None:
+        """
+        Adds a batch of filter_factory_module.Log objects.
+        """
+        encode = self.encode
+        packets = self.packets
+        records = []
+        for log in batch:
+            cluster_id = log.clusterId
+            packet = log.packet.encode()
+            records.append((log.timeStamp, cluster_id.chip, cluster_id.die, cluster_id.quad, cluster_id.row,
+                            cluster_id.col, encode(AREA_COLUMN, log.area), encode(UNIT_COLUMN, log.unit),
+                            encode(IO_COLUMN, log.io), log.tid, len(packets), len(packet)))
+            packets += packet
+        self.chunks.append(np.array(records, dtype=LOG_DTYPE))
+        self.count += len(records)
+
+    def add_columns(self, columns: Any) -> None:
+        """
+        Adds a batch of filter_factory_module.LogColumns. Its records are kept as they are, only their codes and
+        packet offsets are moved to the ones of the store, so no Python object is created per log.
+        """
+        rows = self.encode_rows(columns)
+        rows[PACKET_OFFSET_COLUMN] += len(self.packets)
+        self.packets += memoryview(columns.packets)
+        self.chunks.append(rows)
+        self.count += len(rows)
+
+    def add_shared_columns(self, columns: Any) -> None:
+        """
+        Adds a batch of LogColumns whose packet offsets point into the packets the builder was created with.
+        """
+        rows = self.encode_rows(columns)
+        self.chunks.append(rows)
+        self.count += len(rows)
+
+    def encode_rows(self, columns: Any) -> np.ndarray:
+        """
+        Returns the records of a batch of LogColumns, their codes moved to the ones of the store.
+        """
+        rows = columns.rows
+        if rows.dtype != LOG_DTYPE:
+            rows = rows.view(LOG_DTYPE)
+        for column in ENCODED_COLUMNS:
+            values = columns.dictionaries[column]
+            if values:
+                codes = np.array([self.encode(column, value) for value in values], dtype=LOG_DTYPE[column])
+                rows[column] = codes[rows[column]]
+        return rows
+
+    def build(self) -> LogStore:
+        """
+        Returns a store of all the logs added so far.
+        """
+        # Joined as bytes, NumPy copies records of an unaligned dtype field by field
+        rows = np.concatenate([chunk.view(np.uint8) for chunk in self.chunks]).view(LOG_DTYPE) if self.chunks \
+            else np.empty(0, dtype=LOG_DTYPE)
+        # The next build only concatenates the chunks added after this one
+        self.chunks = [rows]
+        return LogStore(rows, {column: list(values) for column, values in self.dictionaries.items()},
+                        self.packets if self.is_packets_shared else bytes(self.packets))
+
+
+class LogView:
+    """
+    The logs of one component, kept as row indices into a LogStore.
+    """
+
+    def __init__(self, store: LogStore, indices: np.ndarray) -> None:
+        self.store = store
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __bool__(self) -> bool:
+        return len(self.indices) > 0
+
+    def get_attribute(self, attribute: str) -> List[Any]:
+        return self.store.get_attribute(attribute, self.indices)
+
+
+class LogViewChain:
+    """
+    Several log views read as one list, in order, without copying their indices.
+
+    A single log is found by a binary search over the view sizes, so creating a chain and reading the logs
+    that are shown does not depend on the number of logs. The TIDs and packets of all the logs are read
+    only when they are asked for.
+    """
+
+    def __init__(self, views: List[LogView]) -> None:
+        self.views = [view for view in views if view]
+        self.ends = np.cumsum([len(view) for view in self.views], dtype=np.int64)
+        self._tids = None
+
+    def __len__(self) -> int:
+        return int(self.ends[-1]) if len(self.ends) else 0
+
+    def locate(self, position: int) -> Tuple[LogView, int]:
+        """
+        Returns the view of the log at a position of the chain and the row index of the log in its store.
+        """
+        view_index = int(np.searchsorted(self.ends, position, side='right'))
+        start = int(self.ends[view_index - 1]) if view_index else 0
+        view = self.views[view_index]
+        return view, int(view.indices[position - start])
+
+    def get_tid(self, position: int) -> int:
+        view, index = self.locate(position)
+        return int(view.store.rows[TID_COLUMN][index])
+
+    def get_packet(self, position: int) -> str:
+        view, index = self.locate(position)
+        return view.store.get_packet(index)
+
+    def get_tids(self) -> np.ndarray:
+        """
+        Returns the TIDs of all the logs of the chain.
+        """
+        if self._tids is None:
+            self._tids = np.concatenate([view.store.rows[TID_COLUMN][view.indices] for view in self.views]) \
+                if self.views else np.empty(0, dtype=LOG_DTYPE[TID_COLUMN])
+        return self._tids
+
+    def get_packets(self) -> List[str]:
+        """
+        Returns the packets of all the logs of the chain.
+        """
+        return [packet for view in self.views for packet in view.get_attribute(PACKET_ATTRIBUTE)]
@@ -0,0 +1,592 @@
+"""
+NumPy counterparts of the native filter_factory_module and logs_factory modules.
+
+The logs file is mapped into memory and parsed a chunk of lines at a time: every field of every line of the chunk
+is located and checked with array operations, in the field order LogReader::parseCSVLine reads, so a line is taken
+or skipped exactly as the C++ reader does.
+"""
+import mmap
+import os
+import re
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from utils.log_store import LogStore, LOG_DTYPE, ENCODED_COLUMNS, TIMESTAMP_COLUMN, CHIP_COLUMN, DIE_COLUMN, \
+    QUAD_COLUMN, ROW_COLUMN, COL_COLUMN, AREA_COLUMN, UNIT_COLUMN, IO_COLUMN, TID_COLUMN, PACKET_OFFSET_COLUMN, \
+    PACKET_LENGTH_COLUMN
+
+# The fields of a line, in the order LogReader::parseCSVLine reads them
+TIMESTAMP_PREFIX = b"timestamp:"
+CLUSTER_PREFIXES = ((CHIP_COLUMN, b",cluster_id:chip:"), (DIE_COLUMN, b";die:"), (QUAD_COLUMN, b";quad:"),
+                    (ROW_COLUMN, b";row:"), (COL_COLUMN, b";col:"))
+AREA_PREFIX = b",area:"
+UNIT_PREFIX = b",unit:"
+IO_PREFIX = b",in/out:"
+IN = b"in"
+OUT = b"out"
+TID_PREFIX = b",tid:"
+PACKET_PREFIX = b",packet/data:"
+# The shortest line a log is read from: one digit for each number and empty strings
+MIN_LOG_LINE_BYTES = len(TIMESTAMP_PREFIX) + len(b"0.0") + sum(len(prefix) + 1 for _, prefix in CLUSTER_PREFIXES) + \
+    len(AREA_PREFIX) + len(UNIT_PREFIX) + len(IO_PREFIX) + len(IN) + len(TID_PREFIX) + 1 + len(PACKET_PREFIX)
+# Whether each byte is one std::isspace skips (the new line excluded as it ends the line), or a digit
+SPACES = np.zeros(256, dtype=bool)
+SPACES[list(b" \t\v\f\r")] = True
+DIGITS = np.zeros(256, dtype=bool)
+DIGITS[list(b"0123456789")] = True
+MINUS = ord('-')
+DOT = ord('.')
+NEW_LINE = b"\n"
+CARRIAGE_RETURN = ord('\r')
+SECONDS_PATTERN = re.compile(rb"-?\d+\.")
+
+# Decimal digits that always fit an uint64, the values above INT64_MAX are then not valid
+MAX_DIGITS = 19
+INT64_MAX = 2 ** 63 - 1
+INT_MAX = 2 ** 31 - 1
+INT_MIN = -2 ** 31
+# FilterFactory passes on only the logs with a timestamp strictly between these
+MIN_TIMESTAMP = 0
+MAX_TIMESTAMP = 3025236764272
+
+WORD_SIZES = (8, 4, 2, 1)
+PARSE_CHUNK_BYTES = 16 * 1024 * 1024
+# Reading starts at most about this many bytes before the first line in the time range
+SEEK_PRECISION_BYTES = 64 * 1024
+DEFAULT_BATCH_SIZE = 10000
+NO_TIME = -1
+NO_LOGS_AVAILABLE = "FilterFactory::getLog - No logs available."
+FILTER_TYPE_NOT_FOUND = "FilterType not found."
+
+
+class FilterType(Enum):
+    TimeRange = 0
+    Time = 1
+    ThreadId = 2
+    Cluster = 3
+    Io = 4
+    Quad = 5
+    Unit = 6
+    Area = 7
+    Unknown = 8
+
+
+class Cluster:
+    def __init__(self, chip: int = 0, die: int = 0, quad: int = 0, row: int = 0, col: int = 0) -> None:
+        self.chip = chip
+        self.die = die
+        self.quad = quad
+        self.row = row
+        self.col = col
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Cluster) and (self.chip, self.die, self.quad, self.row, self.col) == \
+            (other.chip, other.die, other.quad, other.row, other.col)
+
+    def __hash__(self) -> int:
+        return hash((self.chip, self.die, self.quad, self.row, self.col))
+
+    def __repr__(self) -> str:
+        return f"<Cluster chip:{self.chip}, die:{self.die}, quad:{self.quad}, row:{self.row}, col:{self.col}>"
+
+
+class Log:
+    def __init__(self, timeStamp: int = 0, clusterId: Optional[Cluster] = None, area: str = "", unit: str = "",
+                 io: str = "", tid: int = 0, packet: str = "") -> None:
+        self.timeStamp = timeStamp
+        self.clusterId = clusterId if clusterId is not None else Cluster()
+        self.area = area
+        self.unit = unit
+        self.io = io
+        self.tid = tid
+        self.packet = packet
+
+
+class LogColumns:
+    """
+    A batch of logs as a LOG_DTYPE record array, with the packets back to back in one byte array and the strings
+    of each encoded column indexed by their codes. The strings of a batch may include ones of neighbouring logs.
+    """
+
+    def __init__(self, rows: np.ndarray, packets: np.ndarray, dictionaries: Dict[str, List[str]]) -> None:
+        self.rows = rows
+        self.packets = packets
+        self.dictionaries = dictionaries
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def slice(self, start: int, stop: int) -> 'LogColumns':
+        rows = self.rows[start:stop].copy()
+        if not len(rows):
+            return LogColumns(rows, self.packets[:0], self.dictionaries)
+        first = int(rows[PACKET_OFFSET_COLUMN][0])
+        last = int(rows[PACKET_OFFSET_COLUMN][-1]) + int(rows[PACKET_LENGTH_COLUMN][-1])
+        rows[PACKET_OFFSET_COLUMN] -= first
+        return LogColumns(rows, self.packets[first:last], self.dictionaries)
+
+    def to_logs(self) -> List[Log]:
+        packets = self.packets.tobytes()
+        values = {column: self.dictionaries[column] for column in ENCODED_COLUMNS}
+        return [Log(time_stamp, Cluster(chip, die, quad, row, col), values[AREA_COLUMN][area],
+                    values[UNIT_COLUMN][unit], values[IO_COLUMN][io], tid, packets[offset:offset + length].decode())
+                for time_stamp, chip, die, quad, row, col, area, unit, io, tid, offset, length in self.rows.tolist()]
+
+
+def get_file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def get_words(data: np.ndarray, size: int) -> np.ndarray:
+    """
+    Returns the little-endian unsigned integer of the size bytes starting at each position of the data that has them.
+    """
+    return np.ndarray((max(len(data) - size + 1, 0),), dtype=f"<u{size}", buffer=data, strides=(1,))
+
+
+def matches(data: np.ndarray, positions: np.ndarray, ends: np.ndarray, literal: bytes) -> np.ndarray:
+    """
+    Returns for each position whether the literal is there, before the end of its line.
+
+    The literal is compared a word at a time, the last word overlapping the one before it if needed.
+    """
+    found = positions + len(literal) <= ends
+    size = next(size for size in WORD_SIZES if size <= len(literal))
+    words = get_words(data, size)
+    if not len(words):
+        return found & False
+    last = len(words) - 1
+    for offset in sorted({*range(0, len(literal) - size + 1, size), len(literal) - size}):
+        value = int.from_bytes(literal[offset:offset + size], 'little')
+        found &= words[np.minimum(positions + offset, last)] == value
+    return found
+
+
+def find_all(data: np.ndarray, literal: bytes) -> np.ndarray:
+    """
+    Returns the sorted positions of the literal in the data, with the size of the data appended.
+    """
+    starts = np.flatnonzero(data[:len(data) - len(literal) + 1] == literal[0])
+    for offset, value in enumerate(literal[1:], 1):
+        starts = starts[data[starts + offset] == value]
+    return np.append(starts, len(data))
+
+
+def skip(table: np.ndarray, data: np.ndarray, positions: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Returns for each position the first position at or after it, up to its end, whose byte is not in the table.
+    """
+    positions = positions.copy()
+    last = len(data) - 1
+    running = np.flatnonzero((positions < ends) & table[data[np.minimum(positions, last)]])
+    while len(running):
+        positions[running] += 1
+        moved = positions[running]
+        running = running[(moved < ends[running]) & table[data[np.minimum(moved, last)]]]
+    return positions
+
+
+def next_position(positions: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """
+    Returns the first of the sorted positions (which end with the size of the data) at or after each start.
+    """
+    return positions[np.minimum(np.searchsorted(positions, starts), len(positions) - 1)]
+
+
+def parse_digits(data: np.ndarray, starts: np.ndarray, ends: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """
+    Returns the value of the decimal digits between each start and end. Longer runs than MAX_DIGITS are not valid.
+    """
+    widths = np.where(valid, ends - starts, 0)
+    valid &= widths <= MAX_DIGITS
+    widths[~valid] = 0
+    values = np.zeros(len(starts), dtype=np.uint64)
+    last = len(data) - 1
+    for offset in range(int(widths.max()) if len(widths) else 0):
+        in_run = offset < widths
+        digits = data[np.minimum(starts + offset, last)].astype(np.uint64) - np.uint64(ord('0'))
+        values = np.where(in_run, values * np.uint64(10) + digits, values)
+    valid &= values <= np.uint64(INT64_MAX)
+    return values.astype(np.int64)
+
+
+def encode(data: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, List[str]]:
+    """
+    Returns the code of each string between a start and an end, and the strings in order of first appearance.
+    """
+    if not len(starts):
+        return np.empty(0, dtype=np.int64), []
+    widths = ends - starts
+    width = max(int(widths.max()), 1)
+    offsets = np.arange(width)
+    matrix = data[np.minimum(starts[:, None] + offsets, len(data) - 1)]
+    matrix[offsets >= widths[:, None]] = 0
+    strings = np.ascontiguousarray(matrix).view(f"S{width}").ravel()
+    values, first_indices, codes = np.unique(strings, return_index=True, return_inverse=True)
+    order = np.argsort(first_indices)
+    ranks = np.empty_like(order)
+    ranks[order] = np.arange(len(order))
+    return ranks[codes.ravel()], [value.decode() for value in values[order].tolist()]
+
+
+def gather(data: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the bytes between each start and end back to back, and the offset of each of them.
+    """
+    lengths = ends - starts
+    offsets = np.cumsum(lengths) - lengths
+    shifts = np.repeat(starts - offsets, lengths)
+    return data[np.arange(len(shifts)) + shifts], offsets
+
+
+def parse_lines(data: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, LogColumns]:
+    """
+    Parses the lines between the starts and ends. Returns which lines are logs and the logs of those lines.
+    """
+    rows = np.zeros(len(starts), dtype=LOG_DTYPE)
+
+    valid = matches(data, starts, ends, TIMESTAMP_PREFIX)
+    position = starts + len(TIMESTAMP_PREFIX)
+    seconds_end = skip(DIGITS, data, position, ends)
+    valid &= seconds_end > position
+    rows[TIMESTAMP_COLUMN] = parse_digits(data, position, seconds_end, valid)
+    valid &= matches(data, seconds_end, ends, bytes([DOT]))
+    fraction_end = skip(DIGITS, data, seconds_end + 1, np.where(valid, ends, seconds_end + 1))
+    valid &= fraction_end > seconds_end + 1
+    position = skip(SPACES, data, fraction_end, ends)
+
+    for column, prefix in CLUSTER_PREFIXES:
+        valid &= matches(data, position, ends, prefix)
+        position = position + len(prefix)
+        is_negative = matches(data, position, ends, bytes([MINUS]))
+        digits_start = position + is_negative
+        position = skip(DIGITS, data, digits_start, np.where(valid, ends, digits_start))
+        valid &= position > digits_start
+        values = parse_digits(data, digits_start, position, valid)
+        values = np.where(is_negative, -values, values)
+        valid &= (values >= INT_MIN) & (values <= INT_MAX)
+        rows[column] = values
+    position = skip(SPACES, data, position, ends)
+
+    valid &= matches(data, position, ends, AREA_PREFIX)
+    area_start = position + len(AREA_PREFIX)
+    area_end = next_position(find_all(data, UNIT_PREFIX), area_start)
+    valid &= area_end + len(UNIT_PREFIX) <= ends
+    unit_start = area_end + len(UNIT_PREFIX)
+    unit_end = next_position(find_all(data, IO_PREFIX), unit_start)
+    valid &= unit_end + len(IO_PREFIX) <= ends
+    io_start = unit_end + len(IO_PREFIX)
+    is_in = matches(data, io_start, ends, IN)
+    is_out = ~is_in & matches(data, io_start, ends, OUT)
+    valid &= is_in | is_out
+    io_end = io_start + np.where(is_in, len(IN), len(OUT))
+
+    valid &= matches(data, io_end, ends, TID_PREFIX)
+    position = io_end + len(TID_PREFIX)
+    tid_end = skip(DIGITS, data, position, np.where(valid, ends, position))
+    valid &= tid_end > position
+    tids = parse_digits(data, position, tid_end, valid)
+    valid &= tids <= INT_MAX
+    rows[TID_COLUMN] = tids
+    valid &= matches(data, tid_end, ends, PACKET_PREFIX)
+    packet_start = tid_end + len(PACKET_PREFIX)
+
+    rows = rows[valid]
+    dictionaries = {}
+    for column, column_start, column_end in ((AREA_COLUMN, area_start, area_end), (UNIT_COLUMN, unit_start, unit_end),
+                                             (IO_COLUMN, io_start, io_end)):
+        rows[column], dictionaries[column] = encode(data, column_start[valid], column_end[valid])
+    rows[PACKET_OFFSET_COLUMN] = packet_start[valid]
+    rows[PACKET_LENGTH_COLUMN] = ends[valid] - packet_start[valid]
+    return valid, LogColumns(rows, data, dictionaries)
+
+
+def parse_chunk(data: np.ndarray, start_time: int, end_time: int) -> Tuple[LogColumns, bool]:
+    """
+    Returns the logs of the lines of the data that FilterFactory passes on for the time range before any filter,
+    and whether reading stops at these lines. The packets are left in the data, at their offsets in it.
+    """
+    line_ends = np.flatnonzero(data == NEW_LINE[0])
+    if not len(line_ends) or line_ends[-1] != len(data) - 1:
+        line_ends = np.append(line_ends, len(data))
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+    # LogReader stops at the first empty line
+    empty_lines = np.flatnonzero(line_starts == line_ends)
+    is_last = len(empty_lines) > 0
+    if is_last:
+        line_starts, line_ends = line_starts[:empty_lines[0]], line_ends[:empty_lines[0]]
+    ends_with_return = (line_ends > line_starts) & (data[np.maximum(line_ends - 1, 0)] == CARRIAGE_RETURN)
+    _, columns = parse_lines(data, line_starts, line_ends - ends_with_return)
+
+    # The file is in time order, so LogReader stops at the first log past the end time
+    rows = columns.rows
+    past_end = np.flatnonzero(rows[TIMESTAMP_COLUMN] > end_time)
+    if len(past_end):
+        is_last = True
+        rows = rows[:past_end[0]]
+    times = rows[TIMESTAMP_COLUMN]
+    kept = (times >= start_time) & (times > MIN_TIMESTAMP) & (times < MAX_TIMESTAMP)
+    if not kept.all():
+        rows = rows[kept]
+    return LogColumns(rows, data, columns.dictionaries), is_last
+
+
+def get_line_time(line: bytes) -> Optional[int]:
+    """
+    Returns the seconds after the first "timestamp:" of a line, the way LogIndex reads them, or None.
+    """
+    position = line.find(TIMESTAMP_PREFIX)
+    match = SECONDS_PATTERN.match(line, position + len(TIMESTAMP_PREFIX)) if position >= 0 else None
+    return int(match.group()[:-1]) if match is not None else None
+
+
+def read_line_times(path: str, from_end: bool) -> int:
+    """
+    Returns the time of the first (or last) line with a timestamp, or NO_TIME.
+    """
+    if get_file_size(path) == 0:
+        return NO_TIME
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+        size = len(mapping)
+        end = size
+        position = 0
+        while (end > 0) if from_end else (position < size):
+            if from_end:
+                start = mapping.rfind(NEW_LINE, 0, end) + 1
+                line, end = mapping[start:end], start - 1
+            else:
+                stop = mapping.find(NEW_LINE, position)
+                stop = size if stop < 0 else stop
+                line, position = mapping[position:stop], stop + 1
+            time = get_line_time(line)
+            if time is not None:
+                return time
+    return NO_TIME
+
+
+def get_chunk_end(mapping: mmap.mmap, start: int, chunk_bytes: int) -> int:
+    """
+    Returns the end of the whole lines in the chunk_bytes after the start, or of the first line if it is longer.
+    """
+    stop = mapping.find(NEW_LINE, min(start + chunk_bytes, len(mapping)) - 1)
+    return len(mapping) if stop < 0 else stop + 1
+
+
+def seek_time(mapping: mmap.mmap, time: int) -> int:
+    """
+    Returns the offset of a line at or before the first line with a timestamp at or after the time,
+    by bisecting the file, which is written in time order.
+    """
+    low, high = 0, len(mapping)
+    while high - low > SEEK_PRECISION_BYTES:
+        middle = mapping.find(NEW_LINE, (low + high) // 2, high) + 1
+        if middle <= 0:
+            break
+        line_time = None
+        position = middle
+        while line_time is None and position < high:
+            stop = mapping.find(NEW_LINE, position, high)
+            stop = high if stop < 0 else stop
+            line_time, position = get_line_time(mapping[position:stop]), stop + 1
+        if line_time is None or line_time >= time:
+            high = middle
+        else:
+            low = middle
+    return low
+
+
+class LogsFactory:
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def get_first_log_time(self) -> int:
+        return read_line_times(self.path, from_end=False)
+
+    def get_last_log_time(self) -> int:
+        return read_line_times(self.path, from_end=True)
+
+
+FilterValue = Any
+
+
+class FilterFactory:
+    """
+    Reads the logs of a file that pass a chain of filters, like the native FilterFactory.
+
+    The file is parsed when logs are asked for, one chunk of lines at a time, so there is no thread to join and
+    cancelling takes effect at the next batch.
+    """
+
+    def __init__(self, logsFileName: str) -> None:
+        self.path = logsFileName
+        self.filters: List[Tuple[FilterType, FilterValue]] = []
+        logs_factory = LogsFactory(logsFileName)
+        self.start_time = logs_factory.get_first_log_time()
+        self.end_time = logs_factory.get_last_log_time()
+        self.pending: Deque[LogColumns] = deque()
+        self.pending_position = 0  # The first log of the first pending batch not taken yet
+        self.bytes_read = 0
+        self.filtered_count = 0
+        self.is_finished = True
+        self.cancelled = False
+
+    @staticmethod
+    def get_filter_type(filter_type: Union[FilterType, str]) -> FilterType:
+        if isinstance(filter_type, FilterType):
+            return filter_type
+        return FilterType.__members__.get(filter_type, FilterType.Unknown)
+
+    def add_filter_to_chain(self, filter: Tuple[Union[FilterType, str], FilterValue]) -> None:
+        self.filters.append((self.get_filter_type(filter[0]), filter[1]))
+
+    def update_filter_in_chain(self, filter: Tuple[Union[FilterType, str], FilterValue]) -> None:
+        filter_type = self.get_filter_type(filter[0])
+        if any(active_type == filter_type for active_type, _ in self.filters):
+            self.filters = [(active_type, filter[1] if active_type == filter_type else value)
+                            for active_type, value in self.filters]
+        else:
+            self.filters.append((filter_type, filter[1]))
+
+    def get_value_of_filter(self, filter_type: Union[FilterType, str]) -> FilterValue:
+        filter_type = self.get_filter_type(filter_type)
+        for active_type, value in self.filters:
+            if active_type == filter_type:
+                return value
+        raise RuntimeError(FILTER_TYPE_NOT_FOUND)
+
+    def remove_filter(self, filterToRemove: Union[FilterType, str]) -> None:
+        filter_type = self.get_filter_type(filterToRemove)
+        self.filters = [(active_type, value) for active_type, value in self.filters if active_type != filter_type]
+
+    def clear_filters(self) -> None:
+        self.filters = []
+
+    def set_start_time(self, time: float) -> None:
+        self.start_time = int(time)
+
+    def set_end_time(self, time: float) -> None:
+        self.end_time = int(time)
+
+    def start_logs(self) -> None:
+        self.pending.clear()
+        self.pending_position = 0
+        self.bytes_read = 0
+        if get_file_size(self.path) > 0:
+            with open(self.path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                self.bytes_read = seek_time(mapping, self.start_time)
+        self.filtered_count = 0
+        # A cancelled factory does not start again, as with the native FilterFactory
+        self.is_finished = self.cancelled or get_file_size(self.path) == 0
+
+    def read_chunk(self) -> None:
+        """
+        Parses the next chunk of whole lines and queues its logs that pass the time range and the filters.
+        """
+        with open(self.path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            start = self.bytes_read
+            stop = get_chunk_end(mapping, start, PARSE_CHUNK_BYTES)
+            columns, is_last = self.parse_chunk(mapping, start, stop)
+        self.bytes_read = stop
+        self.is_finished = is_last or stop >= get_file_size(self.path)
+        if len(columns):
+            self.pending.append(columns)
+            self.filtered_count += len(columns)
+
+    def parse_chunk(self, mapping: mmap.mmap, start: int, stop: int) -> Tuple[LogColumns, bool]:
+        """
+        Returns the logs of the lines between two offsets, and whether reading stops at these lines.
+        """
+        data = np.frombuffer(mapping, dtype=np.uint8, count=stop - start, offset=start)
+        columns, is_last = parse_chunk(data, self.start_time, self.end_time)
+        # The packets are copied out of the mapping, which is closed once the chunk is parsed
+        return self.select(columns, self.get_filtered_indices(columns)), is_last
+
+    def get_filtered_indices(self, columns: LogColumns) -> np.ndarray:
+        from utils.filter_engine import FilterEngine  # Import to avoid circular dependency
+        filters = [(filter_type.name, value) for filter_type, value in self.filters]
+        if not filters:
+            return np.arange(len(columns))
+        store = LogStore(columns.rows, columns.dictionaries, b"")
+        return FilterEngine(store).get_indices(filters).astype(np.int64)
+
+    @staticmethod
+    def select(columns: LogColumns, indices: np.ndarray) -> LogColumns:
+        rows = columns.rows[indices]
+        starts = rows[PACKET_OFFSET_COLUMN]
+        packets, rows[PACKET_OFFSET_COLUMN] = gather(columns.packets, starts, starts + rows[PACKET_LENGTH_COLUMN])
+        return LogColumns(rows, packets, columns.dictionaries)
+
+    def take_columns(self, max_n: int) -> Optional[LogColumns]:
+        """
+        Returns up to max_n queued logs, reading chunks until some are queued, or None once there are no more.
+        """
+        while not self.pending and not self.is_finished and not self.cancelled:
+            self.read_chunk()
+        if self.cancelled or not self.pending:
+            return None
+        columns = self.pending[0]
+        if self.pending_position == 0 and len(columns) <= max_n:
+            return self.pending.popleft()
+        batch = columns.slice(self.pending_position, self.pending_position + max_n)
+        self.pending_position += len(batch)
+        if self.pending_position == len(columns):
+            self.pending.popleft()
+            self.pending_position = 0
+        return batch
+
+    def get_log(self) -> Log:
+        columns = self.take_columns(1)
+        if columns is None:
+            raise RuntimeError(NO_LOGS_AVAILABLE)
+        return columns.to_logs()[0]
+
+    def get_logs(self, max_n: int) -> List[Log]:
+        columns = self.take_columns(max_n)
+        return [] if columns is None else columns.to_logs()
+
+    def wait_for_logs(self, max_n: int) -> List[Log]:
+        return self.get_logs(max_n)
+
+    def stream(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[List[Log]]:
+        for columns in self.stream_columns(batch_size):
+            yield columns.to_logs()
+
+    def stream_columns(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[LogColumns]:
+        columns = self.take_columns(batch_size)
+        while columns is not None:
+            yield columns
+            columns = self.take_columns(batch_size)
+
+    def has_log(self) -> bool:
+        while not self.pending and not self.is_finished and not self.cancelled:
+            self.read_chunk()
+        return bool(self.pending)
+
+    def is_finished_process(self) -> bool:
+        return self.is_finished
+
+    def join_thread(self) -> None:
+        pass
+
+    def cancel(self) -> None:
+        self.cancelled = True
+        self.pending.clear()
+        self.pending_position = 0
+
+    def is_cancelled(self) -> bool:
+        return self.cancelled
+
+    def get_bytes_read(self) -> int:
+        return self.bytes_read
+
+    def get_file_size(self) -> int:
+        return get_file_size(self.path)
+
+    def get_filtered_count(self) -> int:
+        return self.filtered_count
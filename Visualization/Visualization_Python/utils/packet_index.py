@@ -0,0 +1,100 @@
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+
+from utils.log_store import LogViewChain, PACKET_OFFSET_COLUMN, PACKET_LENGTH_COLUMN
+
+# Separates the packets in the buffer. Packets are lines of text, so no packet contains it.
+PACKET_SEPARATOR = b"\0"
+SEPARATOR_BYTE = PACKET_SEPARATOR[0]
+SEARCH_CACHE_SIZE = 16
+# A query is searched in the matches of a query it contains only if they are at most this share of the packets,
+# above it copying their bytes costs more than searching all the packets
+MAX_NARROWED_SHARE = 0.5
+
+
+class PacketIndex:
+    """
+    Case-insensitive substring search over the packets of a chain of logs.
+
+    The packets are lowercased once into one contiguous buffer. A search finds the rarest byte of the query,
+    checks the other bytes of the query only around those positions, and maps the matches to packets by the
+    positions of the separators. Recent results are kept: a query that contains a recent query is searched
+    only in the packets that matched it, so each typed character searches fewer packets.
+    """
+
+    def __init__(self, logs: LogViewChain) -> None:
+        chunks = []
+        for view in logs.views:
+            arena = view.store.packets
+            selected = view.store.rows[view.indices]
+            chunks.append(PACKET_SEPARATOR.join(
+                arena[offset:offset + length] for offset, length in
+                zip(selected[PACKET_OFFSET_COLUMN].tolist(), selected[PACKET_LENGTH_COLUMN].tolist())))
+            chunks.append(PACKET_SEPARATOR)
+        # Lowercasing the decoded text keeps non-ASCII letters case-insensitive too
+        text = b"".join(chunks).decode().lower().encode()
+        self.buffer = np.frombuffer(text, dtype=np.uint8)
+        # The separator after each packet
+        self.ends = np.flatnonzero(self.buffer == SEPARATOR_BYTE)
+        self.starts = np.concatenate(([0], self.ends[:-1] + 1))
+        self.byte_counts = np.bincount(self.buffer, minlength=256)
+        self.results: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.ends)
+
+    def search(self, query: str) -> Optional[np.ndarray]:
+        """
+        Returns the sorted positions of the packets that contain the query, or None for an empty query.
+        """
+        if not query:
+            return None
+        key = query.lower()
+        positions = self.results.get(key)
+        if positions is not None:
+            self.results.move_to_end(key)
+            return positions
+
+        pattern = key.encode()
+        if SEPARATOR_BYTE in pattern:
+            positions = np.empty(0, dtype=np.int64)
+        else:
+            candidates = min((result for cached_key, result in self.results.items() if cached_key in key),
+                             key=len, default=None)
+            if candidates is None or len(candidates) > len(self) * MAX_NARROWED_SHARE:
+                positions = self.find(pattern, self.buffer, self.ends)
+            else:
+                positions = candidates[self.find(pattern, *self.gather(candidates))]
+        self.results[key] = positions
+        if len(self.results) > SEARCH_CACHE_SIZE:
+            self.results.popitem(last=False)
+        return positions
+
+    def gather(self, packets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns a buffer of the given packets only, with the separator after each of them.
+        """
+        sizes = self.ends[packets] + 1 - self.starts[packets]
+        ends = np.cumsum(sizes) - 1
+        shifts = np.repeat(self.starts[packets] - (ends + 1 - sizes), sizes)
+        return self.buffer[np.arange(len(shifts)) + shifts], ends
+
+    def find(self, pattern: bytes, buffer: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Returns the sorted positions of the packets of a buffer that contain the pattern.
+        """
+        pattern_bytes = np.frombuffer(pattern, dtype=np.uint8)
+        anchor = int(np.argmin(self.byte_counts[pattern_bytes]))
+        starts = np.flatnonzero(buffer == pattern_bytes[anchor]) - anchor
+        starts = starts[(starts >= 0) & (starts <= len(buffer) - len(pattern))]
+        for offset, value in enumerate(pattern_bytes.tolist()):
+            if offset != anchor and len(starts):
+                starts = starts[buffer[starts + offset] == value]
+
+        # A match never crosses a separator, so the first separator at or after it ends its packet
+        packets = np.searchsorted(ends, starts)
+        if len(packets) == 0:
+            return packets
+        return packets[np.concatenate(([True], packets[1:] != packets[:-1]))]
@@ -20,9 +20,6 @@ SEARCH_ICON_IMAGE = f"{IMAGES_DIR}/search_icon.png"
 # data files
 CHIP_DATA_JSON = f"{DATA_DIR}/chip_data.json"
 SL_JSON = f"{DATA_DIR}/sl.json"
-LOGS_CSV = f"{DATA_DIR}/logs.csv"
-LOGS_CSV_BASE = 'logs.csv'
-TEMP_LOGS_CSV_BASE = 'temp_logs.csv'
 
 # style files
 INFO_WIDGET_CSS = f"{STYLES_DIR}/info_styles.css"
@@ -45,6 +42,7 @@ PERFORMANCE_LOGGER_CPP = "PerformanceLogger.cpp"
 I_LOG_FILTER_CPP = "ILogFilter.cpp"
 LOG_READER_CPP = "LogReader.cpp"
 LOGS_FACTORY_CPP = "LogsFactory.cpp"
+LOG_INDEX_CPP = "LogIndex.cpp"
 FILTER_FACTORY_CPP = "FilterFactory.cpp"
 
 # pybind settings
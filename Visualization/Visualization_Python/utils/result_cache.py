@@ -0,0 +1,57 @@
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import numpy as np
+
+from utils.constants import RESULT_CACHE_BUDGET_BYTES
+
+
+class ResultCache:
+    """
+    Least recently used cache of filter results, bounded by the bytes of the cached index arrays.
+    """
+
+    def __init__(self, budget_bytes: int = RESULT_CACHE_BUDGET_BYTES) -> None:
+        self.budget_bytes = budget_bytes
+        self.entries: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(filter_keys, start_time: Optional[int], end_time: Optional[int]) -> Tuple[Hashable, ...]:
+        """
+        Returns the canonical key of a filter set and time window. The filters are combined with AND,
+        so their order does not matter.
+        """
+        return tuple(sorted(filter_keys, key=repr)), start_time, end_time
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        indices = self.entries.get(key)
+        if indices is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return indices
+
+    def put(self, key: Hashable, indices: np.ndarray) -> None:
+        """
+        Caches a result, evicting the least recently used results until it fits in the budget.
+        """
+        if key in self.entries:
+            self.size_bytes -= self.entries.pop(key).nbytes
+        if indices.nbytes > self.budget_bytes:
+            return
+        while self.size_bytes + indices.nbytes > self.budget_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size_bytes -= evicted.nbytes
+        self.entries[key] = indices
+        self.size_bytes += indices.nbytes
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)